@@ -6,20 +6,29 @@ Professional interface for processing azimuth grid images
 
 import sys
 import os
+import io
+import copy
 import math
-import tempfile
 import json
+import logging
+import zipfile
+import collections
+import importlib.util
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from xml.sax.saxutils import escape as xml_escape
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QHBoxLayout, 
                              QVBoxLayout, QGridLayout, QPushButton, QLabel, 
                              QComboBox, QTextEdit, QScrollArea, QFrame,
                              QFileDialog, QMessageBox, QSplitter, QToolTip, QLineEdit,
                              QCheckBox, QDateEdit, QSizePolicy, QDialog, QFormLayout, QGroupBox, QDoubleSpinBox,
                              QDialogButtonBox, QTabWidget)
-from PyQt5.QtCore import Qt, QSize, pyqtSignal, QTimer, QPoint, QDate
-from PyQt5.QtGui import QPixmap, QFont, QIcon
+from PyQt5.QtCore import (Qt, QSize, pyqtSignal, QTimer, QPoint, QDate,
+                          QObject, QRunnable, QThreadPool, QPointF, QLineF)
+from PyQt5.QtGui import (QPixmap, QPixmapCache, QFont, QIcon, QImage,
+                         QPainter, QPen, QBrush, QColor)
 from PIL import Image, ImageDraw
-from PIL import ImageFont
 
 from translations import Translations
 from widgets import ClickableLabel, VerticalThumbnailWidget
@@ -27,19 +36,72 @@ from image_processor import AzimuthImageProcessor
 from documentation import DocumentationManager
 from help_dialogs import AboutDialog
 
-try:
+log = logging.getLogger(__name__)
+
+# NumPy - необов'язкове прискорення (пакетні розрахунки, накладання RGBA),
+# тому сам модуль імпортується при першому використанні
+NUMPY_AVAILABLE = importlib.util.find_spec('numpy') is not None
+
+# python-docx імпортується лише при створенні альбому (див. _load_docx),
+# тут тільки перевіряємо наявність пакета
+DOCX_AVAILABLE = importlib.util.find_spec('docx') is not None
+_DOCX_LOADED = False
+
+def _load_docx():
+    """Відкладений імпорт python-docx та підготовка констант/шаблонів альбому"""
+    global _DOCX_LOADED, Document, Inches, Cm, Pt, WD_ALIGN_PARAGRAPH, WD_TAB_ALIGNMENT
+    global WD_STYLE_TYPE, WD_ALIGN_VERTICAL, WD_SECTION_START, OxmlElement, nsdecls, parse_xml
+    global DESCRIPTION_HEADING_PT, DESCRIPTION_TEXT_PT, FONT_PT, LAYOUT_LENGTHS, _BORDER_TEMPLATES, Table
+    global _HAS_VALIGN_ENUM
+    
+    if _DOCX_LOADED:
+        return
+    
     from docx import Document
     from docx.shared import Inches, Cm, Pt
     from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_TAB_ALIGNMENT
-    from docx.enum.style import WD_STYLE_TYPE  # ← ВИПРАВЛЕНО: перенесено сюди
-    from docx.enum.table import WD_ALIGN_VERTICAL
+    from docx.enum.style import WD_STYLE_TYPE
     from docx.enum.section import WD_SECTION_START
-    from docx.oxml.shared import OxmlElement, qn
-    from docx.oxml.ns import qn
+    from docx.oxml.shared import OxmlElement
+    from docx.oxml.ns import nsdecls
     from docx.oxml import parse_xml
-    DOCX_AVAILABLE = True
-except ImportError:
-    DOCX_AVAILABLE = False
+    from docx.table import Table, _Cell
+    
+    # Старі версії python-docx не мають cell.vertical_alignment - перевіряємо один раз
+    try:
+        from docx.enum.table import WD_ALIGN_VERTICAL
+        _HAS_VALIGN_ENUM = hasattr(_Cell, 'vertical_alignment')
+    except ImportError:
+        WD_ALIGN_VERTICAL = None
+        _HAS_VALIGN_ENUM = False
+    
+    # Довжини Pt/Cm, що повторюються для кожної комірки (створюються один раз)
+    FONT_PT = {size: Pt(size) for size in (0, 9, 12, 14, 22, 30)}
+    LAYOUT_LENGTHS = {
+        key: Cm(mm_to_cm(ALBUM_LAYOUT[key]))
+        for key in ('TABLE_HEIGHT', 'TABLE_PAGES_LEFT_MARGIN', 'TABLE_PAGES_RIGHT_MARGIN',
+                    'TABLE_PAGES_TOP_MARGIN', 'TABLE_PAGES_BOTTOM_MARGIN')
+    }
+    # Зображення в комірці - з відступом 1мм для границь
+    LAYOUT_LENGTHS['IMAGE_WIDTH'] = Cm(mm_to_cm(ALBUM_LAYOUT['COL_2_WIDTH'] - 1.0))
+    LAYOUT_LENGTHS['IMAGE_HEIGHT'] = Cm(mm_to_cm(ALBUM_LAYOUT['TABLE_HEIGHT'] - 1.0))
+    # Ширини колонок і висоти рядків таблиці опису
+    LAYOUT_LENGTHS['DESCRIPTION_COLUMNS'] = tuple(Cm(width) for width in DESCRIPTION_COLUMN_WIDTHS_CM)
+    LAYOUT_LENGTHS['DESCRIPTION_HEADER_HEIGHT'] = Cm(2.0)
+    LAYOUT_LENGTHS['DESCRIPTION_ROW_HEIGHT'] = Cm(0.6)
+    
+    # Розміри шрифтів сторінки опису
+    DESCRIPTION_HEADING_PT = FONT_PT[22]
+    DESCRIPTION_TEXT_PT = FONT_PT[14]
+    
+    # Усі 16 комбінацій рамок (top, bottom, left, right) розбираються один раз
+    _BORDER_TEMPLATES = {
+        (top, bottom, left, right): parse_xml(_cell_borders_xml(top, bottom, left, right))
+        for top in (False, True) for bottom in (False, True)
+        for left in (False, True) for right in (False, True)
+    }
+    
+    _DOCX_LOADED = True
 
 ALBUM_LAYOUT = {
     # Розміри сторінки A4 в міліметрах
@@ -76,6 +138,37 @@ ALBUM_LAYOUT = {
     'IMAGE_WIDTH_CM': 14,  # Ширина зображення в см
 }
 
+# Ширини колонок таблиці опису (см)
+DESCRIPTION_COLUMN_WIDTHS_CM = (1.25, 3.0, 3.0, 3.0, 3.0, 3.0)
+
+# Цільовий розмір зображення в альбомі в пікселях (ширина комірки при 300 DPI)
+ALBUM_IMAGE_DPI = 300
+ALBUM_IMAGE_TARGET_PX = int(ALBUM_LAYOUT['COL_2_WIDTH'] / 25.4 * ALBUM_IMAGE_DPI)
+
+# Якість JPEG для альбому: при ширині 14.9 см різниця з 95 непомітна, а файл у 3-4 рази менший.
+# Швидкість кодування залежить від libjpeg-turbo, з яким зібрано Pillow (офіційні wheel-и вже з ним)
+ALBUM_JPEG_QUALITY = 85
+
+# Формат зображень в альбомі: 'JPEG' - менший файл для знімків індикатора,
+# 'PNG' - без втрат (лінія аналізу без артефактів стиснення), але файл більший
+ALBUM_IMAGE_FORMAT = 'JPEG'
+
+# Буфер читання вихідних зображень (замість io.DEFAULT_BUFFER_SIZE = 8 КБ)
+IMAGE_READ_BUFFER_SIZE = 1 << 18
+
+# Точний коефіцієнт мм -> DXA (1/20 пункту): 20 * 72 / 25.4
+DXA_PER_MM = 20 * 72 / 25.4
+
+# Попередньо обчислені DXA для розмірів таблиць альбому
+ALBUM_LAYOUT_DXA = {
+    'COL_1_WIDTH': int(ALBUM_LAYOUT['COL_1_WIDTH'] * DXA_PER_MM),
+    'COL_2_WIDTH': int(ALBUM_LAYOUT['COL_2_WIDTH'] * DXA_PER_MM),
+    'COL_3_WIDTH': int(ALBUM_LAYOUT['COL_3_WIDTH'] * DXA_PER_MM),
+    'TABLE_WIDTH': int((ALBUM_LAYOUT['COL_1_WIDTH'] + ALBUM_LAYOUT['COL_2_WIDTH'] +
+                        ALBUM_LAYOUT['COL_3_WIDTH']) * DXA_PER_MM),
+    'TABLE_HEIGHT': int(ALBUM_LAYOUT['TABLE_HEIGHT'] * DXA_PER_MM),
+}
+
 class DefaultTemplateData:
     """Централізовані базові дані для шаблонів"""
     
@@ -170,6 +263,8 @@ class UIStyles:
         """
 
 def get_reliable_font(font_size):
+    from PIL import ImageFont
+    
     try:
         # Курсивні шляхи
         italic_paths = [
@@ -185,7 +280,7 @@ def get_reliable_font(font_size):
             if os.path.exists(font_path):
                 try:
                     return ImageFont.truetype(font_path, font_size)
-                except:
+                except OSError:
                     continue
         
         # Звичайний Arial як fallback
@@ -198,7 +293,7 @@ def get_reliable_font(font_size):
             if os.path.exists(font_path):
                 try:
                     return ImageFont.truetype(font_path, font_size)
-                except:
+                except OSError:
                     continue
         
         # Default font
@@ -243,24 +338,27 @@ def set_a4_page_format(section):
         section.page_height = Cm(29.7)  # 297мм = 29.7см
         section.orientation = WD_ORIENTATION.PORTRAIT
         
-        print(f"✓ A4 format set: {section.page_width.cm:.1f} x {section.page_height.cm:.1f} cm")
+        log.debug("✓ A4 format set: %.1f x %.1f cm", section.page_width.cm, section.page_height.cm)
         
     except Exception as e:
-        print(f"✗ Error setting A4 format: {e}")
+        log.error("✗ Error setting A4 format: %s", e)
 
 def create_complete_album(processed_images, title_data, file_path):
     """Створення повного альбому з правильними полями та підписом на сторінці опису"""
     try:
+        _load_docx()
         doc = Document()
+        set_document_default_font(doc)
+        create_album_data_styles(doc)
         
-        print("=== Creating Complete Album with Description Page Signature ===")
+        log.info("=== Creating Complete Album with Description Page Signature ===")
         
         # 1. ТИТУЛЬНА СТОРІНКА (поля встановлюються в create_title_page)
-        print("1. Creating title page...")
+        log.info("1. Creating title page...")
         create_title_page(doc, title_data)
         
         # 2. СТОРІНКА ОПИСУ З ПІДПИСОМ (НОВА СЕКЦІЯ з розривом сторінки)
-        print("2. Creating description page with signature...")
+        log.info("2. Creating description page with signature...")
         desc_section = doc.add_section(WD_SECTION_START.NEW_PAGE)
         set_a4_page_format(desc_section)
         
@@ -274,17 +372,58 @@ def create_complete_album(processed_images, title_data, file_path):
         create_description_page_with_signature(doc, title_data)
         
         # 3. СТОРІНКИ З ТАБЛИЦЯМИ
-        print("3. Creating table pages...")
+        log.info("3. Creating table pages...")
         create_new_structure_pages(doc, processed_images)
+        trim_processed_image_cache()
         
-        doc.save(file_path)
-        print(f"✓ Complete album with signature saved: {file_path}")
+        # Серіалізуємо docx у пам'ять і записуємо на диск одним великим записом
+        buffer = save_docx_to_buffer(doc)
+        with open(file_path, 'wb', buffering=1 << 20) as output_file:
+            output_file.write(buffer.getbuffer())
+        log.info("✓ Complete album with signature saved: %s", file_path)
         
         return True
     except Exception as e:
-        print(f"✗ Error creating complete album: {e}")
+        log.error("✗ Error creating complete album: %s", e)
         return False
 
+class _FastZipPkgWriter:
+    """Запис пакета docx: XML зі стисненням рівня 1, медіа (вже стиснені JPEG) без стиснення"""
+    
+    def __init__(self, pkg_file):
+        self._zipf = zipfile.ZipFile(pkg_file, 'w', compression=zipfile.ZIP_DEFLATED, compresslevel=1)
+    
+    def write(self, pack_uri, blob):
+        membername = pack_uri.membername
+        compress_type = zipfile.ZIP_STORED if membername.startswith('word/media/') else zipfile.ZIP_DEFLATED
+        self._zipf.writestr(membername, blob, compress_type=compress_type)
+    
+    def close(self):
+        self._zipf.close()
+
+def save_docx_to_buffer(doc):
+    """Серіалізація документа в BytesIO зі швидким стисненням ZIP"""
+    try:
+        from docx.opc.pkgwriter import PackageWriter
+        
+        package = doc.part.package
+        for part in package.parts:
+            part.before_marshal()
+        
+        buffer = io.BytesIO()
+        writer = _FastZipPkgWriter(buffer)
+        PackageWriter._write_content_types_stream(writer, package.parts)
+        PackageWriter._write_pkg_rels(writer, package.rels)
+        PackageWriter._write_parts(writer, package.parts)
+        writer.close()
+        return buffer
+    except (ImportError, AttributeError) as e:
+        # Інша версія python-docx - стандартне збереження
+        log.warning("Fast docx writer unavailable, using doc.save: %s", e)
+        buffer = io.BytesIO()
+        doc.save(buffer)
+        return buffer
+
 # 4. ДОПОМІЖНА ФУНКЦІЯ ДЛЯ СТВОРЕННЯ СТИЛІВ
 def create_or_get_style(doc, name, style_type, **properties):
     """Створити або отримати існуючий стиль з властивостями"""
@@ -307,6 +446,13 @@ def create_or_get_style(doc, name, style_type, **properties):
         
         return style
 
+def _add_styled_run(para, text, size, bold=False):
+    """Додавання run заданого розміру (Arial - з docDefaults документа)"""
+    run = para.add_run(text)
+    run.font.size = size
+    run.font.bold = bold
+    return run
+
 # 5. СПРОЩЕНА ФУНКЦІЯ СТВОРЕННЯ СТИЛІВ ДЛЯ ТИТУЛЬНОЇ СТОРІНКИ
 def create_title_page_styles(doc):
     """Створення всіх стилів для титульної сторінки"""
@@ -367,42 +513,32 @@ def create_description_page_with_signature(doc, title_data):
         # 4. Підпис
         _add_description_signature(doc, title_data)
         
-        print("✅ Description page with signature created successfully!")
+        log.info("✅ Description page with signature created successfully!")
         
     except Exception as e:
-        print(f"✗ Error creating description page: {e}")
+        log.error("✗ Error creating description page: %s", e)
         import traceback
         traceback.print_exc()
 
 def _add_description_heading(doc):
     """Додавання заголовку сторінки опису"""
-    heading = doc.add_paragraph("Опис альбому фотознімків")
+    heading = doc.add_paragraph()
     heading.alignment = WD_ALIGN_PARAGRAPH.CENTER
     heading.paragraph_format.space_before = Pt(0)
     heading.paragraph_format.space_after = Pt(0)
     
-    if len(heading.runs) > 0:
-        heading.runs[0].font.size = Pt(22)
-        heading.runs[0].font.bold = True
-        heading.runs[0].font.name = 'Arial'
+    _add_styled_run(heading, "Опис альбому фотознімків", DESCRIPTION_HEADING_PT, bold=True)
 
 def _create_description_table(doc):
     """Створення таблиці опису з точними розмірами"""
-    from docx.oxml.shared import OxmlElement
-    from docx.oxml.ns import qn
-    
     # Створення таблиці
-    table = doc.add_table(rows=6, cols=6)
+    # Заголовок + перший рядок даних; решта рядків - копії першого
+    table = doc.add_table(rows=2, cols=6)
     table.style = None
     table.alignment = WD_ALIGN_PARAGRAPH.LEFT
     
     # Відступ таблиці 1см зліва
-    tbl = table._tbl
-    tblPr = tbl.tblPr
-    tblInd = OxmlElement('w:tblInd')
-    tblInd.set(qn('w:w'), str(int(1.0 * 567)))
-    tblInd.set(qn('w:type'), 'dxa')
-    tblPr.append(tblInd)
+    _append_template(table._tbl.tblPr, _TABLE_IND_XML % int(1.0 * 567))
     
     # Заголовки
     headers = [
@@ -410,113 +546,59 @@ def _create_description_table(doc):
         "Кількість аркушів (знімків)", "Гриф секретності", "Примітка"
     ]
     
-    # Ширини колонок
-    column_widths = [1.25, 3.0, 3.0, 3.0, 3.0, 3.0]
+    # Ширини колонок (довжини створені один раз у _load_docx)
+    column_widths = LAYOUT_LENGTHS['DESCRIPTION_COLUMNS']
     
     # Налаштування заголовків (висота 2см)
     header_row = table.rows[0]
-    header_row.height = Cm(2.0)
+    header_row.height = LAYOUT_LENGTHS['DESCRIPTION_HEADER_HEIGHT']
     
     # XML для точної висоти
-    trPr = header_row._tr.trPr
-    if trPr is None:
-        trPr = OxmlElement('w:trPr')
-        header_row._tr.append(trPr)
-    
-    trHeight = OxmlElement('w:trHeight')
-    trHeight.set(qn('w:val'), str(int(2.0 * 567)))
-    trHeight.set(qn('w:hRule'), 'exact')
-    trPr.append(trHeight)
+    _append_template(_get_or_add_trPr(header_row), _ROW_HEIGHT_EXACT_XML % int(2.0 * 567))
     
     # Заповнення заголовків
     for i, (cell, header_text, col_width) in enumerate(
         zip(header_row.cells, headers, column_widths)
     ):
-        cell.width = Cm(col_width)
-        cell.text = header_text
+        cell.width = col_width
         
-        try:
-            cell.vertical_alignment = WD_ALIGN_VERTICAL.CENTER
-        except AttributeError:
-            pass
+        set_cell_vertical_center(cell)
         
         para = cell.paragraphs[0]
         para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        
-        if len(para.runs) > 0:
-            para.runs[0].font.name = 'Arial'
-            para.runs[0].font.size = Pt(14)
+        _add_styled_run(para, header_text, DESCRIPTION_TEXT_PT)
         
         _set_cell_borders(cell, True, True, True, True)
     
-    # Рядки даних (висота 0.6см кожен)
-    for row_index in range(1, 6):
-        row = table.rows[row_index]
-        row.height = Cm(0.6)
+    # Перший рядок даних (висота 0.6см)
+    row = table.rows[1]
+    row.height = LAYOUT_LENGTHS['DESCRIPTION_ROW_HEIGHT']
+    
+    # XML для точної висоти
+    _append_template(_get_or_add_trPr(row), _ROW_HEIGHT_EXACT_XML % int(0.6 * 567))
+    
+    for col_index, cell in enumerate(row.cells):
+        cell.width = column_widths[col_index]
         
-        # XML для точної висоти
-        trPr = row._tr.trPr
-        if trPr is None:
-            trPr = OxmlElement('w:trPr')
-            row._tr.append(trPr)
+        set_cell_vertical_center(cell)
         
-        trHeight = OxmlElement('w:trHeight')
-        trHeight.set(qn('w:val'), str(int(0.6 * 567)))
-        trHeight.set(qn('w:hRule'), 'exact')
-        trPr.append(trHeight)
+        if col_index == 0:
+            para = cell.paragraphs[0]
+            para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+            _add_styled_run(para, "1.", DESCRIPTION_TEXT_PT)
         
-        for col_index, cell in enumerate(row.cells):
-            cell.width = Cm(column_widths[col_index])
-            
-            try:
-                cell.vertical_alignment = WD_ALIGN_VERTICAL.CENTER
-            except AttributeError:
-                pass
-            
-            if col_index == 0:
-                cell.text = f"{row_index}."
-                para = cell.paragraphs[0]
-                para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                
-                if len(para.runs) > 0:
-                    para.runs[0].font.name = 'Arial'
-                    para.runs[0].font.size = Pt(14)
-            
-            _set_cell_borders(cell, True, True, True, True)
+        _set_cell_borders(cell, True, True, True, True)
+    
+    # Рядки 2-5: копії XML першого рядка, змінюється лише номер
+    template_tr = row._tr
+    for row_index in range(2, 6):
+        new_tr = copy.deepcopy(template_tr)
+        new_tr.tc_lst[0].xpath('.//w:t')[0].text = f"{row_index}."
+        table._tbl.append(new_tr)
 
 def _set_cell_borders(cell, top, bottom, left, right):
     """Налаштування рамок комірки"""
-    from docx.oxml.shared import OxmlElement
-    from docx.oxml.ns import qn
-    
-    try:
-        tc = cell._tc
-        tcPr = tc.tcPr
-        if tcPr is None:
-            tcPr = OxmlElement('w:tcPr')
-            tc.append(tcPr)
-        
-        tcBorders = OxmlElement('w:tcBorders')
-        
-        border_settings = [
-            ('top', top), ('bottom', bottom), ('left', left), ('right', right)
-        ]
-        
-        for position, show_border in border_settings:
-            border_element = OxmlElement(f'w:{position}')
-            if show_border:
-                border_element.set(qn('w:val'), 'single')
-                border_element.set(qn('w:sz'), '4')
-                border_element.set(qn('w:color'), '000000')
-            else:
-                border_element.set(qn('w:val'), 'none')
-            
-            tcBorders.append(border_element)
-        
-        tcPr.append(tcBorders)
-        
-    except Exception as e:
-        print(f"Warning: Could not set cell borders: {e}")
+    set_cell_borders(cell, top=top, bottom=bottom, left=left, right=right)
 
 def _add_description_spacers(doc):
     """Додавання 12 абзаців-розділювачів"""
@@ -528,8 +610,7 @@ def _add_description_spacers(doc):
         spacer_style.paragraph_format.space_before = Pt(0)
         spacer_style.paragraph_format.space_after = Pt(0)
         spacer_style.font.size = Pt(28)
-        spacer_style.font.name = 'Arial'
-    except:
+    except ValueError:
         pass  # Стиль вже існує
     
     for i in range(12):
@@ -552,9 +633,9 @@ def _add_description_signature(doc, title_data):
         signature_style.paragraph_format.space_before = Pt(0)
         signature_style.paragraph_format.space_after = Pt(0)
         signature_style.font.size = Pt(14)
-        signature_style.font.name = 'Arial'
         signature_style.font.bold = False
-    except:
+    except ValueError:
+        # Стиль вже існує
         signature_style = doc.styles['DescriptionSignature']
     
     # Три абзаци підпису
@@ -562,26 +643,17 @@ def _add_description_signature(doc, title_data):
     para2 = doc.add_paragraph(f"забезпечення військової частини {unit_info}", style=signature_style)
     
     para3 = doc.add_paragraph(style=signature_style)
-    rank_run = para3.add_run(signature_info['rank'])
-    rank_run.font.name = 'Arial'
-    rank_run.font.size = Pt(14)
-    rank_run.font.bold = False
+    _add_styled_run(para3, signature_info['rank'], DESCRIPTION_TEXT_PT)
     
     try:
         tab_stops = para3.paragraph_format.tab_stops
         tab_stops.clear_all()
         tab_stops.add_tab_stop(Cm(13), WD_TAB_ALIGNMENT.RIGHT)
         
-        name_run = para3.add_run(f"\t{signature_info['name']}")
-        name_run.font.name = 'Arial'
-        name_run.font.size = Pt(14)
-        name_run.font.bold = False
+        _add_styled_run(para3, f"\t{signature_info['name']}", DESCRIPTION_TEXT_PT)
         
     except Exception:
-        arrow_run = para3.add_run(f" → → → → → → → {signature_info['name']}")
-        arrow_run.font.name = 'Arial'
-        arrow_run.font.size = Pt(14)
-        arrow_run.font.bold = False
+        _add_styled_run(para3, f" → → → → → → → {signature_info['name']}", DESCRIPTION_TEXT_PT)
 
 # ДЕКОРАТОР ДЛЯ ПЕРЕВІРОК
 def requires_image_and_point(func):
@@ -612,7 +684,7 @@ def create_new_structure_pages(doc, processed_images):
     """Створення сторінок з новою структурою та таблицями БЕЗ лівого поля"""
     try:
         if not processed_images:
-            print("No processed images to add")
+            log.debug("No processed images to add")
             return
         
         # Додаємо нову секцію для таблиць
@@ -622,68 +694,102 @@ def create_new_structure_pages(doc, processed_images):
         set_a4_page_format(table_section)
         
         # ОНОВЛЕНІ ПОЛЯ: 0мм зліва (таблиці впритул до краю!), 20мм зверху, 5мм справа/знизу
-        table_section.left_margin = Cm(mm_to_cm(ALBUM_LAYOUT['TABLE_PAGES_LEFT_MARGIN']))  # 0мм!
-        table_section.right_margin = Cm(mm_to_cm(ALBUM_LAYOUT['TABLE_PAGES_RIGHT_MARGIN']))
-        table_section.top_margin = Cm(mm_to_cm(ALBUM_LAYOUT['TABLE_PAGES_TOP_MARGIN']))
-        table_section.bottom_margin = Cm(mm_to_cm(ALBUM_LAYOUT['TABLE_PAGES_BOTTOM_MARGIN']))
+        table_section.left_margin = LAYOUT_LENGTHS['TABLE_PAGES_LEFT_MARGIN']  # 0мм!
+        table_section.right_margin = LAYOUT_LENGTHS['TABLE_PAGES_RIGHT_MARGIN']
+        table_section.top_margin = LAYOUT_LENGTHS['TABLE_PAGES_TOP_MARGIN']
+        table_section.bottom_margin = LAYOUT_LENGTHS['TABLE_PAGES_BOTTOM_MARGIN']
+        
+        log.debug("✓ NEW margins set: left=0mm (no margin!), top=20mm, right=5mm, bottom=5mm")
+        
+        # Рендеримо всі зображення паралельно, docx збирається послідовно в цьому потоці
+        prerender_processed_images(processed_images)
+        
+        # Форматування таблиць однакове - будуємо його один раз, далі лише копії XML
+        table_skeleton = create_image_table_skeleton(doc)
         
-        print(f"✓ NEW margins set: left=0mm (no margin!), top=20mm, right=5mm, bottom=5mm")
+        # Кінцевий sectPr тіла не змінюється - нові елементи вставляються перед ним
+        # без пошуку серед усіх уже доданих таблиць і параграфів
+        body_end = doc.element.body.sectPr
         
         # Обробляємо зображення парами (по 2 на сторінку)
         for i in range(0, len(processed_images), 2):
             first_image = processed_images[i]
             second_image = processed_images[i + 1] if i + 1 < len(processed_images) else None
             
-            print(f"\n=== Creating page for images {i+1}-{i+2 if second_image else i+1} ===")
+            log.info("=== Creating page for images %s-%s ===", i+1, i+2 if second_image else i+1)
 
             # 1. Параграф-розділювач 5мм
-            create_spacer_paragraph(doc, ALBUM_LAYOUT['PARAGRAPH_HEIGHT'])
-            print("✓ Added top spacer paragraph (5mm)")
+            create_spacer_paragraph(doc, ALBUM_LAYOUT['PARAGRAPH_HEIGHT'], body_end)
+            log.debug("✓ Added top spacer paragraph (5mm)")
             
             # 2. Перша таблиця 130мм (БЕЗ лівого відступу)
-            create_single_image_table(doc, first_image)
-            print("✓ Added first table (130mm, aligned to LEFT EDGE)")
+            create_single_image_table(doc, first_image, table_skeleton, body_end)
+            log.debug("✓ Added first table (130mm, aligned to LEFT EDGE)")
             
             # 3. Параграф-розділювач 5мм
-            create_spacer_paragraph(doc, ALBUM_LAYOUT['PARAGRAPH_HEIGHT'])
-            print("✓ Added middle spacer paragraph (5mm)")
+            create_spacer_paragraph(doc, ALBUM_LAYOUT['PARAGRAPH_HEIGHT'], body_end)
+            log.debug("✓ Added middle spacer paragraph (5mm)")
             
             # 4. Друга таблиця 130мм (якщо є друге зображення)
             if second_image:
-                create_single_image_table(doc, second_image)
-                print("✓ Added second table (130mm, aligned to LEFT EDGE)")
+                create_single_image_table(doc, second_image, table_skeleton, body_end)
+                log.debug("✓ Added second table (130mm, aligned to LEFT EDGE)")
             else:
                 # Якщо немає другого зображення, додаємо порожню таблицю
                 create_empty_table_placeholder(doc)
-                print("✓ Added empty table placeholder")
+                log.debug("✓ Added empty table placeholder")
         
         total_pages = (len(processed_images) + 1) // 2
-        print(f"\n✅ Final result: {len(processed_images)} images in {total_pages} pages with LEFT-ALIGNED tables")
+        log.info("✅ Final result: %s images in %s pages with LEFT-ALIGNED tables", len(processed_images), total_pages)
         
     except Exception as e:
-        print(f"✗ Error creating new structure pages: {e}")
-
-def create_spacer_paragraph(doc, height_mm):
+        log.error("✗ Error creating new structure pages: %s", e)
+
+# Параграф-розділювач: без відступів, одинарний інтервал (саме такий XML
+# давали попередні налаштування paragraph_format). Без нього Word зливає сусідні таблиці
+_SPACER_PARAGRAPH_XML = ('<w:p {w}><w:pPr><w:spacing w:before="0" w:after="0" '
+                         'w:line="240" w:lineRule="auto"/></w:pPr></w:p>')
+
+def _insert_body_element(doc, element, body_end=None):
+    """Додавання елемента в кінець тіла документа (перед кінцевим sectPr)"""
+    if body_end is None:
+        body_end = doc.element.body.sectPr
+    if body_end is not None:
+        body_end.addprevious(element)
+    else:
+        doc.element.body.append(element)
+
+def create_spacer_paragraph(doc, height_mm, body_end=None):
     """Створення параграфа-розділювача з точною висотою"""
-    try:
-        para = doc.add_paragraph()
-        para.text = ""  # Порожній параграф
-        
-        # Встановлюємо точну висоту параграфа
-        para.paragraph_format.space_before = Pt(0)
-        para.paragraph_format.space_after = Pt(0)
-        para.paragraph_format.line_spacing = Cm(mm_to_cm(height_mm))
-        para.paragraph_format.line_spacing_rule = 0  # Точна висота
-        
-        print(f"✓ Created spacer paragraph: {height_mm}mm")
-        
-    except Exception as e:
-        print(f"✗ Error creating spacer paragraph: {e}")
+    # Готовий параграф з шаблону замість add_paragraph + 4 налаштувань формату
+    _insert_body_element(doc, copy.deepcopy(_xml_template(_SPACER_PARAGRAPH_XML)), body_end)
+    
+    log.debug("✓ Created spacer paragraph: %smm", height_mm)
+
+def create_image_table_skeleton(doc):
+    """Порожня відформатована таблиця 1x3 (шаблон для копіювання), від'єднана від документа"""
+    table = create_single_image_table(doc, None)
+    if table is None:
+        return None
+    
+    tbl = table._tbl
+    tbl.getparent().remove(tbl)
+    return tbl
 
-def create_single_image_table(doc, image_data):
+def create_single_image_table(doc, image_data, skeleton=None, body_end=None):
     """Створення таблиці 1x3 для одного зображення"""
     try:
-        print(f"🔨 Creating single image table...")
+        log.debug("🔨 Creating single image table...")
+        
+        if skeleton is not None:
+            # Копія готового XML таблиці: заповнюється лише вміст комірок зображення та даних
+            tbl = copy.deepcopy(skeleton)
+            _insert_body_element(doc, tbl, body_end)
+            table = Table(tbl, doc._body)
+            cells = table.rows[0].cells
+            fill_image_cell(cells[1], image_data)
+            fill_data_cell(cells[2], image_data)
+            return table
         
         # Створюємо таблицю 1x3 (1 рядок, 3 колонки)
         table = doc.add_table(rows=1, cols=ALBUM_LAYOUT['TABLE_COLS'])
@@ -697,12 +803,12 @@ def create_single_image_table(doc, image_data):
         
         # Налаштовуємо єдиний рядок з висотою 130мм
         setup_image_row(table, 0, image_data)
-        print(f"✅ Single image table created successfully")
+        log.debug("✅ Single image table created successfully")
         
         return table
         
     except Exception as e:
-        print(f"❌ Error creating single image table: {e}")
+        log.error("❌ Error creating single image table: %s", e)
         return None
 
 def create_empty_table_placeholder(doc):
@@ -716,453 +822,496 @@ def create_empty_table_placeholder(doc):
         
         # Налаштовуємо порожній рядок
         row = table.rows[0]
-        row.height = Cm(mm_to_cm(ALBUM_LAYOUT['TABLE_HEIGHT']))  # 130мм
+        row.height = LAYOUT_LENGTHS['TABLE_HEIGHT']  # 130мм
         
         for col_idx in range(ALBUM_LAYOUT['TABLE_COLS']):
             cell = row.cells[col_idx]
-            cell.text = ""
             set_cell_background(cell, "FFFFFF")
             # Прозорі границі для порожньої таблиці
             set_cell_borders(cell, top=False, bottom=False, left=False, right=False)
         
-        print(f"✓ Created empty table placeholder")
+        log.debug("✓ Created empty table placeholder")
         
     except Exception as e:
-        print(f"✗ Error creating empty table placeholder: {e}")
+        log.error("✗ Error creating empty table placeholder: %s", e)
+
+# ===== XML-ШАБЛОНИ ДЛЯ ТАБЛИЦЬ АЛЬБОМУ =====
+# Розбираються один раз, у документ додаються копії (copy.deepcopy)
+
+_XML_TEMPLATE_CACHE = {}
+
+def _xml_template(xml):
+    """Розібраний XML-фрагмент з простором імен w: (кешується за текстом)"""
+    template = _XML_TEMPLATE_CACHE.get(xml)
+    if template is None:
+        template = parse_xml(xml.format(w=nsdecls('w')))
+        _XML_TEMPLATE_CACHE[xml] = template
+    return template
+
+def _append_template(parent, xml):
+    """Додавання копії XML-шаблону до елемента"""
+    element = copy.deepcopy(_xml_template(xml))
+    parent.append(element)
+    return element
+
+def _get_or_add_tcPr(cell):
+    """Отримання tcPr комірки (створюється за потреби)"""
+    tc = cell._tc
+    tcPr = tc.tcPr
+    if tcPr is None:
+        tcPr = OxmlElement('w:tcPr')
+        tc.append(tcPr)
+    return tcPr
+
+def set_document_default_font(doc):
+    """Arial за замовчуванням для всього документа: одна правка docDefaults замість font.name у кожному стилі"""
+    rPr_defaults = doc.styles.element.xpath('w:docDefaults/w:rPrDefault/w:rPr')
+    if not rPr_defaults:
+        doc.styles['Normal'].font.name = 'Arial'
+        return
+    
+    rPr = rPr_defaults[0]
+    for rFonts in rPr.xpath('w:rFonts'):
+        rPr.remove(rFonts)
+    # rFonts - перший елемент у rPr за схемою; шрифти теми (minorHAnsi) прибираються разом зі старим rFonts
+    rPr.insert(0, copy.deepcopy(_xml_template(_DEFAULT_FONTS_XML)))
+
+def _get_or_add_trPr(row):
+    """Отримання trPr рядка (створюється за потреби)"""
+    tr = row._tr
+    trPr = tr.trPr
+    if trPr is None:
+        trPr = OxmlElement('w:trPr')
+        tr.append(trPr)
+    return trPr
+
+_TABLE_LAYOUT_XML = '<w:tblLayout {w} w:type="fixed"/>'
+_TABLE_WIDTH_XML = '<w:tblW {w} w:type="dxa" w:w="%d"/>' % ALBUM_LAYOUT_DXA['TABLE_WIDTH']
+_TABLE_JC_LEFT_XML = '<w:jc {w} w:val="left"/>'
+_TABLE_IND_ZERO_XML = '<w:tblInd {w} w:w="0" w:type="dxa"/>'
+_CELL_WIDTH_XML = '<w:tcW {w} w:type="dxa" w:w="%d"/>'
+_CELL_NO_FIT_XML = '<w:tcFitText {w} w:val="0"/>'
+_CELL_VALIGN_CENTER_XML = '<w:vAlign {w} w:val="center"/>'
+_CELL_SHADING_XML = '<w:shd {w} w:val="clear" w:color="auto" w:fill="%s"/>'
+_DEFAULT_FONTS_XML = '<w:rFonts {w} w:ascii="Arial" w:hAnsi="Arial" w:eastAsia="Arial" w:cs="Arial"/>'
+_TABLE_IND_XML = '<w:tblInd {w} w:w="%d" w:type="dxa"/>'
+_ROW_HEIGHT_EXACT_XML = '<w:trHeight {w} w:val="%d" w:hRule="exact"/>'
+_FIRST_CELL_MARGINS_XML = ('<w:tcMar {w}><w:top w:w="0" w:type="dxa"/><w:left w:w="140" w:type="dxa"/>'
+                           '<w:bottom w:w="0" w:type="dxa"/><w:right w:w="0" w:type="dxa"/></w:tcMar>')
+_IMAGE_CELL_MARGINS_XML = ('<w:tcMar {w}><w:top w:w="0" w:type="dxa"/><w:left w:w="0" w:type="dxa"/>'
+                           '<w:bottom w:w="0" w:type="dxa"/><w:right w:w="0" w:type="dxa"/></w:tcMar>')
+_DATA_CELL_MARGINS_XML = ('<w:tcMar {w}><w:left w:w="140" w:type="dxa"/>'
+                          '<w:bottom w:w="0" w:type="dxa"/></w:tcMar>')
 
 def set_table_width(table):
     """Встановлення фіксованої ширини таблиці та ЛІВОГО вирівнювання"""
-    try:
-        tbl = table._tbl
-        tblPr = tbl.tblPr
-        
-        # Фіксований layout
-        tblLayout = OxmlElement('w:tblLayout')
-        tblLayout.set(qn('w:type'), 'fixed')
-        tblPr.append(tblLayout)
-        
-        # ТОЧНА ширина таблиці: 30+145+30 = 205мм
-        total_width_mm = ALBUM_LAYOUT['COL_1_WIDTH'] + ALBUM_LAYOUT['COL_2_WIDTH'] + ALBUM_LAYOUT['COL_3_WIDTH']
-        width_dxa = int(total_width_mm * 56.7)  # 205мм в DXA
-        
-        tblW = OxmlElement('w:tblW')
-        tblW.set(qn('w:type'), 'dxa')
-        tblW.set(qn('w:w'), str(width_dxa))
-        tblPr.append(tblW)
-        
-        # ВАЖЛИВО: Вирівнювання по ЛІВОМУ краю (таблиця притиснута до лівого краю аркуша)
-        tblJc = OxmlElement('w:jc')
-        tblJc.set(qn('w:val'), 'left')  # Ліве вирівнювання
-        tblPr.append(tblJc)
-        
-        # ДОДАТКОВО: Забезпечуємо що таблиця починається з самого лівого краю
-        tblInd = OxmlElement('w:tblInd')
-        tblInd.set(qn('w:w'), '0')  # Нульовий відступ зліва
-        tblInd.set(qn('w:type'), 'dxa')
-        tblPr.append(tblInd)
-        
-        print(f"✓ Table: {total_width_mm}mm width, LEFT-aligned to page edge (no left margin)")
-        
-    except Exception as e:
-        print(f"✗ Error setting table width and alignment: {e}")
+    tblPr = table._tbl.tblPr
+    
+    # Фіксований layout
+    _append_template(tblPr, _TABLE_LAYOUT_XML)
+    
+    # ТОЧНА ширина таблиці: 25+150+30 = 205мм
+    total_width_mm = ALBUM_LAYOUT['COL_1_WIDTH'] + ALBUM_LAYOUT['COL_2_WIDTH'] + ALBUM_LAYOUT['COL_3_WIDTH']
+    _append_template(tblPr, _TABLE_WIDTH_XML)
+    
+    # ВАЖЛИВО: Вирівнювання по ЛІВОМУ краю (таблиця притиснута до лівого краю аркуша)
+    _append_template(tblPr, _TABLE_JC_LEFT_XML)
+    
+    # ДОДАТКОВО: Забезпечуємо що таблиця починається з самого лівого краю
+    _append_template(tblPr, _TABLE_IND_ZERO_XML)
+    
+    log.debug("✓ Table: %smm width, LEFT-aligned to page edge (no left margin)", total_width_mm)
+
 def setup_column_widths(table):
     """Налаштування ширин колонок для таблиці 1x3"""
-    try:
-        col_1_width = ALBUM_LAYOUT['COL_1_WIDTH']      # 30мм - Індикатор ЗРЛ
-        col_2_width = ALBUM_LAYOUT['COL_2_WIDTH']      # 145мм - зображення  
-        col_3_width = ALBUM_LAYOUT['COL_3_WIDTH']      # 30мм - дані
-        
-        # Встановлюємо ширини колонок
-        for col_idx in range(ALBUM_LAYOUT['TABLE_COLS']):
-            row = table.rows[0]  # Тільки один рядок
-            cell = row.cells[col_idx]
-            
-            if col_idx == 0:
-                set_cell_width_mm(cell, col_1_width)    # 30мм
-            elif col_idx == 1:
-                set_cell_width_mm(cell, col_2_width)    # 145мм
-            elif col_idx == 2:
-                set_cell_width_mm(cell, col_3_width)    # 30мм
-        
-        print(f"✓ Column widths set: 30mm, 145mm, 30mm")
-        
-    except Exception as e:
-        print(f"✗ Error setting column widths: {e}")
+    col_1_width = ALBUM_LAYOUT['COL_1_WIDTH']      # 30мм - Індикатор ЗРЛ
+    col_2_width = ALBUM_LAYOUT['COL_2_WIDTH']      # 145мм - зображення  
+    col_3_width = ALBUM_LAYOUT['COL_3_WIDTH']      # 30мм - дані
+    
+    # Встановлюємо ширини колонок
+    for col_idx in range(ALBUM_LAYOUT['TABLE_COLS']):
+        row = table.rows[0]  # Тільки один рядок
+        cell = row.cells[col_idx]
+        
+        if col_idx == 0:
+            set_cell_width_mm(cell, col_1_width)    # 30мм
+        elif col_idx == 1:
+            set_cell_width_mm(cell, col_2_width)    # 145мм
+        elif col_idx == 2:
+            set_cell_width_mm(cell, col_3_width)    # 30мм
+    
+    log.debug("✓ Column widths set: 30mm, 145mm, 30mm")
 
 def setup_image_row(table, row_idx, image_data):
     """Налаштування рядка з зображенням (висота 130мм)"""
-    try:
-        row = table.rows[row_idx]
-        
-        # Встановлюємо висоту рядка 130мм
-        row.height = Cm(mm_to_cm(ALBUM_LAYOUT['TABLE_HEIGHT']))  # 130мм
-        
-        # Фіксована висота рядка
-        trPr = row._tr.trPr
-        if trPr is None:
-            trPr = OxmlElement('w:trPr')
-            row._tr.append(trPr)
-        
-        trHeight = OxmlElement('w:trHeight')
-        trHeight.set(qn('w:val'), str(int(130 * 56.7)))  # 130мм в DXA
-        trHeight.set(qn('w:hRule'), 'exact')  # ТОЧНА висота
-        trPr.append(trHeight)
-
-        # Налаштовуємо комірки
-        for col_idx in range(ALBUM_LAYOUT['TABLE_COLS']):
-            cell = row.cells[col_idx]
-            
-            if col_idx == 0:
-                setup_first_cell(cell, True)  # Показуємо границі
-            elif col_idx == 1:
-                setup_image_cell(cell, image_data, True)  # Показуємо границі
-            elif col_idx == 2:
-                setup_data_cell(cell, image_data, True)  # Показуємо границі
-        
-        print(f"✓ Image row {row_idx + 1} configured (130mm height)")
-        
-    except Exception as e:
-        print(f"✗ Error setting up image row {row_idx}: {e}")
+    row = table.rows[row_idx]
+    
+    # Встановлюємо висоту рядка 130мм
+    row.height = LAYOUT_LENGTHS['TABLE_HEIGHT']  # 130мм
+    
+    # Фіксована (ТОЧНА) висота рядка: 130мм в DXA
+    _append_template(_get_or_add_trPr(row), _ROW_HEIGHT_EXACT_XML % ALBUM_LAYOUT_DXA['TABLE_HEIGHT'])
+
+    # Налаштовуємо комірки
+    for col_idx in range(ALBUM_LAYOUT['TABLE_COLS']):
+        cell = row.cells[col_idx]
+        
+        if col_idx == 0:
+            setup_first_cell(cell, True)  # Показуємо границі
+        elif col_idx == 1:
+            setup_image_cell(cell, image_data, True)  # Показуємо границі
+        elif col_idx == 2:
+            setup_data_cell(cell, image_data, True)  # Показуємо границі
+    
+    log.debug("✓ Image row %s configured (130mm height)", row_idx + 1)
 
 # ===== ДОПОМІЖНІ ФУНКЦІЇ =====
 
 def setup_first_cell(cell, show_borders):
     """Налаштування першої комірки (ширина 30мм, текст 'Індикатор ЗРЛ')"""
-    try:
-        # Вертикальне центрування
-        set_cell_vertical_center(cell)
-        
-        # Текст
-        cell.text = ""
+    # Вертикальне центрування
+    set_cell_vertical_center(cell)
+    
+    # Текст (комірка з add_table вже містить один порожній параграф)
+    para = cell.paragraphs[0]
+    para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    
+    para.add_run("Індикатор ЗРЛ").font.size = FONT_PT[12]
 
-        para = cell.paragraphs[0]
-        para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        
-        run = para.add_run("Індикатор ЗРЛ")
-        run.font.name = 'Arial'
-        run.font.size = Pt(12)
-
-        # ВНУТРІШНІ ПОЛЯ КОМІРКИ
-        tc = cell._tc
-        tcPr = tc.tcPr
-        if tcPr is None:
-            tcPr = OxmlElement('w:tcPr')
-            tc.append(tcPr)
-        
-        tcMar = OxmlElement('w:tcMar')
-        # Налаштування відступів для лівої комірки
-        margins = {
-            'top': '0',        # 0 зверху
-            'left': '140',     # 140 DXA = ~2.5мм зліва
-            'bottom': '0',     # 0 знизу  
-            'right': '0'       # 0 справа
-        }
-        
-        for margin_name, value in margins.items():
-            margin = OxmlElement(f'w:{margin_name}')
-            margin.set(qn('w:w'), value)
-            margin.set(qn('w:type'), 'dxa')
-            tcMar.append(margin)
-        
-        tcPr.append(tcMar)
-        
-        # Границі: лише права (якщо показуємо границі)
-        if show_borders:
-            set_cell_borders(cell, top=False, bottom=False, left=False, right=True)
-        else:
-            set_cell_borders(cell, top=False, bottom=False, left=False, right=False)
-        
-    except Exception as e:
-        print(f"✗ Error configuring first cell: {e}")
+    # ВНУТРІШНІ ПОЛЯ КОМІРКИ: 140 DXA (~2.5мм) зліва, решта 0
+    _append_template(_get_or_add_tcPr(cell), _FIRST_CELL_MARGINS_XML)
+    
+    # Границі: лише права (якщо показуємо границі)
+    if show_borders:
+        set_cell_borders(cell, top=False, bottom=False, left=False, right=True)
+    else:
+        set_cell_borders(cell, top=False, bottom=False, left=False, right=False)
 
 def setup_image_cell(cell, image_data, show_borders):
-    try:
-        # Вертикальне центрування
-        set_cell_vertical_center(cell)
-        
-        # Очищуємо комірку
-        cell.text = ""
-        para = cell.paragraphs[0]
-        para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        
-        # НУЛЬОВІ ВІДСТУПИ У ПАРАГРАФА
-        para.paragraph_format.space_before = Pt(0)
-        para.paragraph_format.space_after = Pt(0) 
-        para.paragraph_format.left_indent = Pt(0)
-        para.paragraph_format.right_indent = Pt(0)
-        para.paragraph_format.line_spacing = 1.0
-        
-        if image_data:
-            # Створюємо оброблене зображення (ТЕПЕР З ОПИСОМ РЛС НА ЗОБРАЖЕННІ)
-            processed_image = create_processed_image_from_data(image_data)
-            
-            if processed_image:
-                # Зберігаємо у тимчасовий файл
-                with tempfile.NamedTemporaryFile(suffix='.jpg', delete=False) as temp_file:
-                    temp_path = temp_file.name
-                    processed_image.save(temp_path, 'JPEG', quality=95)
-                
-                # Розмір зображення (з відступом для границь)
-                border_thickness_mm = 1.0
-                effective_width = ALBUM_LAYOUT['COL_2_WIDTH'] - border_thickness_mm    # 149мм
-                effective_height = ALBUM_LAYOUT['TABLE_HEIGHT'] - border_thickness_mm  # 129мм
-                
-                # Додаємо зображення
-                run = para.add_run()
-                inline_shape = run.add_picture(temp_path, 
-                                             width=Cm(effective_width / 10.0),   # 14.9см
-                                             height=Cm(effective_height / 10.0)) # 12.9см
-                
-                # Видаляємо тимчасовий файл
-                try:
-                    os.remove(temp_path)
-                except:
-                    pass
-                
-                print(f"✓ Image added: {effective_width}mm x {effective_height}mm with radar description")
-        
-        # Налаштування полів комірки (нульові для точного позиціонування)
-        tc = cell._tc
-        tcPr = tc.tcPr
-        if tcPr is None:
-            tcPr = OxmlElement('w:tcPr')
-            tc.append(tcPr)
-        
-        tcMar = OxmlElement('w:tcMar')
-        for margin_name in ['top', 'left', 'bottom', 'right']:
-            margin = OxmlElement(f'w:{margin_name}')
-            margin.set(qn('w:w'), '0')  # Нульові поля
-            margin.set(qn('w:type'), 'dxa')
-            tcMar.append(margin)
-        tcPr.append(tcMar)
-        
-        # Границі
-        if show_borders:
-            set_cell_borders(cell, top=True, bottom=True, left=True, right=True)
-        else:
-            set_cell_borders(cell, top=False, bottom=False, left=False, right=False)
-        
-        # Білий фон
-        set_cell_background(cell, "FFFFFF")
+    # Вертикальне центрування
+    set_cell_vertical_center(cell)
+    
+    # Комірка з add_table вже порожня - очищення не потрібне
+    para = cell.paragraphs[0]
+    para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    
+    # НУЛЬОВІ ВІДСТУПИ У ПАРАГРАФА
+    para.paragraph_format.space_before = FONT_PT[0]
+    para.paragraph_format.space_after = FONT_PT[0] 
+    para.paragraph_format.left_indent = FONT_PT[0]
+    para.paragraph_format.right_indent = FONT_PT[0]
+    para.paragraph_format.line_spacing = 1.0
+    
+    fill_image_cell(cell, image_data)
+    
+    # Налаштування полів комірки (нульові для точного позиціонування)
+    _append_template(_get_or_add_tcPr(cell), _IMAGE_CELL_MARGINS_XML)
+    
+    # Границі
+    if show_borders:
+        set_cell_borders(cell, top=True, bottom=True, left=True, right=True)
+    else:
+        set_cell_borders(cell, top=False, bottom=False, left=False, right=False)
+    
+    # Білий фон
+    set_cell_background(cell, "FFFFFF")
+    
+    log.debug("✓ Image cell configured with radar description on image")
+
+def fill_image_cell(cell, image_data):
+    """Вміст комірки зображення: оброблене зображення з описом РЛС"""
+    if not image_data:
+        return
+    
+    # Створюємо оброблене зображення (ТЕПЕР З ОПИСОМ РЛС НА ЗОБРАЖЕННІ)
+    # і кодуємо (JPEG або PNG) у пам'ять (без тимчасового файлу на диску)
+    image_buffer = encode_processed_image(image_data)
+    
+    if image_buffer:
+        # Розмір зображення (з відступом для границь)
+        border_thickness_mm = 1.0
+        effective_width = ALBUM_LAYOUT['COL_2_WIDTH'] - border_thickness_mm    # 149мм
+        effective_height = ALBUM_LAYOUT['TABLE_HEIGHT'] - border_thickness_mm  # 129мм
         
-        print(f"✓ Image cell configured with radar description on image")
+        # Додаємо зображення
+        run = cell.paragraphs[0].add_run()
+        run.add_picture(image_buffer, 
+                        width=LAYOUT_LENGTHS['IMAGE_WIDTH'],   # 14.9см
+                        height=LAYOUT_LENGTHS['IMAGE_HEIGHT']) # 12.9см
         
-    except Exception as e:
-        print(f"✗ Error configuring image cell: {e}")
-        import traceback
-        traceback.print_exc()
+        log.debug("✓ Image added: %smm x %smm with radar description", effective_width, effective_height)
 
 # ===== ДОДАТКОВІ УТИЛІТИ =====
 
 def setup_data_cell(cell, image_data, show_borders):
     """Налаштування комірки з даними з лівим відступом"""
+    # ВСТАНОВЛЮЄМО ВНУТРІШНІ ПОЛЯ КОМІРКИ ЗАМІСТЬ ВІДСТУПІВ ПАРАГРАФІВ:
+    # 140 DXA = ~2.5мм зліва (замість 8pt відступу параграфа), 0мм знизу
+    _append_template(_get_or_add_tcPr(cell), _DATA_CELL_MARGINS_XML)
+    
+    fill_data_cell(cell, image_data)
+    
+    # Границі: всі сторони крім лівої (якщо показуємо границі)
+    if show_borders:
+        set_cell_borders(cell, top=True, bottom=True, left=False, right=True)
+    else:
+        set_cell_borders(cell, top=False, bottom=False, left=False, right=False)
+
+def fill_data_cell(cell, image_data):
+    """Вміст комірки даних: номер цілі, азимут, дальність, висота та параметри"""
+    if not image_data:
+        return
+    
+    # Отримуємо дані
+    target_data = image_data['target_data']
+    analysis_point = image_data['analysis_point']
+    target_no = target_data['number']
+    
+    # 🎯 ФОРМУЄМО СПИСОК З ВИСОТОЮ
+    data_lines = [
+        (f"{target_no}", 12, True, True),
+        (f"β – {analysis_point['azimuth']:.0f}ᴼ", 12, True, False),
+        (f"D – {analysis_point['range']:.0f} км", 12, True, False),
+    ]
+    
+    # 🎯 ДОДАЄМО ВИСОТУ ТІЛЬКИ ЯКЩО НЕ ДОРІВНЮЄ "0.0"
+    height_value = target_data.get('height', '0.0')
     try:
-        # Очищуємо комірку
-        cell.text = ""
-
-        # ВСТАНОВЛЮЄМО ВНУТРІШНІ ПОЛЯ КОМІРКИ ЗАМІСТЬ ВІДСТУПІВ ПАРАГРАФІВ
-        tc = cell._tc
-        tcPr = tc.tcPr
-        if tcPr is None:
-            tcPr = OxmlElement('w:tcPr')
-            tc.append(tcPr)
-        
-        tcMar = OxmlElement('w:tcMar')
-        # Налаштування відступів для правої комірки
-        margins = {
-            'left': '140',     # 140 DXA = ~2.5мм (замість 8pt відступу параграфа)
-            'bottom': '0',     # 0мм знизу
-        }
-        
-        for margin_name, value in margins.items():
-            margin = OxmlElement(f'w:{margin_name}')
-            margin.set(qn('w:w'), value)
-            margin.set(qn('w:type'), 'dxa')
-            tcMar.append(margin)
-        
-        tcPr.append(tcMar)
-        
-        if image_data:
-            # Перший параграф з відступами
-            para = cell.paragraphs[0]
-            para.alignment = WD_ALIGN_PARAGRAPH.LEFT
-            para.paragraph_format.space_before = Pt(30)  # 30pt зверху
-            para.paragraph_format.space_after = Pt(0)
-            para.paragraph_format.line_spacing = 1.15
-            
-            # НОВИЙ ЛІВИЙ ВІДСТУП
-            para.paragraph_format.left_indent = Pt(0)  # 0pt = ~0мм лівий відступ
-            para.paragraph_format.right_indent = Pt(0)  # Без правого відступу
-            
-            # Отримуємо дані
-            target_data = image_data['target_data']
-            analysis_point = image_data['analysis_point']
-            target_no = target_data['number']
-            
-            # 🎯 ФОРМУЄМО СПИСОК З ВИСОТОЮ
-            data_lines = [
-                (f"{target_no}", 12, True, True),
-                (f"β – {analysis_point['azimuth']:.0f}ᴼ", 12, True, False),
-                (f"D – {analysis_point['range']:.0f} км", 12, True, False),
-            ]
-            
-            # 🎯 ДОДАЄМО ВИСОТУ ТІЛЬКИ ЯКЩО НЕ ДОРІВНЮЄ "0.0"
-            height_value = target_data.get('height', '0.0')
-            try:
-                height_float = float(height_value)
-                if height_float != 0.0:
-                    data_lines.append((f"Н – {height_value} м", 12, True, False))
-            except (ValueError, TypeError):
-                # Якщо висота не число, але не "0" або "0.0" - додаємо
-                if height_value not in ['0', '0.0', '', None]:
-                    data_lines.append((f"Н – {height_value} м", 12, True, False))
-            
-            # Продовжуємо з рештою даних
-            data_lines.extend([
-                ("без перешкод", 9, True, False),
-                (f"{target_data['detection']}", 9, True, False),
-                (f"М – {target_data['scale']}", 9, True, False)
-            ])
-            
-            # Додаємо рядки
-            for i, (text, font_size, italic, underline) in enumerate(data_lines):
-                if i > 0:
-                    para = cell.add_paragraph()
-                    para.alignment = WD_ALIGN_PARAGRAPH.LEFT
-                    para.paragraph_format.line_spacing = 1.15
-                    para.paragraph_format.space_before = Pt(0)
-                    para.paragraph_format.space_after = Pt(0)
-                    
-                    # Лівий відступ для всіх параграфів
-                    para.paragraph_format.left_indent = Pt(0)
-                    para.paragraph_format.right_indent = Pt(0)
-                
-                run = para.add_run(text)
-                run.font.name = 'Arial'
-                run.font.size = Pt(font_size)
-                run.italic = italic
-                run.underline = underline
-        
-        # Границі: всі сторони крім лівої (якщо показуємо границі)
-        if show_borders:
-            set_cell_borders(cell, top=True, bottom=True, left=False, right=True)
-        else:
-            set_cell_borders(cell, top=False, bottom=False, left=False, right=False)
-        
-    except Exception as e:
-        print(f"✗ Error configuring data cell: {e}")
+        height_float = float(height_value)
+        if height_float != 0.0:
+            data_lines.append((f"Н – {height_value} м", 12, True, False))
+    except (ValueError, TypeError):
+        # Якщо висота не число, але не "0" або "0.0" - додаємо
+        if height_value not in ['0', '0.0', '', None]:
+            data_lines.append((f"Н – {height_value} м", 12, True, False))
+    
+    # Продовжуємо з рештою даних
+    data_lines.extend([
+        ("без перешкод", 9, True, False),
+        (f"{target_data['detection']}", 9, True, False),
+        (f"М – {target_data['scale']}", 9, True, False)
+    ])
+    
+    # Додаємо рядки одним параграфом з XML; за помилки - по параграфу на рядок
+    try:
+        _add_data_lines_xml(cell, data_lines)
+    except Exception as xml_error:
+        log.warning("Data cell XML build failed, using paragraphs: %s", xml_error)
+        _add_data_lines_paragraphs(cell, data_lines)
+
+# Символьні стилі рядків даних: (розмір, курсив) -> ім'я стилю; run посилається на стиль
+# замість власних rFonts/sz/i
+ALBUM_DATA_STYLES = {
+    (12, True): 'AlbumDataLabel',
+    (9, True): 'AlbumDataSmall',
+}
+# Стиль параграфа рядків даних: 30pt зверху, інтервал 1,15, без відступів, зліва
+ALBUM_DATA_PARAGRAPH_STYLE = 'AlbumDataParagraph'
+
+def create_album_data_styles(doc):
+    """Створення стилів параграфа та символів для рядків даних таблиць альбому"""
+    for (font_size, italic), style_name in ALBUM_DATA_STYLES.items():
+        create_or_get_style(doc, style_name, WD_STYLE_TYPE.CHARACTER,
+                            **{'font.size': FONT_PT[font_size], 'font.italic': italic})
+    
+    create_or_get_style(doc, ALBUM_DATA_PARAGRAPH_STYLE, WD_STYLE_TYPE.PARAGRAPH, **{
+        'paragraph_format.space_before': FONT_PT[30],
+        'paragraph_format.space_after': FONT_PT[0],
+        'paragraph_format.line_spacing': 1.15,
+        'paragraph_format.left_indent': FONT_PT[0],
+        'paragraph_format.right_indent': FONT_PT[0],
+        'paragraph_format.alignment': WD_ALIGN_PARAGRAPH.LEFT,
+    })
 
+def _data_lines_xml(data_lines):
+    """XML одного параграфа з рядками даних (рядки розділені w:br)"""
+    runs = []
+    for i, (text, font_size, italic, underline) in enumerate(data_lines):
+        if i > 0:
+            runs.append('<w:r><w:br/></w:r>')
+        style_id = ALBUM_DATA_STYLES.get((font_size, italic))
+        if style_id:
+            run_properties = f'<w:rStyle w:val="{style_id}"/>'
+        else:
+            run_properties = ('<w:i/>' if italic else '') + f'<w:sz w:val="{font_size * 2}"/>'
+        if underline:
+            run_properties += '<w:u w:val="single"/>'
+        runs.append(f'<w:r><w:rPr>{run_properties}</w:rPr>'
+                    f'<w:t xml:space="preserve">{xml_escape(text)}</w:t></w:r>')
+    
+    # Інтервали, відступи та вирівнювання - у стилі параграфа, не в кожній комірці
+    return (f'<w:p {nsdecls("w")}><w:pPr><w:pStyle w:val="{ALBUM_DATA_PARAGRAPH_STYLE}"/></w:pPr>'
+            f'{"".join(runs)}</w:p>')
+
+def _add_data_lines_xml(cell, data_lines):
+    """Заміна порожнього параграфа комірки одним розібраним параграфом з даними"""
+    new_p = parse_xml(_data_lines_xml(data_lines))
+    placeholder = cell.paragraphs[0]._p
+    placeholder.addnext(new_p)
+    placeholder.getparent().remove(placeholder)
+
+def _add_data_lines_paragraphs(cell, data_lines):
+    """Рядки даних окремими параграфами через python-docx"""
+    for i, (text, font_size, italic, underline) in enumerate(data_lines):
+        para = cell.paragraphs[0] if i == 0 else cell.add_paragraph()
+        para.alignment = WD_ALIGN_PARAGRAPH.LEFT
+        para.paragraph_format.line_spacing = 1.15
+        para.paragraph_format.space_before = FONT_PT[30] if i == 0 else FONT_PT[0]  # 30pt зверху
+        para.paragraph_format.space_after = FONT_PT[0]
+        para.paragraph_format.left_indent = FONT_PT[0]
+        para.paragraph_format.right_indent = FONT_PT[0]
+        
+        run = para.add_run(text)
+        style_id = ALBUM_DATA_STYLES.get((font_size, italic))
+        if style_id:
+            run.style = style_id
+        else:
+            run.font.size = FONT_PT[font_size]
+            run.italic = italic
+        if underline:
+            run.underline = True
 
 def set_cell_width_mm(cell, width_mm):
     """Встановлення ФІКСОВАНОЇ ширини комірки БЕЗ внутрішніх відступів"""
-    try:
-        width_dxa = int(width_mm * 56.7)
-        
-        tc = cell._tc
-        tcPr = tc.tcPr
-        if tcPr is None:
-            tcPr = OxmlElement('w:tcPr')
-            tc.append(tcPr)
-        
-        # ФІКСОВАНА ширина
-        tcW = OxmlElement('w:tcW')
-        tcW.set(qn('w:type'), 'dxa')
-        tcW.set(qn('w:w'), str(width_dxa))
-        tcPr.append(tcW)
-        
-        # ЗАБОРОНА автоматичного підгону
-        tcFitText = OxmlElement('w:tcFitText')
-        tcFitText.set(qn('w:val'), '0')
-        tcPr.append(tcFitText)
-        
-        print(f"✓ Fixed cell width: {width_mm}mm (NO internal margins)")
-        
-    except Exception as e:
-        print(f"✗ Error setting fixed cell width: {e}")
+    width_dxa = int(width_mm * DXA_PER_MM)
+    tcPr = _get_or_add_tcPr(cell)
+    
+    # ФІКСОВАНА ширина
+    _append_template(tcPr, _CELL_WIDTH_XML % width_dxa)
+    
+    # ЗАБОРОНА автоматичного підгону
+    _append_template(tcPr, _CELL_NO_FIT_XML)
+    
+    log.debug("✓ Fixed cell width: %smm (NO internal margins)", width_mm)
 
 def set_cell_vertical_center(cell):
     """Вертикальне центрування комірки"""
-    try:
+    if _HAS_VALIGN_ENUM:
         cell.vertical_alignment = WD_ALIGN_VERTICAL.CENTER
-    except:
-        try:
-            tc = cell._tc
-            tcPr = tc.tcPr
-            if tcPr is None:
-                tcPr = OxmlElement('w:tcPr')
-                tc.append(tcPr)
-            
-            vAlign = OxmlElement('w:vAlign')
-            vAlign.set(qn('w:val'), 'center')
-            tcPr.append(vAlign)
-        except Exception as e:
-            print(f"Warning: Could not set vertical alignment: {e}")
+        return
+    
+    try:
+        _append_template(_get_or_add_tcPr(cell), _CELL_VALIGN_CENTER_XML)
+    except Exception as e:
+        log.warning("Could not set vertical alignment: %s", e)
+
+def _cell_borders_xml(top, bottom, left, right):
+    """XML tcBorders для заданої комбінації рамок"""
+    parts = []
+    for position, show_border in (('top', top), ('bottom', bottom), ('left', left), ('right', right)):
+        if show_border:
+            parts.append(f'<w:{position} w:val="single" w:sz="4" w:color="000000"/>')
+        else:
+            parts.append(f'<w:{position} w:val="none"/>')
+    return f'<w:tcBorders {nsdecls("w")}>{"".join(parts)}</w:tcBorders>'
 
 def set_cell_borders(cell, top=False, bottom=False, left=False, right=False):
     """Налаштування рамок комірки"""
-    try:
-        tc = cell._tc
-        tcPr = tc.tcPr
-        if tcPr is None:
-            tcPr = OxmlElement('w:tcPr')
-            tc.append(tcPr)
-        
-        tcBorders = OxmlElement('w:tcBorders')
-        
-        border_settings = [
-            ('top', top), ('bottom', bottom), ('left', left), ('right', right)
-        ]
-        
-        for position, show_border in border_settings:
-            border_element = OxmlElement(f'w:{position}')
-            if show_border:
-                border_element.set(qn('w:val'), 'single')
-                border_element.set(qn('w:sz'), '4')
-                border_element.set(qn('w:color'), '000000')
-            else:
-                border_element.set(qn('w:val'), 'none')
-            
-            tcBorders.append(border_element)
-        
-        tcPr.append(tcBorders)
-        
-    except Exception as e:
-        print(f"Warning: Could not set cell borders: {e}")
+    key = (bool(top), bool(bottom), bool(left), bool(right))
+    _get_or_add_tcPr(cell).append(copy.deepcopy(_BORDER_TEMPLATES[key]))
 
 def set_cell_background(cell, color_hex):
     """Встановлення кольору фону комірки"""
-    try:
-        tc = cell._tc
-        tcPr = tc.tcPr
-        if tcPr is None:
-            tcPr = OxmlElement('w:tcPr')
-            tc.append(tcPr)
-        
-        shd = OxmlElement('w:shd')
-        shd.set(qn('w:val'), 'clear')
-        shd.set(qn('w:color'), 'auto')
-        shd.set(qn('w:fill'), color_hex)
-        tcPr.append(shd)
-        
-    except Exception as e:
-        print(f"Warning: Could not set cell background: {e}")
+    _append_template(_get_or_add_tcPr(cell), _CELL_SHADING_XML % color_hex)
+
+# Маски ліній аналізу (L, обрізані до рамки лінії): (розмір, початок, кінець, товщина) -> (рамка, маска)
+LINE_OVERLAY_CACHE_SIZE = 32
+_LINE_OVERLAY_CACHE = collections.OrderedDict()
+
+def _line_overlay(image_size, start, end, width):
+    """Маска лінії в межах її рамки (кешується, малюється один раз на геометрію)"""
+    key = (image_size, start, end, width)
+    overlay = _LINE_OVERLAY_CACHE.get(key)
+    if overlay is not None:
+        _LINE_OVERLAY_CACHE.move_to_end(key)
+        return overlay
+    
+    image_width, image_height = image_size
+    margin = width // 2 + 1
+    left = max(0, int(min(start[0], end[0])) - margin)
+    top = max(0, int(min(start[1], end[1])) - margin)
+    right = min(image_width, int(max(start[0], end[0])) + margin + 1)
+    bottom = min(image_height, int(max(start[1], end[1])) + margin + 1)
+    
+    mask = Image.new('L', (max(1, right - left), max(1, bottom - top)), 0)
+    ImageDraw.Draw(mask).line(
+        [(start[0] - left, start[1] - top), (end[0] - left, end[1] - top)], fill=255, width=width
+    )
+    overlay = ((left, top), mask)
+    
+    _LINE_OVERLAY_CACHE[key] = overlay
+    while len(_LINE_OVERLAY_CACHE) > LINE_OVERLAY_CACHE_SIZE:
+        _LINE_OVERLAY_CACHE.popitem(last=False)
+    return overlay
+
+def draw_analysis_line(image, start, end, width=3):
+    """Чорна лінія аналізу: кешована маска накладається на зображення на місці (без копії)"""
+    origin, mask = _line_overlay(image.size, start, end, width)
+    image.paste(0, origin, mask)
+    return image
+
+def _composite_on_white(image):
+    """RGBA -> RGB на білому фоні одним векторизованим виразом NumPy"""
+    import numpy as np
+    
+    pixels = np.asarray(image, dtype=np.uint16)
+    alpha = pixels[..., 3:4]
+    # rgb*a + 255*(255-a) == 255*255 - (255-rgb)*a; +127 - округлення як у paste()
+    rgb = (255 * 255 + 127 - (255 - pixels[..., :3]) * alpha) // 255
+    return Image.fromarray(rgb.astype(np.uint8), 'RGB')
+
+def flatten_to_rgb(image):
+    """Приведення зображення до RGB (RGBA - на білому фоні); RGB повертається без копії"""
+    if image.mode == 'RGB':
+        return image
+    
+    if image.mode == 'RGBA':
+        alpha = image.getchannel('A')
+        if alpha.getextrema()[0] < 255:
+            if NUMPY_AVAILABLE:
+                return _composite_on_white(image)
+            rgb_image = Image.new('RGB', image.size, (255, 255, 255))
+            rgb_image.paste(image, mask=alpha)
+            return rgb_image
+        # Повністю непрозоре зображення - накладання на білий фон не потрібне
+    
+    return image.convert('RGB')
+
+def pil_to_qimage(image):
+    """PIL -> QImage у форматі RGB32 (найшвидший шлях QPainter), без проміжного файлу"""
+    image = flatten_to_rgb(image)
+    data = image.tobytes('raw', 'RGB')
+    qimage = QImage(data, image.width, image.height, image.width * 3, QImage.Format_RGB888)
+    # convertToFormat створює власну копію пікселів, тому буфер data потрібен лише до цього виклику
+    return qimage.convertToFormat(QImage.Format_RGB32)
 
 def create_processed_image_from_data(image_data):
     """Створення обробленого зображення з описом РЛС на зображенні"""
     try:
-        with Image.open(image_data['image_path']) as original_image:
-            if original_image.mode != 'RGB':
-                if original_image.mode == 'RGBA':
-                    rgb_image = Image.new('RGB', original_image.size, (255, 255, 255))
-                    rgb_image.paste(original_image, mask=original_image.split()[-1])
-                    final_image = rgb_image
-                else:
-                    final_image = original_image.convert('RGB')
-            else:
-                final_image = original_image.copy()
-        
-        draw = ImageDraw.Draw(final_image)
+        # Файл читається з великим буфером; після load() дані вже в пам'яті
+        with open(image_data['image_path'], 'rb', buffering=IMAGE_READ_BUFFER_SIZE) as source_file:
+            original_image = Image.open(source_file)
+            source_width = original_image.width
+            
+            # JPEG декодується одразу зі зменшенням (DCT-scale) до розміру в альбомі
+            original_image.draft('RGB', (ALBUM_IMAGE_TARGET_PX, ALBUM_IMAGE_TARGET_PX))
+            original_image.load()
+        
+        # Для RGB копія не потрібна - оригінал далі не використовується
+        final_image = flatten_to_rgb(original_image)
+        if final_image is not original_image:
+            original_image.close()
+        
+        # draft() зменшує лише в 2^n разів - доводимо до ширини комірки, щоб не кодувати зайві пікселі
+        if final_image.width > ALBUM_IMAGE_TARGET_PX:
+            target_height = max(1, round(final_image.height * ALBUM_IMAGE_TARGET_PX / final_image.width))
+            resized_image = final_image.resize((ALBUM_IMAGE_TARGET_PX, target_height), Image.BILINEAR)
+            final_image.close()
+            final_image = resized_image
+        
+        # Точка аналізу задана в пікселях оригіналу - масштабуємо під зменшене зображення
         analysis_point = image_data['analysis_point']
+        scale = final_image.width / source_width
         
         # Розрахунок позиції кінця лінії
         image_width = final_image.width
@@ -1174,30 +1323,133 @@ def create_processed_image_from_data(image_data):
         end_y = underline_y      # На висоті підкреслення
         
         # Малюємо лінію від точки аналізу до розрахованої позиції
-        draw.line([
-            (analysis_point['x'], analysis_point['y']), 
-            (end_x, end_y)
-        ], fill='black', width=3)
+        final_image = draw_analysis_line(
+            final_image, (analysis_point['x'] * scale, analysis_point['y'] * scale), (end_x, end_y),
+            width=max(1, round(3 * scale))
+        )
+        draw = ImageDraw.Draw(final_image)
         
         # ===== ДОДАЄМО ОПИС РЛС НА ЗОБРАЖЕННЯ =====
         if 'radar_description' in image_data and image_data['radar_description']['enabled']:
-            print("📝 Adding radar description to image")
+            log.debug("📝 Adding radar description to image")
             add_radar_description_to_image(draw, image_data['radar_description'], image_width, image_height)
         
         return final_image
         
     except Exception as e:
-        print(f"Error creating processed image: {e}")
+        log.error("Error creating processed image: %s", e)
         return None
 
-def add_radar_description_to_image(draw, radar_data, image_width, image_height):
-    """
-    Виправлена версія додавання опису РЛС з правильним розміщенням тексту
-    """
+# LRU-кеш закодованих зображень: повторні цілі та повторні експорти альбому не рендеряться знову
+PROCESSED_IMAGE_CACHE_SIZE = 64
+_PROCESSED_IMAGE_CACHE = collections.OrderedDict()
+
+def _processed_image_key(image_data):
+    """Ключ кешу: шлях і час зміни файлу, точка аналізу та дані опису РЛС"""
     try:
-        # ===== ТОЧНІ ПРОПОРЦІЙНІ РОЗРАХУНКИ =====
+        mtime = os.path.getmtime(image_data['image_path'])
+    except OSError:
+        mtime = None
+    analysis_point = image_data['analysis_point']
+    radar_data = image_data.get('radar_description') or {}
+    date_obj = radar_data.get('date')
+    if hasattr(date_obj, 'toString'):
+        date_obj = date_obj.toString('dd.MM.yyyy')
+    return (
+        image_data['image_path'], mtime,
+        analysis_point['x'], analysis_point['y'],
+        bool(radar_data.get('enabled')), str(date_obj),
+        radar_data.get('callsign'), radar_data.get('name'), radar_data.get('number')
+    )
+
+def _cache_processed_image(key, image_bytes):
+    _PROCESSED_IMAGE_CACHE[key] = image_bytes
+    _PROCESSED_IMAGE_CACHE.move_to_end(key)
+
+def trim_processed_image_cache():
+    """Обрізання кешу до PROCESSED_IMAGE_CACHE_SIZE найсвіжіших (після побудови альбому,
+    щоб під час побудови жодне зображення не рендерилося двічі)"""
+    while len(_PROCESSED_IMAGE_CACHE) > PROCESSED_IMAGE_CACHE_SIZE:
+        _PROCESSED_IMAGE_CACHE.popitem(last=False)
+
+def _encode_album_image(processed_image):
+    """Кодування у формат альбому: JPEG (baseline, без оптимізації Хаффмана) або PNG без втрат"""
+    buffer = io.BytesIO()
+    if ALBUM_IMAGE_FORMAT == 'PNG':
+        # Швидкий рівень zlib: чіткі лінії без артефактів, без дорогого підбору стиснення
+        processed_image.save(buffer, 'PNG', optimize=False, compress_level=1)
+    else:
+        processed_image.save(buffer, 'JPEG', quality=ALBUM_JPEG_QUALITY, optimize=False, progressive=False)
+    processed_image.close()
+    return buffer.getvalue()
+
+def encode_processed_image(image_data, processed_image=None):
+    """Кодування обробленого зображення (JPEG/PNG) у пам'яті (BytesIO) з кешуванням"""
+    key = _processed_image_key(image_data)
+    image_bytes = _PROCESSED_IMAGE_CACHE.get(key)
+    
+    if image_bytes is not None:
+        _PROCESSED_IMAGE_CACHE.move_to_end(key)
+    else:
+        if processed_image is None:
+            processed_image = create_processed_image_from_data(image_data)
+            if processed_image is None:
+                return None
         
-        # Табличка РЛС займає ці відсотки від зображення:
+        image_bytes = _encode_album_image(processed_image)
+        _cache_processed_image(key, image_bytes)
+    
+    return io.BytesIO(image_bytes)
+
+def _render_processed_image(image_data):
+    """Рендер обробленого зображення в байти JPEG/PNG (виконується в окремому процесі)"""
+    processed_image = create_processed_image_from_data(image_data)
+    if processed_image is None:
+        return None
+    
+    return _encode_album_image(processed_image)
+
+# Менше зображень дешевше відрендерити послідовно, ніж запускати процеси (spawn імпортує модуль і PyQt5)
+PARALLEL_RENDER_MIN_IMAGES = 4
+
+def prerender_processed_images(processed_images):
+    """Паралельний рендер зображень альбому в пул процесів (заповнює кеш зображень)"""
+    pending = {}
+    for image_data in processed_images:
+        key = _processed_image_key(image_data)
+        if key not in _PROCESSED_IMAGE_CACHE:
+            pending[key] = image_data
+    
+    if len(pending) < PARALLEL_RENDER_MIN_IMAGES:
+        return
+    
+    keys = list(pending)
+    try:
+        workers = min(len(keys), os.cpu_count() or 1)
+        # spawn: без fork багатопотокового Qt-процесу (пул створюється з потоку QThreadPool)
+        with ProcessPoolExecutor(max_workers=workers,
+                                 mp_context=multiprocessing.get_context("spawn")) as executor:
+            rendered = list(executor.map(_render_processed_image,
+                                         [pending[key] for key in keys], chunksize=4))
+    except Exception as e:
+        # Без пулу процесів зображення рендеряться послідовно в encode_processed_image
+        log.warning("⚠ Parallel image rendering unavailable, using serial mode: %s", e)
+        return
+    
+    for key, image_bytes in zip(keys, rendered):
+        if image_bytes is not None:
+            _cache_processed_image(key, image_bytes)
+    
+    log.info("✓ Pre-rendered %s images in %s processes", len(keys), workers)
+
+def add_radar_description_to_image(draw, radar_data, image_width, image_height):
+    """
+    Виправлена версія додавання опису РЛС з правильним розміщенням тексту
+    """
+    try:
+        # ===== ТОЧНІ ПРОПОРЦІЙНІ РОЗРАХУНКИ =====
+        
+        # Табличка РЛС займає ці відсотки від зображення:
         RADAR_BOX_WIDTH_PERCENT = 28.60   # 4.29см / 15см * 100% = 28.60%
         RADAR_BOX_HEIGHT_PERCENT = 19.54  # 2.54см / 13см * 100% = 19.54%
         
@@ -1217,10 +1469,10 @@ def add_radar_description_to_image(draw, radar_data, image_width, image_height):
         rect_x = margin_from_edge
         rect_y = image_height - rect_height - margin_from_edge
         
-        print(f"📏 Image: {image_width}x{image_height}px")
-        print(f"📦 Radar box: {rect_width}x{rect_height}px ({RADAR_BOX_WIDTH_PERCENT:.1f}% x {RADAR_BOX_HEIGHT_PERCENT:.1f}%)")
-        print(f"📍 Position: ({rect_x}, {rect_y})")
-        print(f"📐 Padding: {padding_horizontal}x{padding_vertical}px")
+        log.debug("📏 Image: %sx%spx", image_width, image_height)
+        log.debug("📦 Radar box: %sx%spx (%.1f%% x %.1f%%)", rect_width, rect_height, RADAR_BOX_WIDTH_PERCENT, RADAR_BOX_HEIGHT_PERCENT)
+        log.debug("📍 Position: (%s, %s)", rect_x, rect_y)
+        log.debug("📐 Padding: %sx%spx", padding_horizontal, padding_vertical)
         
         # ===== 1. МАЛЮЄМО ПРЯМОКУТНИК З ПРОЗОРИМ ФОНОМ =====
         border_width = max(2, int(rect_width * 0.008))
@@ -1258,10 +1510,10 @@ def add_radar_description_to_image(draw, radar_data, image_width, image_height):
         if number and number.strip():
             text_lines.append(f"№ {number.strip()}")  # Додано пробіл після №
         
-        print(f"📝 Text lines: {text_lines}")
+        log.debug("📝 Text lines: %s", text_lines)
         
         if not text_lines:
-            print("⚠️ No content for radar description")
+            log.warning("⚠️ No content for radar description")
             return
         
         # ===== 3. РОЗРАХУНОК РОЗМІРУ ШРИФТУ=====
@@ -1287,44 +1539,44 @@ def add_radar_description_to_image(draw, radar_data, image_width, image_height):
         if total_text_height > available_height:
             line_height = available_height // len(text_lines)
         
-        print(f"📝 Text area: {available_height}px height, {line_height}px line height")
-        print(f"📏 Font size: {font_size}px (corresponds to Arial 12pt)")
+        log.debug("📝 Text area: %spx height, %spx line height", available_height, line_height)
+        log.debug("📏 Font size: %spx (corresponds to Arial 12pt)", font_size)
         
         for i, line in enumerate(text_lines):
             current_y = text_y + (i * line_height)
             
             # Перевіряємо чи текст поміщається в прямокутник
             if current_y + font_size > rect_y + rect_height - padding_vertical:
-                print(f"⚠️ Text line {i+1} exceeds rectangle bounds")
+                log.warning("⚠️ Text line %s exceeds rectangle bounds", i+1)
                 break
             
             # СПРОЩЕНА обробка всіх рядків ОДНАКОВО
             try:
                 draw.text((text_x, current_y), line, fill='black', font=font)
-                print(f"✓ Line {i+1}: '{line}' at ({text_x}, {current_y})")
+                log.debug("✓ Line %s: '%s' at (%s, %s)", i+1, line, text_x, current_y)
             except Exception as text_error:
-                print(f"⚠️ Error drawing text line {i+1}: {text_error}")
+                log.error("⚠️ Error drawing text line %s: %s", i+1, text_error)
         
-        print("✅ Radar description added with exact Word proportions!")
+        log.debug("✅ Radar description added with exact Word proportions!")
         
         # ===== ПІДСУМКОВА ІНФОРМАЦІЯ ВІДПОВІДНОСТІ ЗРАЗКУ =====
         actual_width_percent = (rect_width / image_width) * 100
         actual_height_percent = (rect_height / image_height) * 100
         
-        print(f"📊 Final proportions: {actual_width_percent:.1f}% x {actual_height_percent:.1f}%")
-        print(f"📏 Margins: horizontal={padding_horizontal}px ({PADDING_HORIZONTAL_PERCENT:.1f}%), vertical={padding_vertical}px ({PADDING_VERTICAL_PERCENT:.1f}%)")
-        print(f"🔤 Font: Arial {font_size}px italic (corresponds to 12pt in Word)")
-        print(f"📐 Line height: {line_height}px (single spacing like Word)")
+        log.debug("📊 Final proportions: %.1f%% x %.1f%%", actual_width_percent, actual_height_percent)
+        log.debug("📏 Margins: horizontal=%spx (%.1f%%), vertical=%spx (%.1f%%)", padding_horizontal, PADDING_HORIZONTAL_PERCENT, padding_vertical, PADDING_VERTICAL_PERCENT)
+        log.debug("🔤 Font: Arial %spx italic (corresponds to 12pt in Word)", font_size)
+        log.debug("📐 Line height: %spx (single spacing like Word)", line_height)
         
     except Exception as e:
-        print(f"❌ Error adding radar description: {e}")
+        log.error("❌ Error adding radar description: %s", e)
         import traceback
         traceback.print_exc()
 
 def create_title_page(doc, title_data):
     """Створення титульної сторінки з окремими абзацами для кожного рядка заголовку"""
     try:
-        print("=== Creating title page with separate paragraphs for each title line ===")
+        log.info("=== Creating title page with separate paragraphs for each title line ===")
         
         # Отримуємо дані з шаблону
         date = title_data['date']
@@ -1344,7 +1596,7 @@ def create_title_page(doc, title_data):
         section.right_margin = Cm(margins['right'])
         section.bottom_margin = Cm(margins['bottom'])
         
-        print(f"✅ Margins set: left={margins['left']}cm, top={margins['top']}cm, right={margins['right']}cm, bottom={margins['bottom']}cm")
+        log.debug("✅ Margins set: left=%scm, top=%scm, right=%scm, bottom=%scm", margins['left'], margins['top'], margins['right'], margins['bottom'])
         
         # Створюємо стилі для титульної сторінки
         from docx.enum.style import WD_STYLE_TYPE
@@ -1360,7 +1612,6 @@ def create_title_page(doc, title_data):
             top_spacer_style.paragraph_format.space_before = Pt(0)
             top_spacer_style.paragraph_format.space_after = Pt(10)     # 10pt після абзацу
             top_spacer_style.font.size = Pt(31)
-            top_spacer_style.font.name = 'Arial'
         
         # Стиль для заголовку (28pt + центрування + 1см відступ першого рядка)
         try:
@@ -1372,7 +1623,6 @@ def create_title_page(doc, title_data):
             title_main_style.paragraph_format.space_before = Pt(0)
             title_main_style.paragraph_format.space_after = Pt(0)
             title_main_style.font.size = Pt(28)
-            title_main_style.font.name = 'Arial'
             title_main_style.font.bold = True
         
         # Стиль для середніх абзаців (28pt + 1см відступ + 1,15 множна + БЕЗ інтервалу після)
@@ -1386,7 +1636,6 @@ def create_title_page(doc, title_data):
             middle_spacer_style.paragraph_format.space_before = Pt(0)
             middle_spacer_style.paragraph_format.space_after = Pt(0)     # БЕЗ інтервалу після
             middle_spacer_style.font.size = Pt(28)
-            middle_spacer_style.font.name = 'Arial'
         
         # Стиль для підписів (16pt + БЕЗ лівого відступу + 1см відступ першого рядка)
         try:
@@ -1399,7 +1648,6 @@ def create_title_page(doc, title_data):
             signature_style.paragraph_format.space_before = Pt(0)
             signature_style.paragraph_format.space_after = Pt(0)
             signature_style.font.size = Pt(16)
-            signature_style.font.name = 'Arial'
             signature_style.font.bold = True
         
         # Стиль для розділювача між підписами (9pt + 1см відступ першого рядка + 1,15 множна)
@@ -1413,7 +1661,6 @@ def create_title_page(doc, title_data):
             signature_spacer_style.paragraph_format.space_before = Pt(0)
             signature_spacer_style.paragraph_format.space_after = Pt(0)
             signature_spacer_style.font.size = Pt(9)                           # 9pt розмір
-            signature_spacer_style.font.name = 'Arial'
         
         # Стиль для кінцевого абзацу (16pt + 1см відступ першого рядка)
         try:
@@ -1426,13 +1673,12 @@ def create_title_page(doc, title_data):
             final_style.paragraph_format.space_before = Pt(0)
             final_style.paragraph_format.space_after = Pt(0)
             final_style.font.size = Pt(16)
-            final_style.font.name = 'Arial'
         
-        print("✅ Title page styles created with correct spacing:")
-        print("   • Top spacers: 1.15x line spacing (MULTIPLE) + 10pt after paragraph")
-        print("   • Middle spacers: 1.15x line spacing (MULTIPLE) + 0pt after paragraph")
-        print("   • Signatures: 1.15x line spacing, NO left indent, 1cm first line indent")
-        print("   • Signature spacer: 9pt + 1.15x line spacing")
+        log.debug("✅ Title page styles created with correct spacing:")
+        log.debug("   • Top spacers: 1.15x line spacing (MULTIPLE) + 10pt after paragraph")
+        log.debug("   • Middle spacers: 1.15x line spacing (MULTIPLE) + 0pt after paragraph")
+        log.debug("   • Signatures: 1.15x line spacing, NO left indent, 1cm first line indent")
+        log.debug("   • Signature spacer: 9pt + 1.15x line spacing")
         
         # 4 абзаци зверху
         for i in range(4):
@@ -1444,12 +1690,12 @@ def create_title_page(doc, title_data):
         doc.add_paragraph(f"військової частини {unit_info}", style=title_main_style)
         doc.add_paragraph(format_ukrainian_date(date), style=title_main_style)
         
-        print("✅ Signatures created as separate paragraphs:")
-        print("   • Commander title paragraph")
-        print("   • Commander name paragraph") 
-        print("   • 9pt spacer paragraph")
-        print("   • Chief title paragraph")
-        print("   • Chief name paragraph")
+        log.debug("✅ Signatures created as separate paragraphs:")
+        log.debug("   • Commander title paragraph")
+        log.debug("   • Commander name paragraph")
+        log.debug("   • 9pt spacer paragraph")
+        log.debug("   • Chief title paragraph")
+        log.debug("   • Chief name paragraph")
         
         # 7 абзаців після заголовку
         for i in range(7):
@@ -1466,7 +1712,7 @@ def create_title_page(doc, title_data):
             tab_stops.clear_all()
             tab_stops.add_tab_stop(Cm(15), WD_TAB_ALIGNMENT.RIGHT)
         except Exception as tab_error:
-            print(f"Warning: Could not set tab stops: {tab_error}")
+            log.warning("Could not set tab stops: %s", tab_error)
         
         # 2. Другий абзац командира - звання та ім'я
         commander_name_para = doc.add_paragraph(style=signature_style)
@@ -1474,12 +1720,9 @@ def create_title_page(doc, title_data):
         commander_name_para.add_run(f"\t{commander_info['name']}")
         
         # Налаштовуємо табуляцію для імені
-        try:
-            tab_stops = commander_name_para.paragraph_format.tab_stops
-            tab_stops.clear_all()
-            tab_stops.add_tab_stop(Cm(15), WD_TAB_ALIGNMENT.RIGHT)
-        except:
-            pass
+        tab_stops = commander_name_para.paragraph_format.tab_stops
+        tab_stops.clear_all()
+        tab_stops.add_tab_stop(Cm(15), WD_TAB_ALIGNMENT.RIGHT)
         
         # 3. Розділювач між підписами (9pt абзац)
         spacer_para = doc.add_paragraph(" ", style=signature_spacer_style)
@@ -1488,12 +1731,9 @@ def create_title_page(doc, title_data):
         chief_title_para = doc.add_paragraph(f"Начальник штабу військової частини {unit_info}", style=signature_style)
         
         # Налаштовуємо табуляцію
-        try:
-            tab_stops = chief_title_para.paragraph_format.tab_stops
-            tab_stops.clear_all()
-            tab_stops.add_tab_stop(Cm(15), WD_TAB_ALIGNMENT.RIGHT)
-        except:
-            pass
+        tab_stops = chief_title_para.paragraph_format.tab_stops
+        tab_stops.clear_all()
+        tab_stops.add_tab_stop(Cm(15), WD_TAB_ALIGNMENT.RIGHT)
         
         # 5. Другий абзац начальника штабу - звання та ім'я
         chief_name_para = doc.add_paragraph(style=signature_style)
@@ -1501,23 +1741,61 @@ def create_title_page(doc, title_data):
         chief_name_para.add_run(f"\t{chief_of_staff_info['name']}")
         
         # Налаштовуємо табуляцію
-        try:
-            tab_stops = chief_name_para.paragraph_format.tab_stops
-            tab_stops.clear_all()
-            tab_stops.add_tab_stop(Cm(15), WD_TAB_ALIGNMENT.RIGHT)
-        except:
-            pass
+        tab_stops = chief_name_para.paragraph_format.tab_stops
+        tab_stops.clear_all()
+        tab_stops.add_tab_stop(Cm(15), WD_TAB_ALIGNMENT.RIGHT)
         
         # Кінцевий абзац
         doc.add_paragraph(" ", style=final_style)
         
-        print("✅ Title page created successfully with separate paragraphs for title lines")
+        log.info("✅ Title page created successfully with separate paragraphs for title lines")
         
     except Exception as e:
-        print(f"✗ Error creating title page: {e}")
+        log.error("✗ Error creating title page: %s", e)
         import traceback
         traceback.print_exc()
 
+# Розширення файлів зображень для перегляду папки
+IMAGE_EXTENSIONS = frozenset(('.jpg', '.jpeg', '.png', '.bmp', '.gif', '.tiff', '.tif'))
+
+# Списки зображень папок: шлях папки -> (mtime папки, відсортовані шляхи); повторне відкриття без scandir
+FOLDER_SCAN_CACHE_SIZE = 8
+_FOLDER_SCAN_CACHE = collections.OrderedDict()
+
+def _list_image_paths(folder_path):
+    """Відсортовані шляхи зображень папки (кешуються до зміни mtime папки)"""
+    # mtime папки змінюється при додаванні, видаленні чи перейменуванні файлів,
+    # але не при перезаписі файлу на місці - тому кешуються лише шляхи, не mtime файлів
+    folder_mtime = os.stat(folder_path).st_mtime
+    cached = _FOLDER_SCAN_CACHE.get(folder_path)
+    if cached is not None and cached[0] == folder_mtime:
+        _FOLDER_SCAN_CACHE.move_to_end(folder_path)
+        return cached[1]
+    
+    with os.scandir(folder_path) as entries:
+        image_paths = tuple(sorted(
+            entry.path
+            for entry in entries
+            if os.path.splitext(entry.name)[1].lower() in IMAGE_EXTENSIONS and entry.is_file()
+        ))
+    
+    _FOLDER_SCAN_CACHE[folder_path] = (folder_mtime, image_paths)
+    _FOLDER_SCAN_CACHE.move_to_end(folder_path)
+    while len(_FOLDER_SCAN_CACHE) > FOLDER_SCAN_CACHE_SIZE:
+        _FOLDER_SCAN_CACHE.popitem(last=False)
+    return image_paths
+
+def scan_image_folder(folder_path):
+    """Відсортований список (шлях, mtime) зображень папки; mtime файлів завжди актуальні"""
+    image_entries = []
+    for image_path in _list_image_paths(folder_path):
+        try:
+            image_entries.append((image_path, os.stat(image_path).st_mtime))
+        except OSError:
+            # Файл зник між переліком і stat
+            continue
+    return image_entries
+
 def resource_path(relative_path):
     try:
         base_path = sys._MEIPASS
@@ -1915,6 +2193,63 @@ class TitlePageTemplateDialog(QDialog):
         
         super().accept()
 
+# ===== ПОПЕРЕДНЄ ЗАВАНТАЖЕННЯ СУСІДНІХ ЗОБРАЖЕНЬ =====
+
+# Скільки декодованих зображень тримати для швидкого переходу між сусідніми
+IMAGE_PREFETCH_POOL_SIZE = 3
+
+
+class ImagePrefetchSignals(QObject):
+    """Сигнали фонового декодування зображень"""
+    loaded = pyqtSignal(str, object)
+
+
+class ImagePrefetchLoader(QRunnable):
+    """Фонове декодування зображення у пам'ять"""
+
+    def __init__(self, image_path, signals):
+        super().__init__()
+        self.image_path = image_path
+        self.signals = signals
+
+    def run(self):
+        try:
+            image = Image.open(self.image_path)
+            image.load()
+            # Приведення до RGB теж виконується тут, а не в головному потоці при відкритті
+            image = flatten_to_rgb(image)
+        except Exception as e:
+            log.debug("Prefetch failed for %s: %s", self.image_path, e)
+            return
+        self.signals.loaded.emit(self.image_path, image)
+
+
+# ===== ФОНОВЕ СТВОРЕННЯ АЛЬБОМУ =====
+
+class AlbumExportSignals(QObject):
+    """Сигнали фонового створення альбому"""
+    finished = pyqtSignal(bool)
+
+
+class AlbumExportTask(QRunnable):
+    """Створення альбому .docx поза GUI-потоком (документ не спільний з GUI)"""
+
+    def __init__(self, processed_images, title_data, file_path, signals):
+        super().__init__()
+        self.processed_images = processed_images
+        self.title_data = title_data
+        self.file_path = file_path
+        self.signals = signals
+
+    def run(self):
+        try:
+            success = create_complete_album(self.processed_images, self.title_data, self.file_path)
+        except Exception as e:
+            log.error("Album export failed: %s", e)
+            success = False
+        self.signals.finished.emit(success)
+
+
 # ===== ОСНОВНИЙ КЛАС GUI =====
 
 class AzimuthGUI(QMainWindow):
@@ -1923,18 +2258,59 @@ class AzimuthGUI(QMainWindow):
         self.processor = None
         self.current_image_path = None
         self.current_click = None
+        self._tooltip_shown = False
         self.scale_factor_x = 1.0
         self.scale_factor_y = 1.0
         self.offset_x = 0
         self.offset_y = 0
         self.current_folder = None
         
+        # Віджети, що створюються в init_ui (None до побудови інтерфейсу)
+        self.image_label = None
+        self.browser_widget = None
+        self.main_splitter = None
+        
         self.current_language = 'UKRAINIAN'  # Default language
         self.translations = Translations()
+        self._active_tr = self.translations.for_language(self.current_language)
+        self._refresh_cached_labels()
+        
+        # Відкладене перерахування розмітки після зміни розміру вікна
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.timeout.connect(self._do_resize_layout)
+        
+        # Повідомлення про редагування полів РЛС пишуться один раз після паузи у введенні
+        self._pending_radar_log = None
+        self._radar_log_timer = QTimer(self)
+        self._radar_log_timer.setSingleShot(True)
+        self._radar_log_timer.setInterval(300)
+        self._radar_log_timer.timeout.connect(self._flush_radar_log)
+        
+        # Перетягування точки аналізу: не частіше одного перемальовування за кадр
+        self._pending_drag = None
+        self._drag_timer = QTimer(self)
+        self._drag_timer.setSingleShot(True)
+        self._drag_timer.setTimerType(Qt.CoarseTimer)
+        self._drag_timer.setInterval(16)
+        self._drag_timer.timeout.connect(self._flush_drag)
+        
+        # Під час перетягування: швидке масштабування і лише мітки звіту;
+        # згладжене зображення і текст результатів - після зупинки руху
+        self._results_header_key = None
+        self._results_header = []
+        self._idle_timer = QTimer(self)
+        self._idle_timer.setSingleShot(True)
+        self._idle_timer.setInterval(150)
+        self._idle_timer.timeout.connect(self._finish_interactive_update)
         
         self.scale_edge_mode = False
         self.scale_edge_point = None
         self.custom_scale_distance = None
+        
+        # Значення масштабу з scale_combo і множник пікселі -> дальність (None = перерахувати)
+        self._scale_value = 300
+        self._range_scale = None
         self.center_setting_mode = False
         
         self.current_target_number = "0001"
@@ -1952,6 +2328,19 @@ class AzimuthGUI(QMainWindow):
         
         self.processed_images = []
 
+        # LRU-пул декодованих сусідніх зображень (шлях -> PIL Image)
+        self._image_pool = collections.OrderedDict()
+        self._prefetch_pending = set()
+        self._prefetch_pool = QThreadPool(self)
+        self._prefetch_pool.setMaxThreadCount(1)
+        self._prefetch_signals = ImagePrefetchSignals()
+        self._prefetch_signals.loaded.connect(self.on_image_prefetched)
+
+        # Створення альбому у фоновому потоці; контекст для повідомлення після завершення
+        self._album_export_signals = AlbumExportSignals()
+        self._album_export_signals.finished.connect(self.on_album_export_finished)
+        self._album_export_context = None
+
         # Ініціалізація документації
         self.doc_manager = DocumentationManager()
         self.doc_manager.create_documentation_files()  # Створити файли при запуску
@@ -1966,136 +2355,7 @@ class AzimuthGUI(QMainWindow):
             'custom_scale_distance': None,
             'scale_value': "300"
         }
-        self.setStyleSheet("""
-            QDateEdit {
-                border: 1px solid #dee2e6;
-                border-radius: 4px;
-                padding: 6px 10px;
-                background-color: white;
-                font: 12pt "Segoe UI", Arial, sans-serif;
-                color: #495057;
-                min-height: 22px;
-            }
-            QDateEdit:hover {
-                border: 1px solid #adb5bd;
-                background-color: #f8f9fa;
-            }
-            QDateEdit:focus {
-                border: 1px solid #6c757d;
-            }
-            QDateEdit:disabled {
-                background-color: #f5f5f5;
-                color: #6c757d;
-                border: 1px solid #e9ecef;
-            }
-
-            /* МІНІМАЛІСТИЧНИЙ ВИПАДНИЙ СПИСОК */
-            QDateEdit::drop-down {
-                border: none;
-                background-color: transparent;
-                width: 18px;
-                margin-right: 4px;
-            }
-            QDateEdit::drop-down:hover {
-                background-color: #f8f9fa;
-                border-radius: 3px;
-            }
-
-            /* ПРОСТА СТРІЛКА */
-            QDateEdit::down-arrow {
-                image: none;
-                border-left: 4px solid transparent;
-                border-right: 4px solid transparent;
-                border-top: 5px solid #6c757d;
-                margin-top: 1px;
-            }
-            QDateEdit::down-arrow:hover {
-                border-top-color: #495057;
-            }
-            QCalendarWidget {
-                background-color: white;
-                color: #495057;
-                border: 1px solid #dee2e6;
-                border-radius: 6px;
-                font-family: "Segoe UI", Arial, sans-serif;
-            }
-            QCalendarWidget QWidget#qt_calendar_navigationbar {
-                background-color: #f8f9fa;
-                border-bottom: 1px solid #e9ecef;
-                border-top-left-radius: 6px;
-                border-top-right-radius: 6px;
-                padding: 4px;
-            }
-            QCalendarWidget QToolButton {
-                color: #6c757d;
-                background-color: transparent;
-                border: 1px solid transparent;
-                border-radius: 4px;
-                margin: 1px;
-                padding: 4px 8px;
-                font-weight: normal;
-                min-width: 24px;
-                min-height: 24px;
-            }
-            QCalendarWidget QToolButton:hover {
-                background-color: #e9ecef;
-                color: #495057;
-                border: 1px solid #adb5bd;
-            }
-            QCalendarWidget QToolButton#qt_calendar_prevmonth {
-                qproperty-text: "‹";
-                font-size: 16pt;
-                font-weight: bold;
-            }
-            QCalendarWidget QToolButton#qt_calendar_nextmonth {
-                qproperty-text: "›";
-                font-size: 16pt;
-                font-weight: bold;
-            }
-            QCalendarWidget QSpinBox {
-                color: #495057;
-                background-color: white;
-                border: 1px solid #dee2e6;
-                border-radius: 3px;
-                font-size: 12pt;
-                font-weight: normal;
-                padding: 2px 6px;
-                min-width: 60px;
-                margin: 1px;
-            }
-            QCalendarWidget QSpinBox:hover {
-                border: 1px solid #adb5bd;
-                background-color: #f8f9fa;
-            }
-            QCalendarWidget QHeaderView::section {
-                color: #6c757d;
-                background-color: #f8f9fa;
-                border: none;
-                border-bottom: 1px solid #e9ecef;
-                font-weight: 500;
-                padding: 6px 2px;
-                font-size: 11pt;
-            }
-            QCalendarWidget QAbstractItemView {
-                background-color: white;
-                color: #495057;
-                font-size: 12pt;
-                border: none;
-                selection-background-color: #495057;
-                selection-color: white;
-            }
-            QCalendarWidget QAbstractItemView:item:selected {
-                background-color: #495057;
-                color: white;
-                border-radius: 3px;
-                font-weight: normal;
-            }
-            QCalendarWidget QAbstractItemView:item:focus {
-                background-color: #e9ecef;
-                color: #495057;
-                border: 1px solid #adb5bd;
-                border-radius: 3px;
-            }""")
+        self._has_saved_settings = False  # Чи відрізняються збережені налаштування від типових
         # Встановлюємо іконку вікна
         icon_path = resource_path('netaz.ico')
         if os.path.exists(icon_path):
@@ -2119,7 +2379,7 @@ class AzimuthGUI(QMainWindow):
         focused_widget = self.focusWidget()
         if focused_widget and isinstance(focused_widget, (QLineEdit, QComboBox, QDateEdit)):
             # Передаємо фокус зображенню для збереження функціональності миші
-            if hasattr(self, 'image_label'):
+            if self.image_label is not None:
                 self.image_label.setFocus()
             else:
                 self.setFocus()
@@ -2171,19 +2431,10 @@ class AzimuthGUI(QMainWindow):
         self.save_current_grid_settings()
         
         # Оновлюємо точку аналізу якщо є
-        if self.current_click:
-            azimuth, range_val = self.calculate_azimuth_range(
-                self.current_click['x'], self.current_click['y']
-            )
-            self.current_click['azimuth'] = azimuth
-            self.current_click['range'] = range_val
-        
-        self.display_image()
-        self.update_results_display()
-        self.update_report_data()
+        self.refresh_views(recompute_click=True)
         
         #  ПОКАЗУЄМО ЗУМ НА НОВІЙ ПОЗИЦІЇ ЦЕНТРУ
-        if hasattr(self, 'image_label'):
+        if self.image_label is not None:
             self.image_label.zoom_widget.show_zoom()
             self.image_label.zoom_widget.update_cursor_position(
                 self.processor.center_x, self.processor.center_y
@@ -2215,19 +2466,10 @@ class AzimuthGUI(QMainWindow):
         self.save_current_grid_settings()
         
         # Оновлюємо точку аналізу якщо є
-        if self.current_click:
-            azimuth, range_val = self.calculate_azimuth_range(
-                self.current_click['x'], self.current_click['y']
-            )
-            self.current_click['azimuth'] = azimuth
-            self.current_click['range'] = range_val
-        
-        self.display_image()
-        self.update_results_display()
-        self.update_report_data()
+        self.refresh_views(recompute_click=True)
         
         # ПОКАЗУЄМО ЗУМ НА НОВІЙ ПОЗИЦІЇ КРАЮ МАСШТАБУ
-        if hasattr(self, 'image_label'):
+        if self.image_label is not None:
             self.image_label.zoom_widget.show_zoom()
             self.image_label.zoom_widget.update_cursor_position(new_x, new_y)
     
@@ -2259,20 +2501,33 @@ class AzimuthGUI(QMainWindow):
     def update_radar_callsign(self, text):
         """Оновлення позивного РЛС"""
         self.radar_callsign = text
-        if self.radar_description_enabled and text:
-            self.add_result(f"📡 Позивний РЛС: {text}")
+        self._queue_radar_log("callsign", f"📡 Позивний РЛС: {text}" if text else None)
 
     def update_radar_name(self, text):
         """Оновлення назви РЛС"""
         self.radar_name = text
-        if self.radar_description_enabled and text:
-            self.add_result(f"📋 Назва РЛС: {text}")
+        self._queue_radar_log("name", f"📋 Назва РЛС: {text}" if text else None)
 
     def update_radar_number(self, text):
         """Оновлення номера РЛС"""
         self.radar_number = text
-        if self.radar_description_enabled and text:
-            self.add_result(f"🔢 Номер РЛС: {text}")
+        self._queue_radar_log("number", f"🔢 Номер РЛС: {text}" if text else None)
+    
+    def _queue_radar_log(self, field, message):
+        """Відкласти запис у результати до паузи у введенні (значення поля зберігається одразу)"""
+        if not self.radar_description_enabled:
+            return
+        if self._pending_radar_log and self._pending_radar_log[0] != field:
+            # Перейшли до іншого поля - попереднє повідомлення пишемо одразу
+            self._flush_radar_log()
+        self._pending_radar_log = (field, message)
+        self._radar_log_timer.start()
+    
+    def _flush_radar_log(self):
+        self._radar_log_timer.stop()
+        if self._pending_radar_log and self._pending_radar_log[1]:
+            self.add_result(self._pending_radar_log[1])
+        self._pending_radar_log = None
 
     def get_radar_description_data(self):
         """Отримання даних опису РЛС"""
@@ -2288,55 +2543,51 @@ class AzimuthGUI(QMainWindow):
         }
     
     def tr(self, key):
-        return self.translations.get(self.current_language, key)
+        return self._active_tr.get(key, key)
     
     def set_language(self, language):
         self.current_language = language
+        self._active_tr = self.translations.for_language(language)
+        self._refresh_cached_labels()
         self.update_interface_text()
         
         for lang, action in self.language_actions.items():
             action.setChecked(lang == language)
     
+    def _refresh_cached_labels(self):
+        """Перекладені шаблони рядків, що форматуються на кожен рух миші"""
+        self._hover_tooltip_format = (f"{self.tr('azimuth')}: {{azimuth:.0f}}°\n"
+                                      f"{self.tr('range')}: {{range:.0f}} км")
+    
+    # Віджети з перекладним текстом: (атрибут, ключ перекладу)
+    _TRANSLATABLES = (
+        ('control_title', 'controls'),
+        ('report_title', 'report_data'),
+        ('browser_label', 'photo_browser'),
+        ('open_image_btn', 'open_image'),
+        ('open_folder_btn', 'open_folder'),
+        ('save_image_btn', 'save_current_image'),
+        ('export_new_btn', 'create_new_album'),
+        ('export_add_btn', 'add_to_existing_album'),
+        ('scale_edge_btn', 'set_scale_edge'),
+        ('set_center_btn', 'set_center'),
+        ('file_ops_label', 'file_operations'),
+        ('azimuth_grid_label', 'azimuth_grid'),
+        ('move_center_label', 'move_center'),
+        ('results_label', 'results'),
+        ('batch_label', 'batch_processing'),
+        ('save_current_btn', 'save_current_image_data'),
+    )
+    
     def update_interface_text(self):
         self.setWindowTitle(self.tr("window_title"))
-        self.create_menu_bar()
-        
-        if hasattr(self, 'control_title'):
-            self.control_title.setText(self.tr("controls"))
-        if hasattr(self, 'report_title'):
-            self.report_title.setText(self.tr("report_data"))
-        if hasattr(self, 'browser_label'):
-            self.browser_label.setText(self.tr("photo_browser"))
-        
-        if hasattr(self, 'open_image_btn'):
-            self.open_image_btn.setText(self.tr("open_image"))
-        if hasattr(self, 'open_folder_btn'):
-            self.open_folder_btn.setText(self.tr("open_folder"))
-        if hasattr(self, 'save_image_btn'):
-            self.save_image_btn.setText(self.tr("save_current_image"))
-        if hasattr(self, 'export_new_btn'):
-            self.export_new_btn.setText(self.tr("create_new_album"))
-        if hasattr(self, 'export_add_btn'):
-            self.export_add_btn.setText(self.tr("add_to_existing_album"))
-        if hasattr(self, 'scale_edge_btn'):
-            self.scale_edge_btn.setText(self.tr("set_scale_edge"))
-        if hasattr(self, 'set_center_btn'):
-            self.set_center_btn.setText(self.tr("set_center"))
-        
-        if hasattr(self, 'file_ops_label'):
-            self.file_ops_label.setText(self.tr("file_operations"))
-        if hasattr(self, 'azimuth_grid_label'):
-            self.azimuth_grid_label.setText(self.tr("azimuth_grid"))
-        if hasattr(self, 'move_center_label'):
-            self.move_center_label.setText(self.tr("move_center"))
-        if hasattr(self, 'results_label'):
-            self.results_label.setText(self.tr("results"))
-        
-        # Batch processing переклади
-        if hasattr(self, 'batch_label'):
-            self.batch_label.setText(self.tr("batch_processing"))
-        if hasattr(self, 'save_current_btn'):
-            self.save_current_btn.setText(self.tr("save_current_image_data"))
+        
+        self._retranslate_menu_bar()
+        
+        for attr, key in self._TRANSLATABLES:
+            widget = getattr(self, attr, None)
+            if widget is not None:
+                widget.setText(self.tr(key))
         
         if not self.current_image_path:
             self.image_label.setText(self.tr("open_instruction"))
@@ -2344,51 +2595,189 @@ class AzimuthGUI(QMainWindow):
         if self.processor:
             self.update_results_display()
 
-    def init_ui(self):
-        self.setWindowTitle(self.tr("window_title"))
-        
-        default_width = 1400
-        default_height = 900
-        min_width = 1000  
-        min_height = 700
-        self.setMinimumSize(min_width, min_height)
-        self.setWindowFlags(Qt.Window)
-        self.resize(default_width, default_height)
-        self.showMaximized()
-        
-        self.create_menu_bar()
-        
-        central_widget = QWidget()
-        self.setCentralWidget(central_widget)
-        
-        main_layout = QHBoxLayout()
-        central_widget.setLayout(main_layout)
-        
-        main_splitter = QSplitter(Qt.Horizontal)
-        main_layout.addWidget(main_splitter)
-        
-        self.create_control_panel(main_splitter)
-        self.create_vertical_browser_panel(main_splitter)
-        self.create_image_panel(main_splitter)
-        self.create_report_panel(main_splitter)
-        
-        main_splitter.setStretchFactor(0, 0)
-        main_splitter.setStretchFactor(1, 0)
-        main_splitter.setStretchFactor(2, 1)
-        main_splitter.setStretchFactor(3, 0)
-        
-        main_splitter.setSizes([220, 0, 960, 220])  # 220+960+220 = 1400px
-        self.main_splitter = main_splitter
-
-    def resizeEvent(self, event):
-        """Оновлений метод зміни розміру з правильними розмірами браузера"""
-        super().resizeEvent(event)
-        
-        if hasattr(self, 'processor') and self.processor:
-            QTimer.singleShot(50, self.update_image_display_after_resize)
-        
-        if hasattr(self, 'main_splitter') and hasattr(self, 'browser_widget'):
-            current_sizes = self.main_splitter.sizes()
+    # Стиль вікна: поля дат і календарі в усіх панелях та діалогах
+    DATE_EDIT_STYLE = """
+            QDateEdit {
+                border: 1px solid #dee2e6;
+                border-radius: 4px;
+                padding: 6px 10px;
+                background-color: white;
+                font: 12pt "Segoe UI", Arial, sans-serif;
+                color: #495057;
+                min-height: 22px;
+            }
+            QDateEdit:hover {
+                border: 1px solid #adb5bd;
+                background-color: #f8f9fa;
+            }
+            QDateEdit:focus {
+                border: 1px solid #6c757d;
+            }
+            QDateEdit:disabled {
+                background-color: #f5f5f5;
+                color: #6c757d;
+                border: 1px solid #e9ecef;
+            }
+
+            /* МІНІМАЛІСТИЧНИЙ ВИПАДНИЙ СПИСОК */
+            QDateEdit::drop-down {
+                border: none;
+                background-color: transparent;
+                width: 18px;
+                margin-right: 4px;
+            }
+            QDateEdit::drop-down:hover {
+                background-color: #f8f9fa;
+                border-radius: 3px;
+            }
+
+            /* ПРОСТА СТРІЛКА */
+            QDateEdit::down-arrow {
+                image: none;
+                border-left: 4px solid transparent;
+                border-right: 4px solid transparent;
+                border-top: 5px solid #6c757d;
+                margin-top: 1px;
+            }
+            QDateEdit::down-arrow:hover {
+                border-top-color: #495057;
+            }
+            QCalendarWidget {
+                background-color: white;
+                color: #495057;
+                border: 1px solid #dee2e6;
+                border-radius: 6px;
+                font-family: "Segoe UI", Arial, sans-serif;
+            }
+            QCalendarWidget QWidget#qt_calendar_navigationbar {
+                background-color: #f8f9fa;
+                border-bottom: 1px solid #e9ecef;
+                border-top-left-radius: 6px;
+                border-top-right-radius: 6px;
+                padding: 4px;
+            }
+            QCalendarWidget QToolButton {
+                color: #6c757d;
+                background-color: transparent;
+                border: 1px solid transparent;
+                border-radius: 4px;
+                margin: 1px;
+                padding: 4px 8px;
+                font-weight: normal;
+                min-width: 24px;
+                min-height: 24px;
+            }
+            QCalendarWidget QToolButton:hover {
+                background-color: #e9ecef;
+                color: #495057;
+                border: 1px solid #adb5bd;
+            }
+            QCalendarWidget QToolButton#qt_calendar_prevmonth {
+                qproperty-text: "‹";
+                font-size: 16pt;
+                font-weight: bold;
+            }
+            QCalendarWidget QToolButton#qt_calendar_nextmonth {
+                qproperty-text: "›";
+                font-size: 16pt;
+                font-weight: bold;
+            }
+            QCalendarWidget QSpinBox {
+                color: #495057;
+                background-color: white;
+                border: 1px solid #dee2e6;
+                border-radius: 3px;
+                font-size: 12pt;
+                font-weight: normal;
+                padding: 2px 6px;
+                min-width: 60px;
+                margin: 1px;
+            }
+            QCalendarWidget QSpinBox:hover {
+                border: 1px solid #adb5bd;
+                background-color: #f8f9fa;
+            }
+            QCalendarWidget QHeaderView::section {
+                color: #6c757d;
+                background-color: #f8f9fa;
+                border: none;
+                border-bottom: 1px solid #e9ecef;
+                font-weight: 500;
+                padding: 6px 2px;
+                font-size: 11pt;
+            }
+            QCalendarWidget QAbstractItemView {
+                background-color: white;
+                color: #495057;
+                font-size: 12pt;
+                border: none;
+                selection-background-color: #495057;
+                selection-color: white;
+            }
+            QCalendarWidget QAbstractItemView:item:selected {
+                background-color: #495057;
+                color: white;
+                border-radius: 3px;
+                font-weight: normal;
+            }
+            QCalendarWidget QAbstractItemView:item:focus {
+                background-color: #e9ecef;
+                color: #495057;
+                border: 1px solid #adb5bd;
+                border-radius: 3px;
+            }
+        """
+
+    def init_ui(self):
+        self.setWindowTitle(self.tr("window_title"))
+        
+        # Один стиль на все вікно: Qt розбирає його один раз, панелі та віджети - через objectName
+        self.setStyleSheet(self.DATE_EDIT_STYLE + self.CONTROL_PANEL_STYLE +
+                           self.BROWSER_PANEL_STYLE + self.REPORT_PANEL_STYLE)
+        
+        default_width = 1400
+        default_height = 900
+        min_width = 1000  
+        min_height = 700
+        self.setMinimumSize(min_width, min_height)
+        self.setWindowFlags(Qt.Window)
+        self.resize(default_width, default_height)
+        self.showMaximized()
+        
+        self._build_menu_bar()
+        
+        central_widget = QWidget()
+        self.setCentralWidget(central_widget)
+        
+        main_layout = QHBoxLayout()
+        central_widget.setLayout(main_layout)
+        
+        main_splitter = QSplitter(Qt.Horizontal)
+        main_layout.addWidget(main_splitter)
+        
+        self.create_control_panel(main_splitter)
+        self.create_vertical_browser_panel(main_splitter)
+        self.create_image_panel(main_splitter)
+        self.create_report_panel(main_splitter)
+        
+        main_splitter.setStretchFactor(0, 0)
+        main_splitter.setStretchFactor(1, 0)
+        main_splitter.setStretchFactor(2, 1)
+        main_splitter.setStretchFactor(3, 0)
+        
+        main_splitter.setSizes([220, 0, 960, 220])  # 220+960+220 = 1400px
+        self.main_splitter = main_splitter
+
+    def resizeEvent(self, event):
+        """Оновлений метод зміни розміру з правильними розмірами браузера"""
+        super().resizeEvent(event)
+        
+        # Перезапуск таймера: розмітка перераховується один раз після завершення зміни розміру
+        self._resize_timer.start(50)
+    
+    def _do_resize_layout(self):
+        if self.main_splitter is not None and self.browser_widget is not None:
+            current_sizes = self.main_splitter.sizes()
             total_width = sum(current_sizes)
             
             if total_width > 800:
@@ -2400,18 +2789,27 @@ class AzimuthGUI(QMainWindow):
                     # 220 + 0 + ? + 220 = total_width  
                     new_image_width = max(450, total_width - 220 - 220)  # Мінімум 450px
                     self.main_splitter.setSizes([220, 0, new_image_width, 220])
+        
+        self.update_image_display_after_resize()
     
     def update_image_display_after_resize(self):
-        if hasattr(self, 'processor') and self.processor:
+        if self.processor:
             self.display_image()
     
-    def create_menu_bar(self):
+    def _build_menu_bar(self):
+        """Структура меню створюється один раз; зміна мови лише перекладає пункти"""
         menubar = self.menuBar()
         menubar.clear()
         
         settings_menu = menubar.addMenu(self.tr("settings"))
         language_menu = settings_menu.addMenu(self.tr("language"))
         
+        # Пункти меню, що перекладаються в update_interface_text
+        self._menu_translatables = [
+            (settings_menu.menuAction(), "settings"),
+            (language_menu.menuAction(), "language"),
+        ]
+        
         english_action = language_menu.addAction("English")
         english_action.triggered.connect(lambda: self.set_language('ENGLISH'))
         
@@ -2436,6 +2834,11 @@ class AzimuthGUI(QMainWindow):
         
         about_action = settings_menu.addAction("Про програму")
         about_action.triggered.connect(self.show_about)
+    
+    def _retranslate_menu_bar(self):
+        """Переклад пунктів меню на місці, без перестворення QMenu/QAction"""
+        for action, key in self._menu_translatables:
+            action.setText(self.tr(key))
 
     def show_documentation(self):
         '''Відкриття HTML документації'''
@@ -2453,21 +2856,19 @@ class AzimuthGUI(QMainWindow):
         dialog = AboutDialog(self)
         dialog.exec_()
 
-    def create_control_panel(self, parent):
-        """Ліва панель з основними кнопками"""
-        control_widget = QWidget()
-        control_widget.setFixedWidth(250)
-        control_widget.setStyleSheet("""
-            QWidget {
-                background-color: #f5f5f5; 
+    # Стилі панелей - частини єдиного стилю вікна (init_ui); віджети адресуються через objectName
+    CONTROL_PANEL_STYLE = """
+            QWidget#control_panel,
+            #control_panel QWidget {
+                background-color: #f5f5f5;
                 border-right: 1px solid #ccc;
             }
-            QLabel {
+            #control_panel QLabel {
                 background: none;
                 border: none;
                 color: #343a40;
             }
-            QPushButton {
+            #control_panel QPushButton {
                 background-color: #f8f9fa;
                 border: 1px solid #dee2e6;
                 border-radius: 6px;
@@ -2475,28 +2876,42 @@ class AzimuthGUI(QMainWindow):
                 font: 500 12pt "Segoe UI", Arial, sans-serif;
                 color: #495057;
             }
-            QPushButton:hover {
+            #control_panel QPushButton:hover {
                 background-color: #e9ecef;
                 border: 1px solid #adb5bd;
                 color: #343a40;
             }
-            QPushButton:pressed {
+            #control_panel QPushButton:pressed {
                 background-color: #dee2e6;
                 border: 1px solid #6c757d;
             }
-            QPushButton#main_action {
+            #control_panel QPushButton#main_action {
                 background-color: #495057;
                 color: white;
                 font-weight: 600;
                 border: 1px solid #212529;
             }
-            QPushButton#main_action:hover {
+            #control_panel QPushButton#main_action:hover {
                 background-color: #343a40;
             }
-            QPushButton#main_action:pressed {
+            #control_panel QPushButton#main_action:pressed {
                 background-color: #212529;
             }
-            QComboBox, QDateEdit {
+            #control_panel QLabel#section_label {
+                color: #6c757d;
+                margin-top: 8px;
+                margin-bottom: 8px;
+                font-weight: bold;
+            }
+            #control_panel QLabel#section_label[spaced="true"] {
+                margin-top: 12px;
+            }
+            #control_panel QFrame#separator {
+                color: #dee2e6;
+                margin: 12px 0px;
+            }
+            #control_panel QComboBox,
+            #control_panel QDateEdit {
                 border: 1px solid #dee2e6;
                 border-radius: 4px;
                 padding: 6px 10px;
@@ -2505,75 +2920,26 @@ class AzimuthGUI(QMainWindow):
                 color: #495057;
                 min-height: 22px;
             }
-            QComboBox:hover, QDateEdit:hover {
+            #control_panel QComboBox:hover,
+            #control_panel QDateEdit:hover {
                 border: 1px solid #adb5bd;
                 background-color: #f8f9fa;
             }
-            QComboBox:focus, QDateEdit:focus {
+            #control_panel QComboBox:focus,
+            #control_panel QDateEdit:focus {
                 border: 1px solid #6c757d;
                 background-color: white;
             }
-        """)
-        
-        layout = QVBoxLayout()
-        layout.setContentsMargins(15, 15, 15, 15)
-        layout.setSpacing(12)
-        control_widget.setLayout(layout)
-        
-        # Title з новим шрифтом
-        self.control_title = QLabel(self.tr("controls"))
-        self.control_title.setFont(QFont("Segoe UI", 16, QFont.Bold))
-        self.control_title.setAlignment(Qt.AlignCenter)
-        self.control_title.setStyleSheet("font-size: 16pt; font-weight: bold; margin-bottom: 12px; color: #343a40;")
-        layout.addWidget(self.control_title)
-        
-        # File operations section
-        self.file_ops_label = QLabel(self.tr("file_operations"))
-        self.file_ops_label.setFont(QFont("Segoe UI", 12, QFont.Bold))
-        self.file_ops_label.setStyleSheet("color: #6c757d; margin-top: 12px; margin-bottom: 8px; font-weight: bold;")
-        layout.addWidget(self.file_ops_label)
-        
-        # File operation buttons (стандартні)
-        self.open_image_btn = QPushButton(self.tr("open_image"))
-        self.open_image_btn.clicked.connect(self.open_image)
-        layout.addWidget(self.open_image_btn)
-        
-        self.open_folder_btn = QPushButton(self.tr("open_folder"))
-        self.open_folder_btn.clicked.connect(self.open_folder)
-        layout.addWidget(self.open_folder_btn)
-        
-        self.save_image_btn = QPushButton(self.tr("save_current_image"))
-        self.save_image_btn.clicked.connect(self.save_current_image)
-        layout.addWidget(self.save_image_btn)
-        
-        # Separator
-        separator1 = QFrame()
-        separator1.setFrameShape(QFrame.HLine)
-        separator1.setFrameShadow(QFrame.Sunken)
-        separator1.setStyleSheet("color: #dee2e6; margin: 12px 0px;")
-        layout.addWidget(separator1)
-
-        # ===== РОЗДІЛ: ЗАПОВНЕННЯ ДОКУМЕНТУ =====
-        self.title_page_label = QLabel("Заповнення документу")
-        self.title_page_label.setFont(QFont("Segoe UI", 12, QFont.Bold))
-        self.title_page_label.setStyleSheet("color: #6c757d; margin-top: 8px; margin-bottom: 8px; font-weight: bold;")
-        layout.addWidget(self.title_page_label)
-
-        # 1.ВИБІР ШАБЛОНУ
-        template_container = QWidget()
-        template_layout = QHBoxLayout()
-        template_layout.setContentsMargins(0, 0, 0, 0)
-        template_layout.setSpacing(8)
-        template_container.setLayout(template_layout)
-
-        template_label = QLabel("Шаблон:")
-        template_label.setFont(QFont("Segoe UI", 12))
-        template_label.setStyleSheet("color: #495057;")
-        template_layout.addWidget(template_label)
-
-        self.template_combo = QComboBox()
-        self.template_combo.setStyleSheet("""
-            QComboBox {
+            #control_panel #control_title {
+                font-size: 16pt;
+                font-weight: bold;
+                margin-bottom: 12px;
+                color: #343a40;
+            }
+            #control_panel #template_label {
+                color: #495057;
+            }
+            #control_panel QComboBox#template_combo {
                 border: 1px solid #dee2e6;
                 border-radius: 4px;
                 padding: 6px 10px;
@@ -2582,42 +2948,20 @@ class AzimuthGUI(QMainWindow):
                 color: #495057;
                 min-height: 20px;
             }
-            QComboBox:hover {
+            #control_panel QComboBox#template_combo:hover {
                 border: 1px solid #adb5bd;
             }
-            QComboBox::drop-down {
+            #control_panel QComboBox#template_combo::drop-down {
                 border: none;
                 width: 20px;
             }
-            QComboBox::down-arrow {
+            #control_panel QComboBox#template_combo::down-arrow {
                 image: none;
                 border-left: 5px solid transparent;
                 border-right: 5px solid transparent;
                 border-top: 5px solid #6c757d;
             }
-        """)
-        self.template_combo.currentTextChanged.connect(self.on_template_changed)
-        template_layout.addWidget(self.template_combo)
-
-        layout.addWidget(template_container)
-
-        # 2. ДАТА
-        date_container = QWidget()
-        date_layout = QHBoxLayout()
-        date_layout.setContentsMargins(0, 0, 0, 0)
-        date_layout.setSpacing(8)
-        date_container.setLayout(date_layout)
-
-        # Віджет вибору дати документу
-        self.document_date_edit = QDateEdit()
-        self.document_date_edit.setDate(self.document_date)
-        self.document_date_edit.setCalendarPopup(True)
-        self.document_date_edit.setDisplayFormat("dd.MM.yyyy")
-        self.document_date_edit.setFixedHeight(32)
-        self.document_date_edit.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-
-        self.document_date_edit.setStyleSheet("""
-            QDateEdit {
+            #control_panel QDateEdit#document_date_edit {
                 border: 1px solid #dee2e6;
                 border-radius: 4px;
                 padding: 6px 10px;
@@ -2626,53 +2970,53 @@ class AzimuthGUI(QMainWindow):
                 color: #495057;
                 min-height: 22px;
             }
-            QDateEdit:hover {
+            #control_panel QDateEdit#document_date_edit:hover {
                 border: 1px solid #adb5bd;
                 background-color: #f8f9fa;
             }
-            QDateEdit:focus {
+            #control_panel QDateEdit#document_date_edit:focus {
                 border: 1px solid #6c757d;
             }
-            QDateEdit:disabled {
+            #control_panel QDateEdit#document_date_edit:disabled {
                 background-color: #f5f5f5;
                 color: #6c757d;
                 border: 1px solid #e9ecef;
             }
-            QDateEdit::drop-down {
+            #control_panel QDateEdit#document_date_edit::drop-down {
                 border: none;
                 background-color: transparent;
                 width: 18px;
                 margin-right: 4px;
             }
-            QDateEdit::drop-down:hover {
+            #control_panel QDateEdit#document_date_edit::drop-down:hover {
                 background-color: #f8f9fa;
                 border-radius: 3px;
             }
-            QDateEdit::down-arrow {
+            #control_panel QDateEdit#document_date_edit::down-arrow {
                 image: none;
                 border-left: 4px solid transparent;
                 border-right: 4px solid transparent;
                 border-top: 5px solid #6c757d;
                 margin-top: 1px;
             }
-            QDateEdit::down-arrow:hover {
+            #control_panel QDateEdit#document_date_edit::down-arrow:hover {
                 border-top-color: #495057;
             }
-            QCalendarWidget {
+            #control_panel #document_date_edit QCalendarWidget {
                 background-color: white;
                 color: #495057;
                 border: 1px solid #dee2e6;
                 border-radius: 6px;
                 font-family: "Segoe UI", Arial, sans-serif;
             }
-            QCalendarWidget QWidget#qt_calendar_navigationbar {
+            #control_panel #document_date_edit QCalendarWidget QWidget#qt_calendar_navigationbar {
                 background-color: #f8f9fa;
                 border-bottom: 1px solid #e9ecef;
                 border-top-left-radius: 6px;
                 border-top-right-radius: 6px;
                 padding: 4px;
             }
-            QCalendarWidget QToolButton {
+            #control_panel #document_date_edit QCalendarWidget QToolButton {
                 color: #6c757d;
                 background-color: transparent;
                 border: 1px solid transparent;
@@ -2683,22 +3027,22 @@ class AzimuthGUI(QMainWindow):
                 min-width: 24px;
                 min-height: 24px;
             }
-            QCalendarWidget QToolButton:hover {
+            #control_panel #document_date_edit QCalendarWidget QToolButton:hover {
                 background-color: #e9ecef;
                 color: #495057;
                 border: 1px solid #adb5bd;
             }
-            QCalendarWidget QToolButton#qt_calendar_prevmonth {
+            #control_panel #document_date_edit QCalendarWidget QToolButton#qt_calendar_prevmonth {
                 qproperty-text: "‹";
                 font-size: 16pt;
                 font-weight: bold;
             }
-            QCalendarWidget QToolButton#qt_calendar_nextmonth {
+            #control_panel #document_date_edit QCalendarWidget QToolButton#qt_calendar_nextmonth {
                 qproperty-text: "›";
                 font-size: 16pt;
                 font-weight: bold;
             }
-            QCalendarWidget QSpinBox {
+            #control_panel #document_date_edit QCalendarWidget QSpinBox {
                 color: #495057;
                 background-color: white;
                 border: 1px solid #dee2e6;
@@ -2709,11 +3053,11 @@ class AzimuthGUI(QMainWindow):
                 min-width: 60px;
                 margin: 1px;
             }
-            QCalendarWidget QSpinBox:hover {
+            #control_panel #document_date_edit QCalendarWidget QSpinBox:hover {
                 border: 1px solid #adb5bd;
                 background-color: #f8f9fa;
             }
-            QCalendarWidget QHeaderView::section {
+            #control_panel #document_date_edit QCalendarWidget QHeaderView::section {
                 color: #6c757d;
                 background-color: #f8f9fa;
                 border: none;
@@ -2722,7 +3066,7 @@ class AzimuthGUI(QMainWindow):
                 padding: 6px 2px;
                 font-size: 11pt;
             }
-            QCalendarWidget QAbstractItemView {
+            #control_panel #document_date_edit QCalendarWidget QAbstractItemView {
                 background-color: white;
                 color: #495057;
                 font-size: 12pt;
@@ -2730,27 +3074,19 @@ class AzimuthGUI(QMainWindow):
                 selection-background-color: #495057;
                 selection-color: white;
             }
-            QCalendarWidget QAbstractItemView:item:selected {
+            #control_panel #document_date_edit QCalendarWidget QAbstractItemView:item:selected {
                 background-color: #495057;
                 color: white;
                 border-radius: 3px;
                 font-weight: normal;
             }
-            QCalendarWidget QAbstractItemView:item:focus {
+            #control_panel #document_date_edit QCalendarWidget QAbstractItemView:item:focus {
                 background-color: #e9ecef;
                 color: #495057;
                 border: 1px solid #adb5bd;
                 border-radius: 3px;
-            }""")
-        self.document_date_edit.dateChanged.connect(self.update_document_date)
-        date_layout.addWidget(self.document_date_edit)
-
-        self.today_btn = QPushButton("Сьогодні")
-        self.today_btn.clicked.connect(self.set_document_date_today)
-        self.today_btn.setFixedHeight(32)  # Та ж висота що й дата
-        self.today_btn.setFixedWidth(85)   # ТРОХИ ШИРШЕ ДЛЯ КОМФОРТУ
-        self.today_btn.setStyleSheet("""
-            QPushButton {
+            }
+            #control_panel QPushButton#today_btn {
                 background-color: #6c757d;
                 color: white;
                 border: 1px solid #495057;
@@ -2759,14 +3095,136 @@ class AzimuthGUI(QMainWindow):
                 font: 500 10pt "Segoe UI", Arial, sans-serif;  /* ЗМЕНШЕНИЙ ШРИФТ */
                 font-weight: 500;
             }
-            QPushButton:hover {
+            #control_panel QPushButton#today_btn:hover {
                 background-color: #495057;
                 border: 1px solid #343a40;
             }
-            QPushButton:pressed {
+            #control_panel QPushButton#today_btn:pressed {
                 background-color: #343a40;
             }
-        """)
+            #control_panel QPushButton#cancel_current_btn {
+                background-color: #fd7e14;
+                color: white;
+                border: 1px solid #e76a00;
+                font-weight: 600;
+            }
+            #control_panel QPushButton#cancel_current_btn:hover {
+                background-color: #e76a00;
+                border: 1px solid #dc6502;
+            }
+            #control_panel QPushButton#clear_all_btn {
+                background-color: #dc3545;
+                color: white;
+                border: 1px solid #c82333;
+            }
+            #control_panel QPushButton#clear_all_btn:hover {
+                background-color: #c82333;
+            }
+            #control_panel QTextEdit#results_text {
+                background-color: white;
+                border: 1px solid #dee2e6;
+                font-family: 'Consolas', 'Courier New', monospace;
+                font-size: 11pt;
+                color: #495057;
+                border-radius: 4px;
+                padding: 8px;
+            }
+        """
+
+    def create_control_panel(self, parent):
+        """Ліва панель з основними кнопками"""
+        control_widget = QWidget()
+        control_widget.setFixedWidth(250)
+        control_widget.setObjectName("control_panel")
+        
+        layout = QVBoxLayout()
+        layout.setContentsMargins(15, 15, 15, 15)
+        layout.setSpacing(12)
+        control_widget.setLayout(layout)
+        
+        # Title з новим шрифтом
+        self.control_title = QLabel(self.tr("controls"))
+        self.control_title.setFont(QFont("Segoe UI", 16, QFont.Bold))
+        self.control_title.setAlignment(Qt.AlignCenter)
+        self.control_title.setObjectName("control_title")
+        layout.addWidget(self.control_title)
+        
+        # File operations section
+        self.file_ops_label = QLabel(self.tr("file_operations"))
+        self.file_ops_label.setFont(QFont("Segoe UI", 12, QFont.Bold))
+        self.file_ops_label.setObjectName("section_label")
+        self.file_ops_label.setProperty("spaced", True)
+        layout.addWidget(self.file_ops_label)
+        
+        # File operation buttons (стандартні)
+        self.open_image_btn = QPushButton(self.tr("open_image"))
+        self.open_image_btn.clicked.connect(self.open_image)
+        layout.addWidget(self.open_image_btn)
+        
+        self.open_folder_btn = QPushButton(self.tr("open_folder"))
+        self.open_folder_btn.clicked.connect(self.open_folder)
+        layout.addWidget(self.open_folder_btn)
+        
+        self.save_image_btn = QPushButton(self.tr("save_current_image"))
+        self.save_image_btn.clicked.connect(self.save_current_image)
+        layout.addWidget(self.save_image_btn)
+        
+        # Separator
+        separator1 = QFrame()
+        separator1.setFrameShape(QFrame.HLine)
+        separator1.setFrameShadow(QFrame.Sunken)
+        separator1.setObjectName("separator")
+        layout.addWidget(separator1)
+
+        # ===== РОЗДІЛ: ЗАПОВНЕННЯ ДОКУМЕНТУ =====
+        self.title_page_label = QLabel("Заповнення документу")
+        self.title_page_label.setFont(QFont("Segoe UI", 12, QFont.Bold))
+        self.title_page_label.setObjectName("section_label")
+        layout.addWidget(self.title_page_label)
+
+        # 1.ВИБІР ШАБЛОНУ
+        template_container = QWidget()
+        template_layout = QHBoxLayout()
+        template_layout.setContentsMargins(0, 0, 0, 0)
+        template_layout.setSpacing(8)
+        template_container.setLayout(template_layout)
+
+        template_label = QLabel("Шаблон:")
+        template_label.setFont(QFont("Segoe UI", 12))
+        template_label.setObjectName("template_label")
+        template_layout.addWidget(template_label)
+
+        self.template_combo = QComboBox()
+        self.template_combo.setObjectName("template_combo")
+        self.template_combo.currentTextChanged.connect(self.on_template_changed)
+        template_layout.addWidget(self.template_combo)
+
+        layout.addWidget(template_container)
+
+        # 2. ДАТА
+        date_container = QWidget()
+        date_layout = QHBoxLayout()
+        date_layout.setContentsMargins(0, 0, 0, 0)
+        date_layout.setSpacing(8)
+        date_container.setLayout(date_layout)
+
+        # Віджет вибору дати документу
+        self.document_date_edit = QDateEdit()
+        self.document_date_edit.setDate(self.document_date)
+        self.document_date_edit.setCalendarPopup(True)
+        self.document_date_edit.setDisplayFormat("dd.MM.yyyy")
+        self.document_date_edit.setFixedHeight(32)
+        self.document_date_edit.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+
+        self.document_date_edit.setObjectName("document_date_edit")
+        self.document_date_edit.dateChanged.connect(self.update_document_date)
+        date_layout.addWidget(self.document_date_edit)
+
+        self.today_btn = QPushButton("Сьогодні")
+        self.today_btn.clicked.connect(self.set_document_date_today)
+        self.today_btn.setFixedHeight(32)  # Та ж висота що й дата
+        self.today_btn.setFixedWidth(85)   # ТРОХИ ШИРШЕ ДЛЯ КОМФОРТУ
+        self.today_btn.setObjectName("today_btn")
         date_layout.addWidget(self.today_btn)
         layout.addWidget(date_container)
 
@@ -2783,13 +3241,13 @@ class AzimuthGUI(QMainWindow):
         separator2 = QFrame()
         separator2.setFrameShape(QFrame.HLine)
         separator2.setFrameShadow(QFrame.Sunken)
-        separator2.setStyleSheet("color: #dee2e6; margin: 12px 0px;")
+        separator2.setObjectName("separator")
         layout.addWidget(separator2)
         
         # ===== ПАКЕТНА ОБРОБКА =====
         self.batch_label = QLabel(self.tr("batch_processing"))
         self.batch_label.setFont(QFont("Segoe UI", 12, QFont.Bold))
-        self.batch_label.setStyleSheet("color: #6c757d; margin-top: 8px; margin-bottom: 8px; font-weight: bold;")
+        self.batch_label.setObjectName("section_label")
         layout.addWidget(self.batch_label)
 
         self.save_current_btn = QPushButton(self.tr("save_current_image_data"))
@@ -2799,32 +3257,12 @@ class AzimuthGUI(QMainWindow):
         # Кнопки скасування змін
         self.cancel_current_btn = QPushButton("Скасувати зміни")
         self.cancel_current_btn.clicked.connect(self.cancel_current_changes)
-        self.cancel_current_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #fd7e14;
-                color: white;
-                border: 1px solid #e76a00;
-                font-weight: 600;
-            }
-            QPushButton:hover {
-                background-color: #e76a00;
-                border: 1px solid #dc6502;
-            }
-        """)
+        self.cancel_current_btn.setObjectName("cancel_current_btn")
         layout.addWidget(self.cancel_current_btn)
 
         self.clear_all_btn = QPushButton("Очистити все")
         self.clear_all_btn.clicked.connect(self.clear_all_changes)
-        self.clear_all_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #dc3545;
-                color: white;
-                border: 1px solid #c82333;
-            }
-            QPushButton:hover {
-                background-color: #c82333;
-            }
-        """)
+        self.clear_all_btn.setObjectName("clear_all_btn")
         layout.addWidget(self.clear_all_btn)
 
         # ГОЛОВНА кнопка для створення альбому
@@ -2836,22 +3274,13 @@ class AzimuthGUI(QMainWindow):
         # Results area
         self.results_label = QLabel(self.tr("results"))
         self.results_label.setFont(QFont("Segoe UI", 12, QFont.Bold))
-        self.results_label.setStyleSheet("color: #6c757d; margin-top: 12px; margin-bottom: 8px; font-weight: bold;")
+        self.results_label.setObjectName("section_label")
+        self.results_label.setProperty("spaced", True)
         layout.addWidget(self.results_label)
         
         self.results_text = QTextEdit()
         self.results_text.setMaximumHeight(120)
-        self.results_text.setStyleSheet("""
-            QTextEdit {
-                background-color: white;
-                border: 1px solid #dee2e6;
-                font-family: 'Consolas', 'Courier New', monospace;
-                font-size: 11pt;
-                color: #495057;
-                border-radius: 4px;
-                padding: 8px;
-            }
-        """)
+        self.results_text.setObjectName("results_text")
         layout.addWidget(self.results_text)
 
         layout.addStretch()
@@ -3069,22 +3498,40 @@ class AzimuthGUI(QMainWindow):
             'margins': self.current_template['margins']
         }
 
-    def create_vertical_browser_panel(self, parent):
-        browser_widget = QWidget()
-        # ЗБІЛЬШУЄМО ширину з 180px до 280px
-        browser_widget.setFixedWidth(280)
-        browser_widget.setStyleSheet("""
-            QWidget {
-                background-color: #f8f8f8; 
+    BROWSER_PANEL_STYLE = """
+            QWidget#browser_panel,
+            #browser_panel QWidget {
+                background-color: #f8f8f8;
                 border-right: 1px solid #ccc;
                 border-left: 1px solid #ccc;
             }
-            QLabel {
+            #browser_panel QLabel {
                 background: none;
                 border: none;
                 color: #333;
             }
-        """)
+            #browser_panel #browser_label {
+                color: #666;
+                margin-bottom: 5px;
+                padding: 0 10px;
+            }
+            #browser_panel #thumbnail_scroll,
+            #browser_panel #thumbnail_scroll * {
+                border: none;
+                background: transparent;
+            }
+            #browser_panel #thumbnail_scroll #no_images_label {
+                color: gray;
+                font-size: 14px;
+                padding: 20px;
+            }
+        """
+
+    def create_vertical_browser_panel(self, parent):
+        browser_widget = QWidget()
+        # ЗБІЛЬШУЄМО ширину з 180px до 280px
+        browser_widget.setFixedWidth(280)
+        browser_widget.setObjectName("browser_panel")
         
         layout = QVBoxLayout()
         layout.setContentsMargins(0, 15, 0, 15)
@@ -3093,7 +3540,7 @@ class AzimuthGUI(QMainWindow):
         
         self.browser_label = QLabel(self.tr("photo_browser"))
         self.browser_label.setFont(QFont("Arial", 10, QFont.Bold))
-        self.browser_label.setStyleSheet("color: #666; margin-bottom: 5px; padding: 0 10px;")
+        self.browser_label.setObjectName("browser_label")
         self.browser_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(self.browser_label)
         
@@ -3101,7 +3548,7 @@ class AzimuthGUI(QMainWindow):
         self.thumbnail_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         self.thumbnail_scroll.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         self.thumbnail_scroll.setWidgetResizable(False)
-        self.thumbnail_scroll.setStyleSheet("border: none; background: transparent;")
+        self.thumbnail_scroll.setObjectName("thumbnail_scroll")
         
         # ЗБІЛЬШУЄМО ширину віджета мініатюр з 160px до 260px
         self.thumbnail_widget = VerticalThumbnailWidget(thumbnail_width=260)
@@ -3160,88 +3607,97 @@ class AzimuthGUI(QMainWindow):
         
         if folder_path:
             self.current_folder = folder_path
-            self.load_folder_thumbnails()
+            
+            # Один прохід по папці для мініатюр і підрахунку
+            try:
+                image_entries = scan_image_folder(folder_path)
+            except OSError as e:
+                log.error("❌ Error reading folder: %s", e)
+                image_entries = []
+            self.load_folder_thumbnails(image_entries)
             
             self.browser_widget.show()
             self.main_splitter.setSizes([220, 280, 620, 220])
             
-            image_extensions = ('.jpg', '.jpeg', '.png', '.bmp', '.gif', '.tiff', '.tif')
-            image_count = sum(1 for f in os.listdir(folder_path) 
-                            if f.lower().endswith(image_extensions))
+            image_count = len(image_entries)
             
             self.add_result(f"{self.tr('loaded_folder')}: {os.path.basename(folder_path)}")
             self.add_result(self.tr("found_images").format(count=image_count))
             
             self.report_widget.show()
 
-    def load_folder_thumbnails(self):
+    def load_folder_thumbnails(self, image_entries=None):
         """Виправлена функція завантаження мініатюр з правильними розмірами"""
-        print("🟡 === load_folder_thumbnails STARTED ===")
+        log.debug("🟡 === load_folder_thumbnails STARTED ===")
         
         if not self.current_folder:
-            print("❌ current_folder is None!")
+            log.error("❌ current_folder is None!")
             return
         
-        print(f"🔍 Loading thumbnails from: {self.current_folder}")
+        log.debug("🔍 Loading thumbnails from: %s", self.current_folder)
         
         # Перевірка thumbnail_widget
         if not hasattr(self, 'thumbnail_widget'):
-            print("❌ thumbnail_widget doesn't exist!")
+            log.error("❌ thumbnail_widget doesn't exist!")
             return
         
-        print(f"✅ thumbnail_widget exists: {type(self.thumbnail_widget)}")
+        log.debug("✅ thumbnail_widget exists: %s", type(self.thumbnail_widget))
         
         # ВАЖЛИВО: Очищуємо попередні мініатюри
         self.thumbnail_widget.clear_thumbnails()
+        self._image_pool.clear()
+        self._prefetch_pool.clear()
+        self._prefetch_pending.clear()
         
-        image_extensions = ('.jpg', '.jpeg', '.png', '.bmp', '.gif', '.tiff', '.tif')
-        image_files = []
-        
-        try:
-            print(f"📁 Scanning folder: {self.current_folder}")
-            for filename in os.listdir(self.current_folder):
-                if filename.lower().endswith(image_extensions):
-                    full_path = os.path.join(self.current_folder, filename)
-                    image_files.append(full_path)
-                    print(f"✅ Found image: {filename}")
-        except Exception as e:
-            print(f"❌ Error reading folder: {e}")
-            return
-
-        print(f"📊 Total images found: {len(image_files)}")
+        if image_entries is None:
+            try:
+                log.debug("📁 Scanning folder: %s", self.current_folder)
+                image_entries = scan_image_folder(self.current_folder)
+            except Exception as e:
+                log.error("❌ Error reading folder: %s", e)
+                return
         
-        # Сортуємо файли
-        image_files.sort()
+        # Без допоміжного списку шляхів - ітеруємо відсортовані записи напряму
+        image_count = len(image_entries)
+        log.debug("📊 Total images found: %d", image_count)
         
-        if len(image_files) == 0:
-            print("📭 No images - adding 'no images' label")
+        if image_count == 0:
+            log.debug("📭 No images - adding 'no images' label")
             no_images_label = QLabel(self.tr("no_images_found"))
             no_images_label.setAlignment(Qt.AlignCenter)
-            no_images_label.setStyleSheet("color: gray; font-size: 14px; padding: 20px;")
+            no_images_label.setObjectName("no_images_label")
             no_images_label.setWordWrap(True)
             self.thumbnail_widget.layout.addWidget(no_images_label)
             return
         
-        print(f"🔄 Creating thumbnails for {len(image_files)} images...")
+        log.debug("🔄 Creating thumbnails for %d images...", image_count)
         
         # ВИПРАВЛЕННЯ: Створюємо мініатюри тільки ОДИН раз
-        for i, image_path in enumerate(image_files):
-            try:
-                print(f"🖼️ Creating thumbnail {i+1}/{len(image_files)}: {os.path.basename(image_path)}")
-                self.thumbnail_widget.add_thumbnail(image_path)
-                print(f"✅ Thumbnail {i+1} created successfully")
-            except Exception as e:
-                print(f"❌ Error creating thumbnail {i+1}: {e}")
-                import traceback
-                traceback.print_exc()
-        
-        # ВИПРАВЛЕНІ розміри віджета для більших мініатюр
-        widget_height = len(image_files) * 190 + 20  # Збільшена висота для мініатюр 240x180
-        self.thumbnail_widget.setMinimumHeight(widget_height)
-        self.thumbnail_widget.resize(260, widget_height)  # Ширина 260px
+        # Без перемальовування під час додавання - одне оновлення розмітки в кінці
+        self.thumbnail_widget.setUpdatesEnabled(False)
+        self.thumbnail_scroll.setUpdatesEnabled(False)
+        try:
+            for i, (image_path, mtime) in enumerate(image_entries):
+                try:
+                    log.debug("🖼️ Creating thumbnail %d/%d: %s", i + 1, image_count, os.path.basename(image_path))
+                    self.thumbnail_widget.add_thumbnail(image_path, mtime)
+                    log.debug("✅ Thumbnail %d created successfully", i + 1)
+                except Exception as e:
+                    log.error("❌ Error creating thumbnail %d: %s", i + 1, e)
+                    import traceback
+                    traceback.print_exc()
+            
+            # ВИПРАВЛЕНІ розміри віджета для більших мініатюр
+            widget_height = image_count * 190 + 20  # Збільшена висота для мініатюр 240x180
+            self.thumbnail_widget.setMinimumHeight(widget_height)
+            self.thumbnail_widget.resize(260, widget_height)  # Ширина 260px
+        finally:
+            self.thumbnail_widget.setUpdatesEnabled(True)
+            self.thumbnail_scroll.setUpdatesEnabled(True)
+            self.thumbnail_widget.updateGeometry()
         
-        print(f"🟢 === load_folder_thumbnails COMPLETED ===")
-        print(f"📋 Final result: {len(image_files)} unique thumbnails created")
+        log.debug("🟢 === load_folder_thumbnails COMPLETED ===")
+        log.debug("📋 Final result: %d unique thumbnails created", image_count)
 
 
     # НОВІ МЕТОДИ ДЛЯ СТВОРЕННЯ АЛЬБОМІВ З ТАБЛИЦЯМИ
@@ -3256,6 +3712,10 @@ class AzimuthGUI(QMainWindow):
             QMessageBox.warning(self, "Warning", "No processed images to export")
             return
         
+        if self._album_export_context is not None:
+            QMessageBox.warning(self, "Warning", "Album is already being created")
+            return
+        
         # Зберігаємо поточне зображення якщо є
         if self.processor and self.current_click:
             self.save_current_image_data()
@@ -3278,27 +3738,20 @@ class AzimuthGUI(QMainWindow):
                 print(f"   Signature: {title_data['signature_info']['rank']} {title_data['signature_info']['name']}")
                 print(f"   Margins: {title_data['margins']}")
                 
-                # Створюємо повний альбом з шаблоном та підписом
-                success = create_complete_album(self.processed_images, title_data, file_path)
-                
-                if success:
-                    current_template_name = self.template_combo.currentText()
-                    QMessageBox.information(self, "Success", 
-                                        f"Complete album created with template and signature!\n"
-                                        f"• Template: {current_template_name}\n"
-                                        f"• Unit: {title_data['unit_info']}\n"
-                                        f"• Commander: {title_data['commander_info']['name']}\n"
-                                        f"• Chief of Staff: {title_data['chief_of_staff_info']['name']}\n"
-                                        f"• Signature: {title_data['signature_info']['name']}\n"
-                                        f"• Images: {len(self.processed_images)}\n"
-                                        f"• Custom margins applied\n\n"
-                                        f"Saved: {os.path.basename(file_path)}")
-                    
-                    self.add_result(f"✓ Album created with template: {current_template_name}")
-                    self.add_result(f"✓ Contains {len(self.processed_images)} processed images")
-                    self.add_result(f"✓ Signature: {title_data['signature_info']['rank']} {title_data['signature_info']['name']}")
-                else:
-                    QMessageBox.critical(self, "Error", "Failed to create album with template and signature")
+                # Створюємо повний альбом з шаблоном та підписом у фоновому потоці:
+                # знімок списку, щоб редагування під час експорту не змінювало документ
+                album_images = [dict(image_data) for image_data in self.processed_images]
+                self._album_export_context = {
+                    'title_data': title_data,
+                    'file_path': file_path,
+                    'template_name': self.template_combo.currentText(),
+                    'image_count': len(album_images),
+                }
+                self.create_new_structure_btn.setEnabled(False)
+                self.add_result(f"⏳ Creating album: {os.path.basename(file_path)}")
+                QThreadPool.globalInstance().start(
+                    AlbumExportTask(album_images, title_data, file_path, self._album_export_signals)
+                )
                     
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Could not create album: {str(e)}")
@@ -3307,6 +3760,34 @@ class AzimuthGUI(QMainWindow):
                 traceback.print_exc()
 
 
+    def on_album_export_finished(self, success):
+        """Завершення фонового створення альбому (виконується в GUI-потоці)"""
+        context = self._album_export_context
+        self._album_export_context = None
+        self.create_new_structure_btn.setEnabled(True)
+        if context is None:
+            return
+        
+        title_data = context['title_data']
+        if success:
+            current_template_name = context['template_name']
+            QMessageBox.information(self, "Success", 
+                                f"Complete album created with template and signature!\n"
+                                f"• Template: {current_template_name}\n"
+                                f"• Unit: {title_data['unit_info']}\n"
+                                f"• Commander: {title_data['commander_info']['name']}\n"
+                                f"• Chief of Staff: {title_data['chief_of_staff_info']['name']}\n"
+                                f"• Signature: {title_data['signature_info']['name']}\n"
+                                f"• Images: {context['image_count']}\n"
+                                f"• Custom margins applied\n\n"
+                                f"Saved: {os.path.basename(context['file_path'])}")
+            
+            self.add_result(f"✓ Album created with template: {current_template_name}")
+            self.add_result(f"✓ Contains {context['image_count']} processed images")
+            self.add_result(f"✓ Signature: {title_data['signature_info']['rank']} {title_data['signature_info']['name']}")
+        else:
+            QMessageBox.critical(self, "Error", "Failed to create album with template and signature")
+
     def get_title_page_data_from_gui(self):
         """Отримання даних для титульної сторінки з GUI"""
         from datetime import datetime
@@ -3320,22 +3801,19 @@ class AzimuthGUI(QMainWindow):
         
         return title_data
         
-    def create_report_panel(self, parent):
-        """Права панель з азимутальними контролами та описом РЛС (ПОВНІСТЮ ОНОВЛЕНА)"""
-        report_widget = QWidget()
-        report_widget.setFixedWidth(220)
-        report_widget.setStyleSheet("""
-            QWidget {
-                background-color: #f9f9f9; 
+    REPORT_PANEL_STYLE = """
+            QWidget#report_panel,
+            #report_panel QWidget {
+                background-color: #f9f9f9;
                 border-left: 1px solid #dee2e6;
             }
-            QLabel {
+            #report_panel QLabel {
                 background: none;
                 border: none;
                 color: #343a40;
                 font: 12pt "Segoe UI", Arial, sans-serif;
             }
-            QPushButton {
+            #report_panel QPushButton {
                 background-color: #f8f9fa;
                 border: 2px solid #dee2e6;  /* Товща рамка замість тіні */
                 border-radius: 6px;
@@ -3343,26 +3821,27 @@ class AzimuthGUI(QMainWindow):
                 font: 500 12pt "Segoe UI", Arial, sans-serif;
                 color: #495057;
             }
-            QPushButton:hover {
+            #report_panel QPushButton:hover {
                 background-color: #e9ecef;
                 border: 2px solid #adb5bd;  /* Акцентна рамка замість тіні */
                 color: #343a40;
             }
-            QPushButton:pressed {
+            #report_panel QPushButton:pressed {
                 background-color: #dee2e6;
                 border: 2px solid #6c757d;
                 border-style: inset;  /* Вдавлений ефект замість тіні */
             }
-            QPushButton:checked {
+            #report_panel QPushButton:checked {
                 background-color: #495057;
                 color: white;
                 border: 2px solid #343a40;
             }
-            QPushButton:checked:hover {
+            #report_panel QPushButton:checked:hover {
                 background-color: #343a40;
                 border: 2px solid #212529;
             }
-            QLineEdit, QComboBox {
+            #report_panel QLineEdit,
+            #report_panel QComboBox {
                 border: 1px solid #dee2e6;
                 border-radius: 4px;
                 padding: 6px 10px;
@@ -3371,20 +3850,23 @@ class AzimuthGUI(QMainWindow):
                 color: #495057;
                 min-height: 20px;
             }
-            QLineEdit:hover, QComboBox:hover {
+            #report_panel QLineEdit:hover,
+            #report_panel QComboBox:hover {
                 border: 1px solid #adb5bd;
                 background-color: #f8f9fa;
             }
-            QLineEdit:focus, QComboBox:focus {
+            #report_panel QLineEdit:focus,
+            #report_panel QComboBox:focus {
                 border: 1px solid #6c757d;
                 background-color: white;
             }
-            QLineEdit:disabled, QComboBox:disabled {
+            #report_panel QLineEdit:disabled,
+            #report_panel QComboBox:disabled {
                 background-color: #f5f5f5;
                 color: #6c757d;
                 border: 1px solid #e9ecef;
             }
-            QComboBox::drop-down {
+            #report_panel QComboBox::drop-down {
                 border: none;
                 width: 20px;
                 border-left: 1px solid #dee2e6;
@@ -3392,40 +3874,40 @@ class AzimuthGUI(QMainWindow):
                 border-bottom-right-radius: 4px;
                 background-color: #f8f9fa;
             }
-            QComboBox::drop-down:hover {
+            #report_panel QComboBox::drop-down:hover {
                 background-color: #e9ecef;
             }
-            QComboBox::down-arrow {
+            #report_panel QComboBox::down-arrow {
                 image: none;
                 border-left: 5px solid transparent;
                 border-right: 5px solid transparent;
                 border-top: 5px solid #6c757d;
             }
-            QCheckBox {
+            #report_panel QCheckBox {
                 color: #495057;
                 font: 500 12pt "Segoe UI", Arial, sans-serif;
                 padding: 6px;
                 font-weight: 500;
             }
-            QCheckBox::indicator {
+            #report_panel QCheckBox::indicator {
                 width: 18px;
                 height: 18px;
             }
-            QCheckBox::indicator:unchecked {
+            #report_panel QCheckBox::indicator:unchecked {
                 border: 2px solid #dee2e6;
                 background-color: white;
                 border-radius: 3px;
             }
-            QCheckBox::indicator:checked {
+            #report_panel QCheckBox::indicator:checked {
                 border: 2px solid #495057;
                 background-color: #495057;
                 border-radius: 3px;
             }
-            QCheckBox::indicator:unchecked:hover {
+            #report_panel QCheckBox::indicator:unchecked:hover {
                 border: 2px solid #adb5bd;
                 background-color: #f8f9fa;
             }
-            QDateEdit {
+            #report_panel QDateEdit {
                 border: 1px solid #dee2e6;
                 border-radius: 4px;
                 padding: 6px 10px;
@@ -3434,43 +3916,43 @@ class AzimuthGUI(QMainWindow):
                 color: #495057;
                 min-height: 22px;
             }
-            QDateEdit:hover {
+            #report_panel QDateEdit:hover {
                 border: 1px solid #adb5bd;
                 background-color: #f8f9fa;
             }
-            QDateEdit:focus {
+            #report_panel QDateEdit:focus {
                 border: 1px solid #6c757d;
                 background-color: white;
             }
-            QDateEdit:disabled {
+            #report_panel QDateEdit:disabled {
                 background-color: #f5f5f5;
                 color: #6c757d;
                 border: 1px solid #e9ecef;
             }
-            QDateEdit::drop-down {
+            #report_panel QDateEdit::drop-down {
                 border-left: 1px solid #dee2e6;
                 background-color: #f8f9fa;
                 border-top-right-radius: 4px;
                 border-bottom-right-radius: 4px;
                 width: 20px;
             }
-            QDateEdit::drop-down:hover {
+            #report_panel QDateEdit::drop-down:hover {
                 background-color: #e9ecef;
             }
-            QDateEdit::drop-down:disabled {
+            #report_panel QDateEdit::drop-down:disabled {
                 background-color: #f5f5f5;
             }
-            QDateEdit::down-arrow {
-            image: none;
-            border-left: 4px solid transparent;
-            border-right: 4px solid transparent;
-            border-top: 4px solid #6c757d;
-            margin-top: 2px;
+            #report_panel QDateEdit::down-arrow {
+                image: none;
+                border-left: 4px solid transparent;
+                border-right: 4px solid transparent;
+                border-top: 4px solid #6c757d;
+                margin-top: 2px;
             }
-            QDateEdit::down-arrow:hover {
+            #report_panel QDateEdit::down-arrow:hover {
                 border-top-color: #495057;
             }
-            QDateEdit {
+            #report_panel QDateEdit {
                 border: 1px solid #dee2e6;
                 border-radius: 4px;
                 padding: 6px 10px;
@@ -3479,53 +3961,53 @@ class AzimuthGUI(QMainWindow):
                 color: #495057;
                 min-height: 22px;
             }
-            QDateEdit:hover {
+            #report_panel QDateEdit:hover {
                 border: 1px solid #adb5bd;
                 background-color: #f8f9fa;
             }
-            QDateEdit:focus {
+            #report_panel QDateEdit:focus {
                 border: 1px solid #6c757d;
             }
-            QDateEdit:disabled {
+            #report_panel QDateEdit:disabled {
                 background-color: #f5f5f5;
                 color: #6c757d;
                 border: 1px solid #e9ecef;
             }
-            QDateEdit::drop-down {
+            #report_panel QDateEdit::drop-down {
                 border: none;
                 background-color: transparent;
                 width: 18px;
                 margin-right: 4px;
             }
-            QDateEdit::drop-down:hover {
+            #report_panel QDateEdit::drop-down:hover {
                 background-color: #f8f9fa;
                 border-radius: 3px;
             }
-            QDateEdit::down-arrow {
+            #report_panel QDateEdit::down-arrow {
                 image: none;
                 border-left: 4px solid transparent;
                 border-right: 4px solid transparent;
                 border-top: 5px solid #6c757d;
                 margin-top: 1px;
             }
-            QDateEdit::down-arrow:hover {
+            #report_panel QDateEdit::down-arrow:hover {
                 border-top-color: #495057;
             }
-            QCalendarWidget {
+            #report_panel QCalendarWidget {
                 background-color: white;
                 color: #495057;
                 border: 1px solid #dee2e6;
                 border-radius: 6px;
                 font-family: "Segoe UI", Arial, sans-serif;
             }
-            QCalendarWidget QWidget#qt_calendar_navigationbar {
+            #report_panel QCalendarWidget QWidget#qt_calendar_navigationbar {
                 background-color: #f8f9fa;
                 border-bottom: 1px solid #e9ecef;
                 border-top-left-radius: 6px;
                 border-top-right-radius: 6px;
                 padding: 4px;
             }
-            QCalendarWidget QToolButton {
+            #report_panel QCalendarWidget QToolButton {
                 color: #6c757d;
                 background-color: transparent;
                 border: 1px solid transparent;
@@ -3536,22 +4018,22 @@ class AzimuthGUI(QMainWindow):
                 min-width: 24px;
                 min-height: 24px;
             }
-            QCalendarWidget QToolButton:hover {
+            #report_panel QCalendarWidget QToolButton:hover {
                 background-color: #e9ecef;
                 color: #495057;
                 border: 1px solid #adb5bd;
             }
-            QCalendarWidget QToolButton#qt_calendar_prevmonth {
+            #report_panel QCalendarWidget QToolButton#qt_calendar_prevmonth {
                 qproperty-text: "‹";
                 font-size: 16pt;
                 font-weight: bold;
             }
-            QCalendarWidget QToolButton#qt_calendar_nextmonth {
+            #report_panel QCalendarWidget QToolButton#qt_calendar_nextmonth {
                 qproperty-text: "›";
                 font-size: 16pt;
                 font-weight: bold;
             }
-            QCalendarWidget QSpinBox {
+            #report_panel QCalendarWidget QSpinBox {
                 color: #495057;
                 background-color: white;
                 border: 1px solid #dee2e6;
@@ -3562,11 +4044,11 @@ class AzimuthGUI(QMainWindow):
                 min-width: 60px;
                 margin: 1px;
             }
-            QCalendarWidget QSpinBox:hover {
+            #report_panel QCalendarWidget QSpinBox:hover {
                 border: 1px solid #adb5bd;
                 background-color: #f8f9fa;
             }
-            QCalendarWidget QHeaderView::section {
+            #report_panel QCalendarWidget QHeaderView::section {
                 color: #6c757d;
                 background-color: #f8f9fa;
                 border: none;
@@ -3575,7 +4057,7 @@ class AzimuthGUI(QMainWindow):
                 padding: 6px 2px;
                 font-size: 11pt;
             }
-            QCalendarWidget QAbstractItemView {
+            #report_panel QCalendarWidget QAbstractItemView {
                 background-color: white;
                 color: #495057;
                 font-size: 12pt;
@@ -3583,19 +4065,86 @@ class AzimuthGUI(QMainWindow):
                 selection-background-color: #495057;
                 selection-color: white;
             }
-            QCalendarWidget QAbstractItemView:item:selected {
+            #report_panel QCalendarWidget QAbstractItemView:item:selected {
                 background-color: #495057;
                 color: white;
                 border-radius: 3px;
                 font-weight: normal;
             }
-            QCalendarWidget QAbstractItemView:item:focus {
+            #report_panel QCalendarWidget QAbstractItemView:item:focus {
                 background-color: #e9ecef;
                 color: #495057;
                 border: 1px solid #adb5bd;
                 border-radius: 3px;
             }
-        """)
+            #report_panel #report_title {
+                font-size: 14pt;
+                font-weight: bold;
+                margin-bottom: 12px;
+                color: #343a40;
+            }
+            #report_panel QFrame#manual_group,
+            #report_panel #manual_group QFrame {
+                background-color: white;
+                border: 1px solid #dee2e6;
+                border-radius: 6px;
+                padding: 12px;
+            }
+            #report_panel #manual_group #auto_azimuth_label {
+                font-weight: 500;
+                color: #495057;
+            }
+            #report_panel #manual_group #auto_distance_label {
+                font-weight: 500;
+                color: #495057;
+            }
+            #report_panel #manual_group #height_label {
+                color: #495057;
+                font-weight: 500;
+            }
+            #report_panel #manual_group #units_label {
+                color: #6c757d;
+            }
+            #report_panel #manual_group #auto_scale_label {
+                font-weight: 500;
+                color: #495057;
+            }
+            #report_panel #report_separator {
+                color: #dee2e6;
+                margin: 8px 0px;
+            }
+            #report_panel #azimuth_grid_label {
+                color: #6c757d;
+                font-weight: bold;
+                margin-bottom: 8px;
+            }
+            #report_panel #scale_label {
+                color: #495057;
+                font-weight: 500;
+            }
+            #report_panel #radar_separator {
+                color: #dee2e6;
+                margin: 12px 0px;
+            }
+            #report_panel #radar_description_checkbox {
+                font-weight: bold;
+                color: #495057;
+                padding: 6px;
+            }
+            #report_panel QFrame#radar_group,
+            #report_panel #radar_group QFrame {
+                background-color: white;
+                border: 1px solid #dee2e6;
+                border-radius: 6px;
+                padding: 12px;
+            }
+        """
+
+    def create_report_panel(self, parent):
+        """Права панель з азимутальними контролами та описом РЛС (ПОВНІСТЮ ОНОВЛЕНА)"""
+        report_widget = QWidget()
+        report_widget.setFixedWidth(220)
+        report_widget.setObjectName("report_panel")
         
         layout = QVBoxLayout()
         layout.setContentsMargins(15, 15, 15, 15)
@@ -3606,19 +4155,12 @@ class AzimuthGUI(QMainWindow):
         self.report_title = QLabel(self.tr("report_data"))
         self.report_title.setFont(QFont("Segoe UI", 14, QFont.Bold))
         self.report_title.setAlignment(Qt.AlignCenter)
-        self.report_title.setStyleSheet("font-size: 14pt; font-weight: bold; margin-bottom: 12px; color: #343a40;")
+        self.report_title.setObjectName("report_title")
         layout.addWidget(self.report_title)
         
         # Target data input section (СПОЧАТКУ ДАНІ ПРО ЦІЛЬ)
         manual_group = QFrame()
-        manual_group.setStyleSheet("""
-            QFrame {
-                background-color: white; 
-                border: 1px solid #dee2e6; 
-                border-radius: 6px; 
-                padding: 12px;
-            }
-        """)
+        manual_group.setObjectName("manual_group")
         manual_layout = QVBoxLayout()
         manual_layout.setSpacing(10)
         manual_group.setLayout(manual_layout)
@@ -3632,11 +4174,11 @@ class AzimuthGUI(QMainWindow):
         
         # Автоматичні поля (азимут, дальність)
         self.auto_azimuth_label = QLabel("β - --°")
-        self.auto_azimuth_label.setStyleSheet("font-weight: 500; color: #495057;")
+        self.auto_azimuth_label.setObjectName("auto_azimuth_label")
         manual_layout.addWidget(self.auto_azimuth_label)
         
         self.auto_distance_label = QLabel("D - -- км")
-        self.auto_distance_label.setStyleSheet("font-weight: 500; color: #495057;")
+        self.auto_distance_label.setObjectName("auto_distance_label")
         manual_layout.addWidget(self.auto_distance_label)
         
         # Висота (в одному рядку)
@@ -3647,7 +4189,7 @@ class AzimuthGUI(QMainWindow):
         height_container.setLayout(height_layout)
         
         height_label = QLabel("H –")
-        height_label.setStyleSheet("color: #495057; font-weight: 500;")
+        height_label.setObjectName("height_label")
         height_layout.addWidget(height_label)
         
         self.height_input = QLineEdit(self.current_height)
@@ -3656,7 +4198,7 @@ class AzimuthGUI(QMainWindow):
         height_layout.addWidget(self.height_input)
         
         units_label = QLabel(self.tr("km_unit"))
-        units_label.setStyleSheet("color: #6c757d;")
+        units_label.setObjectName("units_label")
         height_layout.addWidget(units_label)
         
         height_layout.addStretch()
@@ -3675,7 +4217,7 @@ class AzimuthGUI(QMainWindow):
         
         # Масштаб
         self.auto_scale_label = QLabel("M = --")
-        self.auto_scale_label.setStyleSheet("font-weight: 500; color: #495057;")
+        self.auto_scale_label.setObjectName("auto_scale_label")
         manual_layout.addWidget(self.auto_scale_label)
         
         layout.addWidget(manual_group)
@@ -3684,13 +4226,13 @@ class AzimuthGUI(QMainWindow):
         separator1 = QFrame()
         separator1.setFrameShape(QFrame.HLine)
         separator1.setFrameShadow(QFrame.Sunken)
-        separator1.setStyleSheet("color: #dee2e6; margin: 8px 0px;")
+        separator1.setObjectName("report_separator")
         layout.addWidget(separator1)
         
         # Azimuth Grid section
         self.azimuth_grid_label = QLabel(self.tr("azimuth_grid"))
         self.azimuth_grid_label.setFont(QFont("Segoe UI", 12, QFont.Bold))
-        self.azimuth_grid_label.setStyleSheet("color: #6c757d; font-weight: bold; margin-bottom: 8px;")
+        self.azimuth_grid_label.setObjectName("azimuth_grid_label")
         layout.addWidget(self.azimuth_grid_label)
         
         # Scale setting (в одному рядку)
@@ -3701,7 +4243,7 @@ class AzimuthGUI(QMainWindow):
         scale_container.setLayout(scale_layout)
         
         scale_label = QLabel(self.tr("scale_setting"))
-        scale_label.setStyleSheet("color: #495057; font-weight: 500;")
+        scale_label.setObjectName("scale_label")
         scale_layout.addWidget(scale_label)
         
         self.scale_combo = QComboBox()
@@ -3728,26 +4270,19 @@ class AzimuthGUI(QMainWindow):
         radar_separator = QFrame()
         radar_separator.setFrameShape(QFrame.HLine)
         radar_separator.setFrameShadow(QFrame.Sunken)
-        radar_separator.setStyleSheet("color: #dee2e6; margin: 12px 0px;")
+        radar_separator.setObjectName("radar_separator")
         layout.addWidget(radar_separator)
         
         # Checkbox для активації опису РЛС
         self.radar_description_checkbox = QCheckBox("Додати опис РЛС")
         self.radar_description_checkbox.setFont(QFont("Segoe UI", 12, QFont.Bold))
-        self.radar_description_checkbox.setStyleSheet("font-weight: bold; color: #495057; padding: 6px;")
+        self.radar_description_checkbox.setObjectName("radar_description_checkbox")
         self.radar_description_checkbox.toggled.connect(self.toggle_radar_description)
         layout.addWidget(self.radar_description_checkbox)
         
         # Група полів для опису РЛС
         radar_group = QFrame()
-        radar_group.setStyleSheet("""
-            QFrame {
-                background-color: white; 
-                border: 1px solid #dee2e6; 
-                border-radius: 6px; 
-                padding: 12px;
-            }
-        """)
+        radar_group.setObjectName("radar_group")
         radar_layout = QVBoxLayout()
         radar_layout.setSpacing(10)
         radar_group.setLayout(radar_layout)
@@ -3807,30 +4342,26 @@ class AzimuthGUI(QMainWindow):
 
     def move_center_and_save(self, dx, dy):
         """Переміщення центру з автоматичним збереженням налаштувань"""
+        if self._move_center(dx, dy, save=True):
+            self.add_result(self.tr("grid_settings_saved"))
+    
+    def _move_center(self, dx, dy, save):
+        """Спільне переміщення центру: перерахунок точки, оновлення вигляду і зуму"""
         if not self.processor:
             QMessageBox.warning(self, self.tr("warning"), self.tr("no_image_first"))
-            return
+            return False
         
         self.processor.move_center(dx, dy)
-        self.save_current_grid_settings()
-        
-        if self.current_click:
-            azimuth, range_val = self.calculate_azimuth_range(
-                self.current_click['x'], self.current_click['y']
-            )
-            self.current_click['azimuth'] = azimuth
-            self.current_click['range'] = range_val
-        
-        self.display_image()
-        self.update_results_display()
-        self.update_report_data()
+        if save:
+            self.save_current_grid_settings()
         
+        self.refresh_views(recompute_click=True)
         self.add_result(self.tr("center_moved").format(x=self.processor.center_x, 
                                                     y=self.processor.center_y))
-        self.add_result(self.tr("grid_settings_saved"))
         
-        if hasattr(self, 'image_label') and self.image_label.zoom_widget.isVisible():
+        if self.image_label is not None and self.image_label.zoom_widget.isVisible():
             self.image_label.zoom_widget.update_cursor_position(self.processor.center_x, self.processor.center_y)
+        return True
 
     def add_result(self, text):
         self.results_text.append(text)
@@ -3840,20 +4371,19 @@ class AzimuthGUI(QMainWindow):
         """Завантаження зображення зі збереженням налаштувань сітки"""
         try:
             self.current_image_path = file_path
-            scale_value = int(self.scale_combo.currentText())
+            self._display_pixmap_key = None
+            self._base_image_source = None
+            self._range_scale = None
+            self._drag_timer.stop()
+            self._pending_drag = None
+            scale_value = self._scale_value
             
-            self.processor = AzimuthImageProcessor(file_path, scale=scale_value)
+            preloaded = self._image_pool.pop(file_path, None)
+            self.processor = AzimuthImageProcessor(file_path, scale=scale_value,
+                                                   image=preloaded)
             
             if hasattr(self.processor, 'image') and self.processor.image:
-                original_mode = self.processor.image.mode
-                
-                if original_mode != 'RGB':
-                    if original_mode == 'RGBA':
-                        rgb_image = Image.new('RGB', self.processor.image.size, (255, 255, 255))
-                        rgb_image.paste(self.processor.image, mask=self.processor.image.split()[-1])
-                        self.processor.image = rgb_image
-                    else:
-                        self.processor.image = self.processor.image.convert('RGB')
+                self.processor.image = flatten_to_rgb(self.processor.image)
             
             # Застосовуємо збережені налаштування сітки
             self.apply_saved_grid_settings()
@@ -3861,18 +4391,46 @@ class AzimuthGUI(QMainWindow):
             # Очищуємо тільки точку аналізу, але НЕ налаштування сітки
             self.current_click = None
             
-            self.display_image()
-            self.update_results_display()
-            self.update_report_data()
+            self.refresh_views()
             
             self.add_result(f"{self.tr('loaded')}: {os.path.basename(file_path)}")
             if self.has_saved_grid_settings():
                 self.add_result(self.tr("grid_settings_applied"))
             
+            self.prefetch_neighbour_images(file_path)
+            
         except Exception as e:
             QMessageBox.critical(self, self.tr("error"), 
                                self.tr("could_not_load").format(error=str(e)))
     
+    def prefetch_neighbour_images(self, file_path):
+        """Фонове декодування попереднього і наступного зображення зі списку мініатюр"""
+        image_paths = self.thumbnail_widget.image_paths
+        try:
+            index = image_paths.index(file_path)
+        except ValueError:
+            return
+        
+        for neighbour in (index + 1, index - 1):
+            if not 0 <= neighbour < len(image_paths):
+                continue
+            path = image_paths[neighbour]
+            if path in self._image_pool:
+                self._image_pool.move_to_end(path)
+            elif path not in self._prefetch_pending:
+                self._prefetch_pending.add(path)
+                self._prefetch_pool.start(ImagePrefetchLoader(path, self._prefetch_signals))
+    
+    def on_image_prefetched(self, image_path, image):
+        """Додати декодоване зображення до LRU-пулу"""
+        self._prefetch_pending.discard(image_path)
+        if image_path == self.current_image_path:
+            return
+        self._image_pool[image_path] = image
+        self._image_pool.move_to_end(image_path)
+        while len(self._image_pool) > IMAGE_PREFETCH_POOL_SIZE:
+            self._image_pool.popitem(last=False)
+    
     def apply_saved_grid_settings(self):
         """Застосувати збережені налаштування сітки до нового зображення"""
         if not self.processor:
@@ -3930,46 +4488,94 @@ class AzimuthGUI(QMainWindow):
             'custom_scale_distance': self.custom_scale_distance,
             'scale_value': self.scale_combo.currentText()
         }
+        
+        # Ознака обчислюється один раз при збереженні, а не при кожному завантаженні
+        settings = self.saved_grid_settings
+        self._has_saved_settings = (settings['center_offset_x'] != 0 or 
+                                    settings['center_offset_y'] != 0 or
+                                    settings['scale_edge_relative'] is not None or
+                                    settings['scale_value'] != "300")
 
     def has_saved_grid_settings(self):
         """Перевірити чи є збережені налаштування сітки"""
-        return (self.saved_grid_settings['center_offset_x'] != 0 or 
-                self.saved_grid_settings['center_offset_y'] != 0 or
-                self.saved_grid_settings.get('scale_edge_relative') is not None or
-                self.saved_grid_settings['scale_value'] != "300")
+        return self._has_saved_settings
+    
+    def _display_state_key(self):
+        """Стан, від якого залежить намальоване зображення (без розміру віджета)"""
+        click = self.current_click
+        edge = self.scale_edge_point
+        return (
+            id(self.processor), id(self.processor.image),
+            self.processor.center_x, self.processor.center_y,
+            (click['x'], click['y']) if click else None,
+            (edge['x'], edge['y']) if edge else None,
+        )
+    
+    CROSS_SIZE = 15
+    
+    def _get_cross_sprite(self):
+        """Прозорий pixmap з червоним хрестиком і точкою центру (малюється один раз)"""
+        sprite = getattr(self, '_cross_sprite', None)
+        origin = self.CROSS_SIZE + 1
+        if sprite is None:
+            sprite = QPixmap(2 * origin + 1, 2 * origin + 1)
+            sprite.fill(Qt.transparent)
+            red = QColor('red')
+            
+            painter = QPainter(sprite)
+            painter.setPen(QPen(red, 2))
+            painter.drawLine(QLineF(origin - self.CROSS_SIZE, origin, origin + self.CROSS_SIZE, origin))
+            painter.drawLine(QLineF(origin, origin - self.CROSS_SIZE, origin, origin + self.CROSS_SIZE))
+            painter.setPen(QPen(QColor('white'), 1))
+            painter.setBrush(QBrush(red))
+            painter.drawEllipse(QPointF(origin, origin), 3, 3)
+            painter.end()
+            
+            self._cross_sprite = sprite
+        return sprite, origin
     
-    def display_image(self):
+    def display_image(self, transformation=Qt.SmoothTransformation):
         if not self.processor:
             return
         
-        pil_image = self.processor.image.copy()
-        draw = ImageDraw.Draw(pil_image)
+        # Якщо змінився лише розмір віджета - перемасштабовуємо вже готовий pixmap
+        state_key = self._display_state_key()
+        if getattr(self, '_display_pixmap_key', None) == state_key:
+            self._show_display_pixmap(self._display_pixmap, transformation)
+            return
+        
+        # Незмінене зображення конвертується в RGB32 QImage один раз на зображення
+        if getattr(self, '_base_image_source', None) is not self.processor.image:
+            self._base_image = pil_to_qimage(self.processor.image)
+            self._base_image_source = self.processor.image
+        
+        # Розмітка малюється QPainter на копії базового QImage (без копії PIL-зображення)
+        canvas = self._base_image.copy()
+        painter = QPainter(canvas)
         
         center_x, center_y = self.processor.center_x, self.processor.center_y
-        cross_size = 15
         
-        # Малюємо червоний хрестик в центрі
-        draw.line([center_x - cross_size, center_y, center_x + cross_size, center_y], 
-                fill='red', width=2)
-        draw.line([center_x, center_y - cross_size, center_x, center_y + cross_size], 
-                fill='red', width=2)
-        draw.ellipse([center_x - 3, center_y - 3, center_x + 3, center_y + 3], 
-                    fill='red', outline='white')
+        # Червоний хрестик в центрі - один готовий спрайт
+        cross_sprite, cross_origin = self._get_cross_sprite()
+        painter.drawPixmap(int(center_x) - cross_origin, int(center_y) - cross_origin, cross_sprite)
+        
+        white_pen = QPen(QColor('white'), 1)
         
         if self.current_click:
             click_x, click_y = self.current_click['x'], self.current_click['y']
+            blue = QColor('blue')
             
             # Малюємо синю точку аналізу
-            draw.ellipse([click_x - 4, click_y - 4, click_x + 4, click_y + 4], 
-                        fill='blue', outline='white', width=1)
+            painter.setPen(white_pen)
+            painter.setBrush(QBrush(blue))
+            painter.drawEllipse(QPointF(click_x, click_y), 4, 4)
             
             # ОНОВЛЕНА ЛІНІЯ: Розраховуємо кінцеву позицію як в документі
-            image_width = pil_image.width
-            image_height = pil_image.height
+            image_width = canvas.width()
+            image_height = canvas.height()
             
             # Розрахунок позиції кінця лінії (на рівні підкреслення номера цілі)
             # Використовуємо ту ж логіку що й в create_processed_image_from_data
-            right_cell_start_x = int(image_width * 0.85)  # Права комірка починається з 85% ширини
             underline_y = int(image_height * 0.1)         # Позиція підкреслення: 10% висоти зверху
             
             # Кінцева точка лінії: самий правий край на рівні підкреслення
@@ -3977,63 +4583,83 @@ class AzimuthGUI(QMainWindow):
             end_y = underline_y      # На висоті підкреслення номера цілі
             
             # Малюємо оновлену лінію від точки аналізу до розрахованої позиції
-            draw.line([click_x, click_y, end_x, end_y], fill='blue', width=3)
+            painter.setPen(QPen(blue, 3))
+            painter.drawLine(QLineF(click_x, click_y, end_x, end_y))
         
         # Малюємо зелену точку та лінію для scale edge (якщо є)
         if self.scale_edge_point:
             edge_x, edge_y = self.scale_edge_point['x'], self.scale_edge_point['y']
+            green = QColor('green')
+            green_pen = QPen(green, 2)
             
-            draw.ellipse([edge_x - 5, edge_y - 5, edge_x + 5, edge_y + 5], 
-                        fill='green', outline='white', width=2)
+            painter.setPen(QPen(QColor('white'), 2))
+            painter.setBrush(QBrush(green))
+            painter.drawEllipse(QPointF(edge_x, edge_y), 5, 5)
             
-            draw.line([center_x, center_y, edge_x, edge_y], fill='green', width=2)
+            painter.setPen(green_pen)
+            painter.drawLine(QLineF(center_x, center_y, edge_x, edge_y))
             
             # Перпендикулярна лінія на кінці
             dx = edge_x - center_x
             dy = edge_y - center_y
-            length = math.sqrt(dx*dx + dy*dy)
+            length = math.hypot(dx, dy)
             if length > 0:
-                nx, ny = -dy/length, dx/length
+                inv_length = 1.0 / length
+                nx, ny = -dy * inv_length, dx * inv_length
                 perp_size = 8
-                draw.line([
+                painter.drawLine(QLineF(
                     edge_x + nx*perp_size, edge_y + ny*perp_size,
                     edge_x - nx*perp_size, edge_y - ny*perp_size
-                ], fill='green', width=2)
-        
-        # Зберігаємо та відображаємо зображення
-        with tempfile.NamedTemporaryFile(suffix='.jpg', delete=False) as temp_file:
-            temp_path = temp_file.name
-            pil_image.save(temp_path, 'JPEG', quality=95)
+                ))
         
-        pixmap = QPixmap(temp_path)
+        painter.end()
         
-        try:
-            os.remove(temp_path)
-        except:
-            pass
+        # Формат вже RGB32, тож перетворення в pixmap - без конвертації пікселів
+        pixmap = QPixmap.fromImage(canvas, Qt.NoFormatConversion)
         
+        self._display_pixmap = pixmap
+        self._display_pixmap_key = state_key
+        self._show_display_pixmap(pixmap, transformation)
+    
+    def _show_display_pixmap(self, pixmap, transformation=Qt.SmoothTransformation):
+        """Масштабування готового pixmap під розмір віджета та оновлення геометрії"""
         widget_width = self.image_label.width()
         widget_height = self.image_label.height()
         
-        scaled_pixmap = pixmap.scaled(widget_width, widget_height, 
-                                    Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        if transformation == Qt.FastTransformation:
+            # Проміжні кадри перетягування: найближчий сусід, без запису в кеш
+            scaled_pixmap = pixmap.scaled(widget_width, widget_height, 
+                                        Qt.KeepAspectRatio, Qt.FastTransformation)
+        else:
+            # Масштабовані копії кешуються за вмістом pixmap і розміром віджета
+            cache_key = f"display:{pixmap.cacheKey()}:{widget_width}x{widget_height}"
+            scaled_pixmap = QPixmapCache.find(cache_key)
+            if scaled_pixmap is None or scaled_pixmap.isNull():
+                scaled_pixmap = pixmap.scaled(widget_width, widget_height, 
+                                            Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                QPixmapCache.insert(cache_key, scaled_pixmap)
         
         original_width = pixmap.width()
         original_height = pixmap.height()
         scaled_width = scaled_pixmap.width()
         scaled_height = scaled_pixmap.height()
         
-        self.scale_factor_x = scaled_width / original_width
-        self.scale_factor_y = scaled_height / original_height
-        
-        self.offset_x = (widget_width - scaled_width) // 2
-        self.offset_y = (widget_height - scaled_height) // 2
-        
-        self.image_label.update_image_geometry(
-            original_width, original_height,
-            self.scale_factor_x, self.scale_factor_y,
-            self.offset_x, self.offset_y
-        )
+        # Коефіцієнти і зміщення змінюються лише зі зміною розміру віджета чи зображення
+        geometry_key = (widget_width, widget_height, original_width, original_height,
+                        scaled_width, scaled_height)
+        if geometry_key != getattr(self, '_display_geometry_key', None):
+            self.scale_factor_x = scaled_width / original_width
+            self.scale_factor_y = scaled_height / original_height
+            
+            self.offset_x = (widget_width - scaled_width) // 2
+            self.offset_y = (widget_height - scaled_height) // 2
+            
+            self.image_label.update_image_geometry(
+                original_width, original_height,
+                self.scale_factor_x, self.scale_factor_y,
+                self.offset_x, self.offset_y
+            )
+            self._display_geometry_key = geometry_key
         
         self.image_label.set_zoom_source_image(pixmap)
         self.image_label.setPixmap(scaled_pixmap)
@@ -4050,17 +4676,8 @@ class AzimuthGUI(QMainWindow):
             self.set_center_point(x, y)
             return
 
-        if self.current_click:
-            existing_widget_x = self.current_click['x'] * self.scale_factor_x + self.offset_x
-            existing_widget_y = self.current_click['y'] * self.scale_factor_y + self.offset_y
-        
-            clicked_widget_x = x * self.scale_factor_x + self.offset_x
-            clicked_widget_y = y * self.scale_factor_y + self.offset_y
-        
-            distance = ((clicked_widget_x - existing_widget_x)**2 + (clicked_widget_y - existing_widget_y)**2)**0.5
-        
-            if distance <= 15:
-                return
+        if self.current_click and self._near_analysis_point(x, y):
+            return
 
         self.place_analysis_point(x, y)
     
@@ -4073,36 +4690,55 @@ class AzimuthGUI(QMainWindow):
         if self.scale_edge_mode or self.center_setting_mode:
             return
         
-        # Перетягуємо точку аналізу
-        self.place_analysis_point(x, y)
+        # Перетягуємо точку аналізу - лише остання позиція за інтервал таймера
+        self._pending_drag = (x, y)
+        if not self._drag_timer.isActive():
+            self._drag_timer.start()
+    
+    def _flush_drag(self):
+        if self._pending_drag is not None and self.processor:
+            self.place_analysis_point(*self._pending_drag, interactive=True)
+        self._pending_drag = None
+    
+    def _near_analysis_point(self, x, y, radius=15):
+        """Чи знаходиться точка (у координатах зображення) в межах radius пікселів віджета від точки аналізу"""
+        # Зміщення віджета однакове для обох точок, тому різницю рахуємо одразу в масштабі
+        dx = (x - self.current_click['x']) * self.scale_factor_x
+        dy = (y - self.current_click['y']) * self.scale_factor_y
+        
+        # Швидке відсікання по квадрату, далі порівняння квадратів відстаней (без кореня)
+        if abs(dx) > radius or abs(dy) > radius:
+            return False
+        
+        return dx*dx + dy*dy <= radius*radius
+    
+    def _hide_hover_tooltip(self):
+        if self._tooltip_shown:
+            QToolTip.hideText()
+            self._tooltip_shown = False
     
     def on_mouse_hover(self, x, y):
         if not self.processor or not self.current_click:
-            QToolTip.hideText()
+            self._hide_hover_tooltip()
             return
         
-        hover_widget_x = x * self.scale_factor_x + self.offset_x
-        hover_widget_y = y * self.scale_factor_y + self.offset_y
-        
-        existing_widget_x = self.current_click['x'] * self.scale_factor_x + self.offset_x
-        existing_widget_y = self.current_click['y'] * self.scale_factor_y + self.offset_y
-        
-        distance = ((hover_widget_x - existing_widget_x)**2 + (hover_widget_y - existing_widget_y)**2)**0.5
-        
-        if distance <= 15:
-            azimuth = self.current_click['azimuth']
-            range_val = self.current_click['range']
-            tooltip_text = f"{self.tr('azimuth')}: {azimuth:.0f}°\n{self.tr('range')}: {range_val:.0f} км"
+        if self._near_analysis_point(x, y):
+            hover_widget_x = x * self.scale_factor_x + self.offset_x
+            hover_widget_y = y * self.scale_factor_y + self.offset_y
+            
+            tooltip_text = self._hover_tooltip_format.format(
+                azimuth=self.current_click['azimuth'], range=self.current_click['range'])
             
             point = self.image_label.mapToGlobal(self.image_label.rect().topLeft())
             tooltip_x = point.x() + hover_widget_x + 15
             tooltip_y = point.y() + hover_widget_y - 10
             
             QToolTip.showText(QPoint(int(tooltip_x), int(tooltip_y)), tooltip_text)
+            self._tooltip_shown = True
         else:
-            QToolTip.hideText()
+            self._hide_hover_tooltip()
     
-    def place_analysis_point(self, x, y):
+    def place_analysis_point(self, x, y, interactive=False):
         if not self.processor:
             return
         
@@ -4117,9 +4753,7 @@ class AzimuthGUI(QMainWindow):
                 'azimuth': azimuth, 'range': range_val
             }
             
-            self.display_image()
-            self.update_results_display()
-            self.update_report_data()
+            self.refresh_views(interactive=interactive)
             
         except Exception as e:
             QMessageBox.critical(self, self.tr("error"), f"Could not process point: {str(e)}")
@@ -4128,15 +4762,8 @@ class AzimuthGUI(QMainWindow):
         dx = x - self.processor.center_x
         dy = self.processor.center_y - y
         
-        range_pixels = math.sqrt(dx**2 + dy**2)
-        
-        if self.custom_scale_distance:
-            scale_value = int(self.scale_combo.currentText())
-            range_actual = (range_pixels / self.custom_scale_distance) * scale_value
-        else:
-            bottom_edge_distance = self.processor.image.height - self.processor.center_y
-            scale_value = int(self.scale_combo.currentText())
-            range_actual = (range_pixels / bottom_edge_distance) * scale_value
+        range_pixels = math.sqrt(dx*dx + dy*dy)
+        range_actual = range_pixels * self._get_range_scale()
         
         azimuth_radians = math.atan2(dx, dy)
         azimuth_degrees = math.degrees(azimuth_radians)
@@ -4146,27 +4773,34 @@ class AzimuthGUI(QMainWindow):
             
         return azimuth_degrees, range_actual
     
+    def _get_range_scale(self):
+        """Множник пікселі -> дальність (кешується до зміни центру, краю масштабу або масштабу)"""
+        if self._range_scale is None:
+            if self.custom_scale_distance:
+                reference_distance = self.custom_scale_distance
+            else:
+                reference_distance = self.processor.image.height - self.processor.center_y
+            self._range_scale = self._scale_value / reference_distance
+        return self._range_scale
+    
     def toggle_center_setting_mode(self):
         self.center_setting_mode = self.set_center_btn.isChecked()
         
         if self.center_setting_mode and self.scale_edge_mode:
             self.scale_edge_mode = False
             self.scale_edge_btn.setChecked(False)
-            self.scale_edge_btn.setStyleSheet("")
         
         self.image_label.set_center_setting_mode(self.center_setting_mode)
         
         if self.center_setting_mode:
-            self.set_center_btn.setStyleSheet("background-color: #495057; color: white; border: 2px solid #343a40;")
-            
             #  ДАЄМО ФОКУС ЗОБРАЖЕННЮ ДЛЯ ЗБЕРЕЖЕННЯ ФУНКЦІОНАЛЬНОСТІ МИШІ
-            if hasattr(self, 'image_label'):
+            if self.image_label is not None:
                 self.image_label.setFocus()
                 # Встановлюємо политику фокусу
                 self.image_label.setFocusPolicy(Qt.StrongFocus)
             
             #  ПОКАЗУЄМО ЗУМ НА ПОТОЧНІЙ ПОЗИЦІЇ ЦЕНТРУ
-            if hasattr(self, 'image_label') and self.processor:
+            if self.image_label is not None and self.processor:
                 self.image_label.zoom_widget.show_zoom()
                 self.image_label.zoom_widget.update_cursor_position(
                     self.processor.center_x, self.processor.center_y
@@ -4174,12 +4808,11 @@ class AzimuthGUI(QMainWindow):
             self.add_result("🎯 Режим центру: ←→↑↓ для переміщення, Esc для виходу")
             self.add_result("   Shift+стрілка = швидше, Ctrl+стрілка = точніше")
         else:
-            self.set_center_btn.setStyleSheet("")
             #  ВІДНОВЛЮЄМО СТАНДАРТНУ ПОЛІТИКУ ФОКУСУ
-            if hasattr(self, 'image_label'):
+            if self.image_label is not None:
                 self.image_label.setFocusPolicy(Qt.ClickFocus)
             #  ХОВАЄМО ЗУМ
-            if hasattr(self, 'image_label'):
+            if self.image_label is not None:
                 self.image_label.zoom_widget.hide_zoom()
 
     def toggle_scale_edge_mode(self):
@@ -4188,21 +4821,18 @@ class AzimuthGUI(QMainWindow):
         if self.scale_edge_mode and self.center_setting_mode:
             self.center_setting_mode = False
             self.set_center_btn.setChecked(False)
-            self.set_center_btn.setStyleSheet("")
         
         self.image_label.set_scale_edge_mode(self.scale_edge_mode)
         
         if self.scale_edge_mode:
-            self.scale_edge_btn.setStyleSheet("background-color: #495057; color: white; border: 2px solid #343a40;")
-            
             #  ДАЄМО ФОКУС ЗОБРАЖЕННЮ ДЛЯ ЗБЕРЕЖЕННЯ ФУНКЦІОНАЛЬНОСТІ МИШІ
-            if hasattr(self, 'image_label'):
+            if self.image_label is not None:
                 self.image_label.setFocus()
                 # Встановлюємо политику фокусу
                 self.image_label.setFocusPolicy(Qt.StrongFocus)
             
             #  ПОКАЗУЄМО ЗУМ НА ПОЗИЦІЇ КРАЮ МАСШТАБУ
-            if hasattr(self, 'image_label') and self.processor:
+            if self.image_label is not None and self.processor:
                 if self.scale_edge_point:
                     self.image_label.zoom_widget.show_zoom()
                     self.image_label.zoom_widget.update_cursor_position(
@@ -4217,12 +4847,11 @@ class AzimuthGUI(QMainWindow):
             self.add_result("📏 Режим масштабу: ←→↑↓ для переміщення, Esc для виходу")
             self.add_result("   Shift+стрілка = швидше, Ctrl+стрілка = точніше")
         else:
-            self.scale_edge_btn.setStyleSheet("")
             #  ВІДНОВЛЮЄМО СТАНДАРТНУ ПОЛІТИКУ ФОКУСУ
-            if hasattr(self, 'image_label'):
+            if self.image_label is not None:
                 self.image_label.setFocusPolicy(Qt.ClickFocus)
             #  ХОВАЄМО ЗУМ
-            if hasattr(self, 'image_label'):
+            if self.image_label is not None:
                 self.image_label.zoom_widget.hide_zoom()
     
     def set_center_point(self, x, y):
@@ -4243,22 +4872,12 @@ class AzimuthGUI(QMainWindow):
         self.save_current_grid_settings()
         
         #  ОНОВЛЮЄМО ЗУМ НА НОВІЙ ПОЗИЦІЇ
-        if hasattr(self, 'image_label'):
+        if self.image_label is not None:
             self.image_label.zoom_widget.update_cursor_position(
                 self.processor.center_x, self.processor.center_y
             )
         
-        self.display_image()
-        
-        if self.current_click:
-            azimuth, range_val = self.calculate_azimuth_range(
-                self.current_click['x'], self.current_click['y']
-            )
-            self.current_click['azimuth'] = azimuth
-            self.current_click['range'] = range_val
-        
-        self.update_results_display()
-        self.update_report_data()
+        self.refresh_views(recompute_click=True)
         self.add_result(f"Центр встановлено: ({self.processor.center_x}, {self.processor.center_y})")
 
     
@@ -4276,20 +4895,10 @@ class AzimuthGUI(QMainWindow):
         self.save_current_grid_settings()
         
         #  ОНОВЛЮЄМО ЗУМ НА НОВІЙ ПОЗИЦІЇ
-        if hasattr(self, 'image_label'):
+        if self.image_label is not None:
             self.image_label.zoom_widget.update_cursor_position(x, y)
         
-        self.display_image()
-        
-        if self.current_click:
-            azimuth, range_val = self.calculate_azimuth_range(
-                self.current_click['x'], self.current_click['y']
-            )
-            self.current_click['azimuth'] = azimuth
-            self.current_click['range'] = range_val
-        
-        self.update_results_display()
-        self.update_report_data()
+        self.refresh_views(recompute_click=True)
         self.add_result(f"Край масштабу: ({x}, {y}) | Відстань: {distance:.1f}px")
 
     def update_target_number(self, text):
@@ -4304,7 +4913,37 @@ class AzimuthGUI(QMainWindow):
     def update_detection(self, text):
         self.current_detection = text
     
-    def update_report_data(self):
+    def refresh_views(self, recompute_click=False, redraw=True, interactive=False):
+        """Спільне оновлення після зміни сітки чи точки: зображення, результати, звіт"""
+        if recompute_click:
+            # Центр, край масштабу або масштаб могли змінитися
+            self._range_scale = None
+        
+        if recompute_click and self.current_click:
+            azimuth, range_val = self.calculate_azimuth_range(
+                self.current_click['x'], self.current_click['y']
+            )
+            self.current_click['azimuth'] = azimuth
+            self.current_click['range'] = range_val
+        
+        if redraw and self.processor:
+            self.display_image(Qt.FastTransformation if interactive else Qt.SmoothTransformation)
+        
+        if interactive:
+            # Азимут і дальність вже видно в мітках звіту, текст перекомпонуємо після паузи
+            self._idle_timer.start()
+        else:
+            self._idle_timer.stop()
+            self.update_results_display(self._scale_value)
+        self.update_report_data(self._scale_value)
+    
+    def _finish_interactive_update(self):
+        """Після зупинки перетягування: згладжене зображення і повний текст результатів"""
+        if self.processor:
+            self.display_image()
+        self.update_results_display()
+    
+    def update_report_data(self, scale=None):
         """Оновлення даних в правій панелі (азимут, дальність, масштаб)"""
         if not self.processor:
             self.auto_azimuth_label.setText("β - --°")
@@ -4312,10 +4951,12 @@ class AzimuthGUI(QMainWindow):
             self.auto_scale_label.setText("M = --")
             return
             
+        if scale is None:
+            scale = self._scale_value
+        
         if self.current_click:
             azimuth = self.current_click['azimuth']
             distance = self.current_click['range']
-            scale = int(self.scale_combo.currentText())
             
             self.auto_azimuth_label.setText(f"β - {azimuth:.0f}ᴼ")
             self.auto_distance_label.setText(f"D - {distance:.0f} км")  # ← ЗМІНЕНО .1f на .0f
@@ -4323,93 +4964,81 @@ class AzimuthGUI(QMainWindow):
         else:
             self.auto_azimuth_label.setText("β - --ᴼ")
             self.auto_distance_label.setText("D - -- км")
-            
-            if hasattr(self, 'scale_combo'):
-                scale = int(self.scale_combo.currentText())
-                self.auto_scale_label.setText(f"M = {scale}")
-            else:
-                self.auto_scale_label.setText("M = --")
+            self.auto_scale_label.setText(f"M = {scale}")
 
-    def update_results_display(self):
-        self.results_text.clear()
+    def _results_header_lines(self, scale):
+        """Незмінна частина результатів (зображення, масштаб, центр) - перебудовується лише при змінах"""
+        if not self.processor:
+            return []
+        
+        header_key = (self.current_image_path, self.current_language, scale,
+                      self.processor.center_x, self.processor.center_y, self.custom_scale_distance)
+        if header_key == self._results_header_key:
+            return self._results_header
+        
+        lines = [
+            self.tr("image_info").format(name=os.path.basename(self.current_image_path)),
+            self.tr("size").format(width=self.processor.image.width, 
+                                   height=self.processor.image.height),
+            self.tr("scale_info").format(scale=scale),
+            self.tr("center_info").format(x=self.processor.center_x, 
+                                          y=self.processor.center_y),
+        ]
+        if self.custom_scale_distance:
+            lines.append(f"Custom scale edge: {self.custom_scale_distance:.1f} px = {scale} units")
+        else:
+            bottom_distance = self.processor.image.height - self.processor.center_y
+            lines.append(self.tr("bottom_edge").format(scale=scale))
+            lines.append(self.tr("pixels_south").format(pixels=bottom_distance))
+        lines.append("")
+        
+        self._results_header_key = header_key
+        self._results_header = lines
+        return lines
+    
+    def update_results_display(self, scale=None):
+        if scale is None:
+            scale = self._scale_value
         
-        if self.processor:
-            self.add_result(self.tr("image_info").format(name=os.path.basename(self.current_image_path)))
-            self.add_result(self.tr("size").format(width=self.processor.image.width, 
-                                                  height=self.processor.image.height))
-            self.add_result(self.tr("scale_info").format(scale=int(self.scale_combo.currentText())))
-            self.add_result(self.tr("center_info").format(x=self.processor.center_x, 
-                                                         y=self.processor.center_y))
-            
-            if self.custom_scale_distance:
-                self.add_result(f"Custom scale edge: {self.custom_scale_distance:.1f} px = {self.scale_combo.currentText()} units")
-            else:
-                bottom_distance = self.processor.image.height - self.processor.center_y
-                self.add_result(self.tr("bottom_edge").format(scale=int(self.scale_combo.currentText())))
-                self.add_result(self.tr("pixels_south").format(pixels=bottom_distance))
-            self.add_result("")
+        # Текст збирається повністю і встановлюється одним викликом (одне перекомпонування документа)
+        lines = list(self._results_header_lines(scale))
         
         if self.current_click:
-            self.add_result(self.tr("analysis_point"))
-            self.add_result(f"{self.tr('position')}: ({self.current_click['x']}, {self.current_click['y']})")
-            self.add_result(f"{self.tr('azimuth')}: {self.current_click['azimuth']:.0f}ᴼ")
-            self.add_result(f"{self.tr('range')}: {self.current_click['range']:.0f} км")  # ← ЗМІНЕНО .0f
-            self.add_result("")
-            self.add_result(self.tr("click_to_place"))
-            self.add_result(self.tr("drag_to_move"))
-            self.add_result(self.tr("line_connects"))
+            lines.append(self.tr("analysis_point"))
+            lines.append(f"{self.tr('position')}: ({self.current_click['x']}, {self.current_click['y']})")
+            lines.append(f"{self.tr('azimuth')}: {self.current_click['azimuth']:.0f}ᴼ")
+            lines.append(f"{self.tr('range')}: {self.current_click['range']:.0f} км")  # ← ЗМІНЕНО .0f
+            lines.append("")
+            lines.append(self.tr("click_to_place"))
+            lines.append(self.tr("drag_to_move"))
+            lines.append(self.tr("line_connects"))
         else:
-            self.add_result(self.tr("click_on_image"))
+            lines.append(self.tr("click_on_image"))
+        
+        self.results_text.setPlainText("\n".join(lines))
 
     def update_scale(self):
         """Оновлення масштабу з збереженням налаштувань"""
+        self._scale_value = int(self.scale_combo.currentText())
+        self._range_scale = None
+        
         if self.processor:
-            new_scale = int(self.scale_combo.currentText())
+            new_scale = self._scale_value
             
             # ЗБЕРЕГТИ налаштування сітки
             self.save_current_grid_settings()
             
-            if self.current_click:
-                azimuth, range_val = self.calculate_azimuth_range(
-                    self.current_click['x'], self.current_click['y']
-                )
-                self.current_click['azimuth'] = azimuth
-                self.current_click['range'] = range_val
-            
-            self.update_results_display()
-            self.update_report_data()
+            # Масштаб не змінює намальоване зображення - лише числові дані
+            self.refresh_views(recompute_click=True, redraw=False)
             self.add_result(self.tr("scale_updated").format(scale=new_scale))
             self.add_result("Grid settings saved for next images")
     
     def move_center(self, dx, dy):
-        if not self.processor:
-            QMessageBox.warning(self, self.tr("warning"), self.tr("no_image_first"))
-            return
-        
-        self.processor.move_center(dx, dy)
-        
-        if self.current_click:
-            azimuth, range_val = self.calculate_azimuth_range(
-                self.current_click['x'], self.current_click['y']
-            )
-            self.current_click['azimuth'] = azimuth
-            self.current_click['range'] = range_val
-        
-        self.display_image()
-        self.update_results_display()
-        self.update_report_data()
-        self.add_result(self.tr("center_moved").format(x=self.processor.center_x, 
-                                                    y=self.processor.center_y))
-    
-        if self.image_label.zoom_widget.isVisible():
-            self.image_label.zoom_widget.update_cursor_position(self.processor.center_x, self.processor.center_y)
+        self._move_center(dx, dy, save=False)
     
     def clear_results(self):
         self.current_click = None
-        if self.processor:
-            self.display_image()
-        self.update_results_display()
-        self.update_report_data()
+        self.refresh_views()
 
     def save_current_image(self):
         if not self.processor:
@@ -4427,16 +5056,14 @@ class AzimuthGUI(QMainWindow):
         
         if file_path:
             try:
-                final_image = self.processor.image.copy()
+                source_image = self.processor.image
+                is_png = file_path.lower().endswith('.png')
                 
-                if file_path.lower().endswith(('.jpg', '.jpeg')):
-                    if final_image.mode != 'RGB':
-                        if final_image.mode == 'RGBA':
-                            rgb_image = Image.new('RGB', final_image.size, (255, 255, 255))
-                            rgb_image.paste(final_image, mask=final_image.split()[-1])
-                            final_image = rgb_image
-                        else:
-                            final_image = final_image.convert('RGB')
+                # Одна нова копія під малювання: конвертація в RGB сама створює нове зображення
+                if not is_png and source_image.mode != 'RGB':
+                    final_image = flatten_to_rgb(source_image)
+                else:
+                    final_image = source_image.copy()
                 
                 draw = ImageDraw.Draw(final_image)
                 
@@ -4445,7 +5072,7 @@ class AzimuthGUI(QMainWindow):
                     (final_image.width - 1, 0)
                 ], fill='blue', width=3)
                 
-                if file_path.lower().endswith('.png'):
+                if is_png:
                     final_image.save(file_path, 'PNG')
                 else:
                     final_image.save(file_path, 'JPEG', quality=95)
@@ -4477,7 +5104,7 @@ class AzimuthGUI(QMainWindow):
                 'height': self.current_height,
                 'obstacles': self.current_obstacles,
                 'detection': self.current_detection,
-                'scale': int(self.scale_combo.currentText())
+                'scale': self._scale_value
             },
             'processor_settings': {
                 'center_x': self.processor.center_x,
@@ -4547,9 +5174,7 @@ class AzimuthGUI(QMainWindow):
         self.reset_form_data()
         
         # Оновлюємо відображення
-        self.display_image()
-        self.update_results_display()
-        self.update_report_data()
+        self.refresh_views()
         
         self.add_result(f"✗ Скасовано зміни для: {os.path.basename(self.current_image_path)}")
         self.add_result(f"Залишилось оброблених зображень: {len(self.processed_images)}")
@@ -4582,9 +5207,7 @@ class AzimuthGUI(QMainWindow):
             self.reset_form_data()
             
             # Оновлюємо відображення
-            self.display_image()
-            self.update_results_display()
-            self.update_report_data()
+            self.refresh_views()
             
             self.add_result("🗑️ Очищено всі оброблені зображення")
             self.add_result("Всі зображення повернуто до необробленого стану")
@@ -4610,10 +5233,16 @@ class AzimuthGUI(QMainWindow):
 # ===== ГОЛОВНА ФУНКЦІЯ ТА ЗАПУСК ПРОГРАМИ =====
 
 def main():
+    # Типовий рівень WARNING: детальна діагностика (DEBUG/INFO) лише за явного налаштування
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
     app = QApplication(sys.argv)
+    # Місце для мініатюр і масштабованих копій поточного зображення (у КБ)
+    QPixmapCache.setCacheLimit(65536)
     window = AzimuthGUI()
     window.show()
     sys.exit(app.exec_())
 
 if __name__ == "__main__":
+    # У зібраному (PyInstaller) exe процеси пулу не повинні повторно запускати GUI
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
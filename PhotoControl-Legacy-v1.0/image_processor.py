@@ -9,7 +9,7 @@ from PIL import Image, ImageDraw, ImageOps
 import os
 
 class AzimuthImageProcessor:
-    def __init__(self, image_path, center_x=None, center_y=None, scale=300):
+    def __init__(self, image_path, center_x=None, center_y=None, scale=300, image=None):
         """
         Initialize the processor with an image
         
@@ -17,9 +17,10 @@ class AzimuthImageProcessor:
             image_path: Path to the image file
             center_x, center_y: Center coordinates of azimuth grid (if None, use image center)
             scale: Scale value for range calculations (default 300)
+            image: Already decoded PIL image for image_path (skips Image.open)
         """
         self.image_path = image_path
-        self.original_image = Image.open(image_path)  # Keep original unchanged
+        self.original_image = image if image is not None else Image.open(image_path)  # Keep original unchanged
         self.image = self.original_image.copy()  # Working copy
         self.scale = scale
         
@@ -167,7 +168,7 @@ class AzimuthImageProcessor:
         dy = self.center_y - click_y  # Invert Y axis (image coordinates vs mathematical coordinates)
         
         # Calculate range (distance from center)
-        range_pixels = math.sqrt(dx**2 + dy**2)
+        range_pixels = math.sqrt(dx*dx + dy*dy)
         
         # Calculate distance from center to bottom edge (azimuth 180°)
         # This is our reference distance for the scale
@@ -4,12 +4,16 @@ Enhanced widgets with zoom functionality for precise scale edge setting
 """
 
 import os
+import hashlib
+import logging
 import tempfile
 from PyQt5.QtWidgets import QLabel, QWidget, QVBoxLayout, QFrame, QSizePolicy
-from PyQt5.QtCore import Qt, QSize, pyqtSignal, QTimer
-from PyQt5.QtGui import QPixmap, QFont, QCursor, QPainter, QPen
+from PyQt5.QtCore import Qt, QSize, pyqtSignal, QTimer, QObject, QRunnable, QThreadPool
+from PyQt5.QtGui import QPixmap, QPixmapCache, QFont, QCursor, QPainter, QPen, QImage, QImageReader
 from PIL import Image, ImageDraw
 
+log = logging.getLogger(__name__)
+
 class ZoomWidget(QLabel):
     """Small zoom window that shows magnified area around cursor"""
     
@@ -146,6 +150,14 @@ class ClickableLabel(QLabel):
         self.zoom_update_timer.setSingleShot(True)
         self.zoom_update_timer.timeout.connect(self.update_zoom_delayed)
         
+        # Рух миші: mouse_moved не частіше одного разу за кадр, з останньою позицією
+        self._pending_move = None
+        self._move_timer = QTimer(self)
+        self._move_timer.setSingleShot(True)
+        self._move_timer.setTimerType(Qt.CoarseTimer)
+        self._move_timer.setInterval(16)
+        self._move_timer.timeout.connect(self._emit_pending_move)
+        
     def set_scale_edge_mode(self, enabled):
         """Enable/disable scale edge setting mode"""
         self.scale_edge_mode = enabled
@@ -181,8 +193,9 @@ class ClickableLabel(QLabel):
         self.original_image_width = image_width
         self.original_image_height = image_height
         
-        print(f"ClickableLabel geometry updated: display({self.image_display_width}x{self.image_display_height}) "
-              f"offset({self.image_offset_x}, {self.image_offset_y}) scale({scale_factor_x:.3f}, {scale_factor_y:.3f})")
+        log.debug("ClickableLabel geometry updated: display(%dx%d) offset(%s, %s) scale(%.3f, %.3f)",
+                  self.image_display_width, self.image_display_height,
+                  self.image_offset_x, self.image_offset_y, scale_factor_x, scale_factor_y)
     
     def set_zoom_source_image(self, pixmap):
         """Set the source image for zoom widget"""
@@ -265,9 +278,9 @@ class ClickableLabel(QLabel):
                 # Convert to image coordinates immediately
                 image_x, image_y = self.widget_to_image_coords(widget_x, widget_y)
                 
-                print(f"Click: widget({widget_x}, {widget_y}) -> image({image_x}, {image_y})")
-                print(f"Scale edge mode: {self.scale_edge_mode}")
-                print(f"Center setting mode: {getattr(self, 'center_setting_mode', False)}")
+                log.debug("Click: widget(%d, %d) -> image(%d, %d)", widget_x, widget_y, image_x, image_y)
+                log.debug("Scale edge mode: %s", self.scale_edge_mode)
+                log.debug("Center setting mode: %s", getattr(self, 'center_setting_mode', False))
                 
                 # ONLY emit click signal if NOT in special modes
                 if not self.scale_edge_mode and not getattr(self, 'center_setting_mode', False):
@@ -288,10 +301,11 @@ class ClickableLabel(QLabel):
         if (self.scale_edge_mode or getattr(self, 'center_setting_mode', False)) and self.is_click_on_image(widget_x, widget_y):
             self.update_zoom_immediately()
         
-        # Always emit mouse move for hover effects
+        # Always emit mouse move for hover effects (coalesced by _move_timer)
         if hasattr(self, 'scale_factor_x'):
-            image_x, image_y = self.widget_to_image_coords(widget_x, widget_y)
-            self.mouse_moved.emit(image_x, image_y)
+            self._pending_move = (widget_x, widget_y)
+            if not self._move_timer.isActive():
+                self._move_timer.start()
         
         # ЕМІТИМО DRAG ТІЛЬКИ ЯКЩО ПЕРЕТЯГУЄМО І НЕ В СПЕЦІАЛЬНИХ РЕЖИМАХ
         if (self.dragging and event.buttons() & Qt.LeftButton and 
@@ -299,9 +313,16 @@ class ClickableLabel(QLabel):
             self.is_click_on_image(widget_x, widget_y)):
             
             image_x, image_y = self.widget_to_image_coords(widget_x, widget_y)
-            print(f"Drag: widget({widget_x}, {widget_y}) -> image({image_x}, {image_y})")
+            log.debug("Drag: widget(%d, %d) -> image(%d, %d)", widget_x, widget_y, image_x, image_y)
             self.dragged.emit(image_x, image_y)
 
+    def _emit_pending_move(self):
+        """Емісія mouse_moved лише для останньої позиції за інтервал таймера"""
+        if self._pending_move is not None:
+            image_x, image_y = self.widget_to_image_coords(*self._pending_move)
+            self._pending_move = None
+            self.mouse_moved.emit(image_x, image_y)
+
     def mouseReleaseEvent(self, event):
         # ЗАВЕРШУЄМО ПЕРЕТЯГУВАННЯ
         if event.button() == Qt.LeftButton:
@@ -321,9 +342,117 @@ class ClickableLabel(QLabel):
 
 # Оновлення для widgets.py
 
+# Дисковий кеш зменшених мініатюр між відкриттями папок
+THUMBNAIL_CACHE_DIR = os.path.join(tempfile.gettempdir(), "phcontrol_thumbs")
+
+def thumbnail_cache_key(image_path, width, height, mtime=None):
+    """Ключ кешу мініатюри: шлях, час зміни файлу та розмір мініатюри"""
+    if mtime is None:
+        try:
+            mtime = os.path.getmtime(image_path)
+        except OSError:
+            mtime = 0
+    return hashlib.blake2b(f"{image_path}|{mtime}|{width}x{height}".encode('utf-8'),
+                           digest_size=16).hexdigest()
+
+def pil_thumbnail_image(image_path, width, height):
+    """Мініатюра через PIL для форматів, які не читає QImageReader"""
+    try:
+        with Image.open(image_path) as image:
+            # draft дозволяє libjpeg декодувати одразу в 1/2, 1/4 або 1/8 розміру
+            image.draft('RGB', (width * 2, height * 2))
+            image.thumbnail((width, height), Image.BILINEAR)
+            image = image.convert('RGB')
+            data = image.tobytes()
+            # copy(): QImage має володіти буфером після звільнення bytes
+            return QImage(data, image.width, image.height, image.width * 3,
+                          QImage.Format_RGB888).copy()
+    except Exception as e:
+        log.warning("⚠ Could not decode thumbnail %s: %s", image_path, e)
+        return QImage()
+
+
+class ThumbnailLoaderSignals(QObject):
+    """Сигнали фонового завантаження мініатюр (живуть у головному потоці)"""
+    loaded = pyqtSignal(str, str, QImage)
+
+
+class ThumbnailLoader(QRunnable):
+    """Декодування мініатюри у фоновому потоці одразу в потрібному розмірі"""
+    
+    def __init__(self, image_path, cache_key, width, height, signals):
+        super().__init__()
+        self.image_path = image_path
+        self.cache_key = cache_key
+        self.width = width
+        self.height = height
+        self.signals = signals
+    
+    def run(self):
+        cache_base = os.path.join(THUMBNAIL_CACHE_DIR, self.cache_key)
+        
+        # QImage можна безпечно створювати поза головним потоком (на відміну від QPixmap)
+        image = QImage()
+        for extension in (".jpg", ".png"):
+            if os.path.exists(cache_base + extension):
+                image = QImage(cache_base + extension)
+                break
+        
+        if image.isNull():
+            reader = QImageReader(self.image_path)
+            size = reader.size()
+            if size.isValid():
+                # Декодуємо одразу в розмір мініатюри замість повного розміру
+                reader.setScaledSize(size.scaled(self.width, self.height, Qt.KeepAspectRatio))
+            image = reader.read()
+            if image.isNull():
+                image = pil_thumbnail_image(self.image_path, self.width, self.height)
+            
+            if not image.isNull():
+                try:
+                    os.makedirs(THUMBNAIL_CACHE_DIR, exist_ok=True)
+                    # JPG не має альфа-каналу: прозорі мініатюри кешуються як PNG
+                    if image.hasAlphaChannel():
+                        image.save(cache_base + ".png", "PNG")
+                    else:
+                        image.save(cache_base + ".jpg", "JPG", 90)
+                except OSError as e:
+                    log.warning("⚠ Could not write thumbnail cache: %s", e)
+        
+        self.signals.loaded.emit(self.image_path, self.cache_key, image)
+
+
 class VerticalThumbnailWidget(QWidget):
     image_selected = pyqtSignal(str)
     
+    # Стилі всіх мініатюр (розбираються один раз); стан - властивість "state" мініатюри
+    THUMBNAIL_STYLE = """
+            QLabel#thumbnail {
+                border: 1px solid #dee2e6;
+                border-radius: 8px;
+                background-color: white;
+                padding: 2px;
+                margin: 2px;
+            }
+            QLabel#thumbnail:hover {
+                border: 2px solid #6c757d;
+                background-color: #f8f9fa;
+            }
+            QLabel#thumbnail[state="processed"] {
+                border: 3px solid #28a745;
+                background-color: #d4f6d4;
+            }
+            QLabel#thumbnail[state="processed"]:hover {
+                border: 3px solid #218838;
+                background-color: #c3e6cb;
+            }
+            QLabel#thumbnail[state="selected"],
+            QLabel#thumbnail[state="selected"]:hover {
+                border: 4px solid #007bff;
+                background-color: #e3f2fd;
+            }
+        """
+    
     def __init__(self, thumbnail_width=260, parent=None):
         super().__init__(parent)
         self.thumbnail_width = thumbnail_width
@@ -333,6 +462,9 @@ class VerticalThumbnailWidget(QWidget):
         self.processed_paths = set()
         self.selected_path = None  # НОВЕ: шлях до обраного зображення
         
+        # Мініатюри попередньої папки, готові до повторного використання
+        self._thumbnail_pool = []
+        
         # Основний layout
         self.layout = QVBoxLayout()
         self.layout.setContentsMargins(10, 5, 10, 5)
@@ -341,8 +473,14 @@ class VerticalThumbnailWidget(QWidget):
         
         # Встановлюємо розмір віджета
         self.setFixedWidth(thumbnail_width)
+        self.setStyleSheet(self.THUMBNAIL_STYLE)
+        
+        # Фонове декодування мініатюр
+        self.thread_pool = QThreadPool(self)
+        self.loader_signals = ThumbnailLoaderSignals(self)
+        self.loader_signals.loaded.connect(self.on_thumbnail_loaded)
         
-        print(f"📐 VerticalThumbnailWidget initialized: {thumbnail_width}x{self.thumbnail_height}")
+        log.debug("📐 VerticalThumbnailWidget initialized: %dx%d", thumbnail_width, self.thumbnail_height)
 
     def set_selected_image(self, image_path):
         """Встановити обране зображення"""
@@ -372,10 +510,10 @@ class VerticalThumbnailWidget(QWidget):
                         thumbnail.mark_as_unprocessed()
                     break
                     
-            print(f"❌ Marked as unprocessed: {os.path.basename(image_path)}")
+            log.debug("❌ Marked as unprocessed: %s", os.path.basename(image_path))
             
         except Exception as e:
-            print(f"❌ Error marking image as unprocessed: {e}")
+            log.error("❌ Error marking image as unprocessed: %s", e)
 
     def clear_all_processed_status(self):
         """Очистити статус обробки для всіх зображень"""
@@ -388,69 +526,105 @@ class VerticalThumbnailWidget(QWidget):
                 if hasattr(thumbnail, 'mark_as_unprocessed'):
                     thumbnail.mark_as_unprocessed()
                     
-            print("🗑️ Cleared processed status for all images")
+            log.debug("🗑️ Cleared processed status for all images")
             
         except Exception as e:
-            print(f"❌ Error clearing all processed status: {e}")
+            log.error("❌ Error clearing all processed status: %s", e)
 
-    def add_thumbnail(self, image_path):
+    def add_thumbnail(self, image_path, mtime=None):
         """Додавання мініатюри з оновленими розмірами"""
         try:
-            print(f"🔨 Creating thumbnail for: {os.path.basename(image_path)}")
+            log.debug("🔨 Creating thumbnail for: %s", os.path.basename(image_path))
             
             # Перевіряємо чи зображення оброблене
             is_processed = image_path in self.processed_paths
-            print(f"📋 Image processed status: {is_processed}")
+            log.debug("📋 Image processed status: %s", is_processed)
             
-            # Створюємо мініатюру
-            thumbnail_label = ClickableThumbnail(image_path, 
-                                               width=self.thumbnail_width-20,  # Відступ для бордерів
-                                               height=self.thumbnail_height-20,
-                                               is_processed=is_processed)
+            # Мініатюра з пулу або нова (зображення декодується у фоновому потоці)
+            thumbnail_width = self.thumbnail_width - 20  # Відступ для бордерів
+            thumbnail_height = self.thumbnail_height - 20
+            if self._thumbnail_pool:
+                thumbnail_label = self._thumbnail_pool.pop()
+                thumbnail_label.rebind(image_path, is_processed)
+            else:
+                thumbnail_label = ClickableThumbnail(image_path, 
+                                                   width=thumbnail_width,
+                                                   height=thumbnail_height,
+                                                   is_processed=is_processed,
+                                                   load_image=False)
+                # Підключаємо сигнал один раз: шлях береться з мініатюри під час кліку
+                thumbnail_label.clicked.connect(
+                    lambda label=thumbnail_label: self.image_selected.emit(label.image_path))
             
-            # Підключаємо сигнал
-            thumbnail_label.clicked.connect(lambda path=image_path: self.image_selected.emit(path))
+            # Спершу кеш у пам'яті, далі - фонове завантаження (з дисковим кешем)
+            cache_key = thumbnail_cache_key(image_path, thumbnail_width - 4, thumbnail_height - 4, mtime)
+            cached_pixmap = QPixmapCache.find(cache_key)
+            if cached_pixmap is not None and not cached_pixmap.isNull():
+                thumbnail_label.setPixmap(cached_pixmap)
+            else:
+                self.thread_pool.start(ThumbnailLoader(image_path, cache_key, thumbnail_width - 4,
+                                                       thumbnail_height - 4, self.loader_signals))
             
-            print("✓ Successfully created thumbnail image")
+            log.debug("✓ Successfully created thumbnail image")
             
             # Додаємо до layout та списків
             self.layout.addWidget(thumbnail_label)
+            thumbnail_label.show()
             self.thumbnails.append(thumbnail_label)
             self.image_paths.append(image_path)
             
             widget_count = len(self.thumbnails)
-            print(f"✅ Added to layout. Total widgets: {widget_count}")
+            log.debug("✅ Added to layout. Total widgets: %d", widget_count)
             
             # Оновлюємо висоту віджета
             new_height = widget_count * (self.thumbnail_height + 8) + 20
             self.setMinimumHeight(new_height)
-            print(f"📏 Updated widget height to: {new_height}px")
+            log.debug("📏 Updated widget height to: %dpx", new_height)
             
         except Exception as e:
-            print(f"❌ Error creating thumbnail: {e}")
+            log.error("❌ Error creating thumbnail: %s", e)
             import traceback
             traceback.print_exc()
 
+    def on_thumbnail_loaded(self, image_path, cache_key, image):
+        """Встановлення декодованої мініатюри (головний потік)"""
+        pixmap = None
+        if not image.isNull():
+            pixmap = QPixmap.fromImage(image)
+            QPixmapCache.insert(cache_key, pixmap)
+        
+        for i, path in enumerate(self.image_paths):
+            if path == image_path and i < len(self.thumbnails):
+                self.thumbnails[i].set_thumbnail_pixmap(pixmap)
+                break
+    
     def clear_thumbnails(self):
         """Очищення всіх мініатюр"""
         try:
-            print(f"Clearing {len(self.thumbnails)} existing thumbnails")
+            log.debug("Clearing %d existing thumbnails", len(self.thumbnails))
+            
+            # Скасовуємо ще не розпочаті завантаження попередньої папки
+            self.thread_pool.clear()
             
-            # Видаляємо всі віджети з layout
+            # Мініатюри повертаються в пул, решта віджетів видаляється
             while self.layout.count():
-                child = self.layout.takeAt(0)
-                if child.widget():
-                    child.widget().deleteLater()
+                widget = self.layout.takeAt(0).widget()
+                if isinstance(widget, ClickableThumbnail):
+                    widget.hide()
+                    widget.clear()
+                    self._thumbnail_pool.append(widget)
+                elif widget:
+                    widget.deleteLater()
             
             # Очищуємо списки
             self.thumbnails.clear()
             self.image_paths.clear()
             self.processed_paths.clear()
             
-            print("Thumbnails and references cleared")
+            log.debug("Thumbnails and references cleared")
             
         except Exception as e:
-            print(f"Error clearing thumbnails: {e}")
+            log.error("Error clearing thumbnails: %s", e)
 
     def mark_image_as_processed(self, image_path):
         """Позначити зображення як оброблене"""
@@ -466,25 +640,29 @@ class VerticalThumbnailWidget(QWidget):
                         thumbnail.mark_as_processed()
                     break
                     
-            print(f"✅ Marked as processed: {os.path.basename(image_path)}")
+            log.debug("✅ Marked as processed: %s", os.path.basename(image_path))
             
         except Exception as e:
-            print(f"❌ Error marking image as processed: {e}")
+            log.error("❌ Error marking image as processed: %s", e)
 
 class ClickableThumbnail(QLabel):
     clicked = pyqtSignal()
     
-    def __init__(self, image_path, width=240, height=180, is_processed=False, parent=None):
+    def __init__(self, image_path, width=240, height=180, is_processed=False, load_image=True, parent=None):
         super().__init__(parent)
         self.image_path = image_path
         self.is_processed = is_processed
         self.is_selected = False  # НОВЕ: чи обране зображення
+        self.setObjectName("thumbnail")
         
         # Встановлюємо розмір
         self.setFixedSize(width, height)
         
-        # Завантажуємо і масштабуємо зображення
-        self.load_and_scale_image(width, height)
+        # Завантажуємо і масштабуємо зображення (або чекаємо фонового завантаження)
+        if load_image:
+            self.load_and_scale_image(width, height)
+        else:
+            self.setText("...")
         
         # Встановлюємо стиль
         self.update_style()
@@ -493,6 +671,14 @@ class ClickableThumbnail(QLabel):
         self.setAlignment(Qt.AlignCenter)
         self.setCursor(Qt.PointingHandCursor)
     
+    def rebind(self, image_path, is_processed=False):
+        """Повторне використання мініатюри для іншого зображення"""
+        self.image_path = image_path
+        self.is_processed = is_processed
+        self.is_selected = False
+        self.setText("...")
+        self.update_style()
+    
     def set_selected(self, selected):
         """Встановити стан обраного зображення"""
         self.is_selected = selected
@@ -506,61 +692,42 @@ class ClickableThumbnail(QLabel):
     def load_and_scale_image(self, width, height):
         """Завантаження та масштабування зображення"""
         try:
-            pixmap = QPixmap(self.image_path)
-            if not pixmap.isNull():
-                # Масштабуємо зберігаючи пропорції
-                scaled_pixmap = pixmap.scaled(width-4, height-4, 
-                                            Qt.KeepAspectRatio, 
-                                            Qt.SmoothTransformation)
-                self.setPixmap(scaled_pixmap)
+            # Декодуємо одразу зі зменшенням (без повнорозмірного QPixmap)
+            reader = QImageReader(self.image_path)
+            size = reader.size()
+            if size.isValid():
+                reader.setScaledSize(size.scaled(width-4, height-4, Qt.KeepAspectRatio))
+            image = reader.read()
+            if image.isNull():
+                image = pil_thumbnail_image(self.image_path, width-4, height-4)
+            if not image.isNull():
+                self.setPixmap(QPixmap.fromImage(image))
             else:
                 self.setText(f"Error loading\n{os.path.basename(self.image_path)}")
         except Exception as e:
             self.setText(f"Error\n{os.path.basename(self.image_path)}")
     
+    def set_thumbnail_pixmap(self, pixmap):
+        """Встановлення мініатюри, завантаженої у фоновому потоці"""
+        if pixmap is None:
+            self.setText(f"Error loading\n{os.path.basename(self.image_path)}")
+        else:
+            self.setPixmap(pixmap)
+    
     def update_style(self):
         """Оновлення стилю з урахуванням всіх станів"""
+        # Правила - у THUMBNAIL_STYLE батьківського віджета; тут лише перемикається стан
         if self.is_selected:
-            # Обране зображення - синя товста рамка
-            self.setStyleSheet("""
-                QLabel {
-                    border: 4px solid #007bff;
-                    border-radius: 8px;
-                    background-color: #e3f2fd;
-                    padding: 2px;
-                    margin: 2px;
-                }
-            """)
+            state = "selected"
         elif self.is_processed:
-            # Оброблене зображення - зелена рамка
-            self.setStyleSheet("""
-                QLabel {
-                    border: 3px solid #28a745;
-                    border-radius: 8px;
-                    background-color: #d4f6d4;
-                    padding: 2px;
-                    margin: 2px;
-                }
-                QLabel:hover {
-                    border: 3px solid #218838;
-                    background-color: #c3e6cb;
-                }
-            """)
+            state = "processed"
         else:
-            # Звичайне зображення
-            self.setStyleSheet("""
-                QLabel {
-                    border: 1px solid #dee2e6;
-                    border-radius: 8px;
-                    background-color: white;
-                    padding: 2px;
-                    margin: 2px;
-                }
-                QLabel:hover {
-                    border: 2px solid #6c757d;
-                    background-color: #f8f9fa;
-                }
-            """)
+            state = "normal"
+        
+        if self.property("state") != state:
+            self.setProperty("state", state)
+            self.style().unpolish(self)
+            self.style().polish(self)
     
     def mark_as_processed(self):
         """Позначити зображення як оброблене"""